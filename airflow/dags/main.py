@@ -85,7 +85,7 @@ ES_PORT = 9200
 
 
 def extract_from_postgresql(**context):
-    """PostgreSQL에서 사용자 데이터를 추출하여 CSV 파일로 저장"""
+    """PostgreSQL에서 사용자 데이터를 추출하여 Parquet 파일로 저장"""
     global USE_REPOSITORY_PATTERN  # 전역 변수로 선언
 
     try:
@@ -144,10 +144,10 @@ def extract_from_postgresql(**context):
 
             conn.close()
 
-        # CSV 저장
-        output_path = "/tmp/postgresql_users.csv"
-        df.to_csv(output_path, index=False)
-        context["ti"].xcom_push(key="csv_path", value=output_path)
+        # Parquet 저장 (다음 태스크가 타입 추론 없이 바로 읽을 수 있도록)
+        output_path = "/tmp/postgresql_users.parquet"
+        df.to_parquet(output_path, index=False)
+        context["ti"].xcom_push(key="data_path", value=output_path)
 
         logger.info(f"PostgreSQL에서 {len(df)}개의 데이터 추출 완료")
         return True
@@ -187,9 +187,9 @@ def extract_from_postgresql(**context):
                 },
             ]
             df = pd.DataFrame(test_data)
-            output_path = "/tmp/postgresql_users.csv"
-            df.to_csv(output_path, index=False)
-            context["ti"].xcom_push(key="csv_path", value=output_path)
+            output_path = "/tmp/postgresql_users.parquet"
+            df.to_parquet(output_path, index=False)
+            context["ti"].xcom_push(key="data_path", value=output_path)
             logger.info("테스트 데이터 생성 완료")
             return True
         except Exception as test_error:
@@ -198,21 +198,21 @@ def extract_from_postgresql(**context):
 
 
 def load_to_elasticsearch(**context):
-    """CSV 파일 데이터를 Elasticsearch에 적재"""
+    """Parquet 파일 데이터를 Elasticsearch에 적재"""
     global USE_REPOSITORY_PATTERN  # 전역 변수로 선언
 
     try:
-        # CSV 파일 경로 가져오기
+        # Parquet 파일 경로 가져오기
         ti = context["ti"]
-        csv_path = ti.xcom_pull(task_ids="extract_postgresql_data", key="csv_path")
+        data_path = ti.xcom_pull(task_ids="extract_postgresql_data", key="data_path")
 
-        if not csv_path:
+        if not data_path:
             raise AirflowException(
-                "이전 태스크에서 CSV 파일 경로를 가져올 수 없습니다."
+                "이전 태스크에서 데이터 파일 경로를 가져올 수 없습니다."
             )
 
-        # CSV 파일 읽기
-        df = pd.read_csv(csv_path)
+        # Parquet 파일 읽기 (저장된 컬럼 타입 그대로 사용)
+        df = pd.read_parquet(data_path)
 
         if df.empty:
             logger.warning("적재할 사용자 데이터가 없습니다")
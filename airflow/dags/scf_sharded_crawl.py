@@ -0,0 +1,104 @@
+import os
+import sys
+import datetime as dt
+import logging
+from typing import Dict, List
+
+from airflow import DAG
+from airflow.operators.python import PythonOperator
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# app 디렉토리(/opt/airflow/app)를 Python 경로에 추가
+app_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"
+)
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.services.data_extraction import (  # noqa: E402
+    PageShard,
+    collect_shard,
+    discover_total_pages,
+    merge_shard_counts,
+    prepare_index,
+)
+
+# 샤드 수 (동시에 실행되는 태스크 수는 Celery 워커 설정을 따른다)
+SHARD_COUNT = 16
+# 샤드당 작업자 수
+MAX_WORKERS = 5
+
+default_args = {
+    "owner": "Se Hyeon Kim",
+    "start_date": dt.datetime(2025, 3, 1),
+    "retries": 3,
+    "retry_delay": dt.timedelta(minutes=5),
+    "email_on_failure": True,
+    "email_on_retry": False,
+}
+
+
+def plan_shards(shard_count: int) -> List[Dict[str, int]]:
+    """전체 페이지 수를 확인하고 샤드별 페이지 범위를 만든다.
+
+    샤드 태스크들이 동시에 인덱스를 만들지 않도록 여기서 한 번 만든다.
+    """
+    prepare_index()
+    total_pages = discover_total_pages()
+    shards = PageShard.split(total_pages, shard_count)
+    logger.info(f"전체 {total_pages} 페이지를 {len(shards)}개 샤드로 나눕니다.")
+    return [{"first": shard.first, "last": shard.last} for shard in shards]
+
+
+def crawl_shard(first: int, last: int, **context) -> int:
+    """샤드 하나를 수집한다.
+
+    실패한 페이지가 남으면 예외로 태스크를 실패시키고, 같은 DAG 실행에서 재시도되면
+    매니페스트에서 완료된 페이지를 건너뛴다. 다음 DAG 실행은 처음부터 다시 수집한다.
+    """
+    return collect_shard(
+        PageShard(first, last),
+        run_id=context["run_id"],
+        attempt=context["ti"].try_number,
+        max_workers=MAX_WORKERS,
+    )
+
+
+def merge_counts(**context) -> int:
+    """샤드별 저장 수를 합친다."""
+    counts = context["ti"].xcom_pull(task_ids="crawl_shard")
+    total = merge_shard_counts(counts)
+    logger.info(f"샤드 수집 완료. 총 {total} 이슈 처리됨")
+    return total
+
+
+with DAG(
+    dag_id="seeclickfix_sharded_crawl",
+    default_args=default_args,
+    description="SeeClickFix 전체 아카이브를 페이지 범위로 나눠 병렬 수집",
+    schedule_interval=None,
+    catchup=False,
+    tags=["seeclickfix", "elasticsearch", "extraction"],
+) as dag:
+
+    plan_task = PythonOperator(
+        task_id="plan_shards",
+        python_callable=plan_shards,
+        op_kwargs={"shard_count": SHARD_COUNT},
+    )
+
+    # plan_shards가 반환한 범위마다 태스크 하나씩 (dynamic task mapping)
+    crawl_tasks = PythonOperator.partial(
+        task_id="crawl_shard",
+        python_callable=crawl_shard,
+    ).expand(op_kwargs=plan_task.output)
+
+    merge_task = PythonOperator(
+        task_id="merge_shard_counts",
+        python_callable=merge_counts,
+    )
+
+    # 태스크 의존성 설정
+    plan_task >> crawl_tasks >> merge_task
@@ -1,13 +1,49 @@
+import csv
+import io
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_batch
 from elasticsearch import Elasticsearch
-from src.utils.connection import PostgresConnector, ElasticsearchConnector
+from src.utils.connection import (
+    PostgresConnector,
+    PooledPostgresConnector,
+    ElasticsearchConnector,
+)
+from src.utils.dataset_io import iter_dataset
 
 logger = logging.getLogger(__name__)
 
+# users 테이블에 저장하는 컬럼 (id는 SERIAL)
+USER_COLUMNS = ("name", "street", "city", "zip", "lng", "lat")
+# COPY 한 번에 보내는 행 수
+COPY_CHUNK_ROWS = 50_000
+# iter_all이 한 번에 가져오는 행 수
+ITER_BATCH_ROWS = 10_000
+ITER_OUTPUTS = ("tuples", "pandas")
+
+CopySource = Union[pd.DataFrame, Iterable[Dict[str, Any]], str, Path]
+
+
+@dataclass
+class CopyResult:
+    """COPY 저장 결과"""
+
+    rows: int = 0
+    # 새로 받은 id 구간 [(처음, 끝), ...] (return_ids=True일 때만)
+    id_ranges: List[Tuple[int, int]] = field(default_factory=list)
+
+    def add_ids(self, first: int, last: int) -> None:
+        """id 구간을 추가한다. 앞 구간에 바로 이어지면 합친다."""
+        if self.id_ranges and self.id_ranges[-1][1] + 1 == first:
+            self.id_ranges[-1] = (self.id_ranges[-1][0], last)
+        else:
+            self.id_ranges.append((first, last))
+
 
 class Repository(ABC):
     """데이터 저장소 추상 기본 클래스"""
@@ -45,9 +81,10 @@ class PostgreSQLRepository(Repository):
         """초기화
 
         Args:
-            connector: 데이터베이스 연결 객체. None일 경우 기본값 사용
+            connector: 데이터베이스 연결 객체. None일 경우 연결 풀
+                (PooledPostgresConnector) 사용
         """
-        self.connector = connector or PostgresConnector()
+        self.connector = connector or PooledPostgresConnector()
         self.logger = logging.getLogger(__name__)
 
     def save(self, data: Dict[str, Any]) -> int:
@@ -105,8 +142,67 @@ class PostgreSQLRepository(Repository):
             results = cur.fetchall()
             return [dict(row) for row in results]
 
+    def iter_all(
+        self,
+        batch_size: int = ITER_BATCH_ROWS,
+        after_id: Optional[int] = None,
+        output: str = "tuples",
+    ) -> Iterator[Union[List[Tuple[Any, ...]], pd.DataFrame]]:
+        """모든 사용자 데이터를 id 순서로 batch_size개씩 읽는다.
+
+        서버 측(named) 커서에서 fetchmany로 가져오므로 테이블 크기와 관계없이
+        메모리에는 배치 하나만 올라간다. 각 배치의 마지막 id를 ``after_id``로
+        넘기면 그 다음부터 다시 읽는다 (keyset 페이지네이션, 중단 후 재개용).
+        반복하는 동안 연결과 트랜잭션 하나를 계속 사용한다.
+
+        Args:
+            batch_size: 한 번에 가져올 행 수
+            after_id: 이 id보다 큰 사용자만 읽는다. None이면 처음부터
+            output: "tuples" (``(id, name, street, city, zip, lng, lat)`` 목록)
+                또는 "pandas" (DataFrame)
+
+        Yields:
+            사용자 배치
+
+        Raises:
+            ValueError: batch_size가 1보다 작거나 지원하지 않는 출력 형식인 경우
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+        if output not in ITER_OUTPUTS:
+            raise ValueError(
+                f"지원하지 않는 출력 형식입니다: {output} ({ITER_OUTPUTS})"
+            )
+
+        columns = ("id",) + USER_COLUMNS
+        query = f"SELECT {', '.join(columns)} FROM users"
+        params: Tuple[Any, ...] = ()
+        if after_id is not None:
+            query += " WHERE id > %s"
+            params = (after_id,)
+        query += " ORDER BY id"
+
+        with self.connector.connect() as cur:
+            # DictCursor 대신 튜플을 돌려주는 기본 커서 (행마다 dict를 만들지 않음)
+            named = cur.connection.cursor(
+                name="iter_users", cursor_factory=psycopg2.extensions.cursor
+            )
+            named.itersize = batch_size
+            try:
+                named.execute(query, params)
+                while True:
+                    rows = named.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    if output == "pandas":
+                        yield pd.DataFrame.from_records(rows, columns=columns)
+                    else:
+                        yield rows
+            finally:
+                named.close()
+
     def bulk_save(self, data_list: List[Dict[str, Any]]) -> int:
-        """사용자 데이터 대량 저장
+        """사용자 데이터 대량 저장 (COPY 사용)
 
         Args:
             data_list: 저장할 사용자 데이터 딕셔너리 목록
@@ -114,16 +210,95 @@ class PostgreSQLRepository(Repository):
         Returns:
             저장된 데이터 개수
         """
-        query = """
-            INSERT INTO users (name, street, city, zip, lng, lat) 
-            VALUES (%(name)s, %(street)s, %(city)s, %(zip)s, %(lng)s, %(lat)s)
-            RETURNING id
+        return self.copy_save(data_list).rows
+
+    def copy_save(
+        self,
+        source: CopySource,
+        chunk_size: int = COPY_CHUNK_ROWS,
+        return_ids: bool = False,
+    ) -> CopyResult:
+        """``COPY users FROM STDIN``으로 사용자 데이터를 대량 저장
+
+        DataFrame, 딕셔너리 이터레이터, 데이터셋 파일(CSV/압축 CSV/Parquet)을
+        ``chunk_size`` 행씩 메모리 버퍼에 CSV로 써서 보낸다. DataFrame과 파일은
+        pandas가 청크 단위로 CSV를 만들어 행마다 파이썬 코드를 돌지 않는다.
+        전체가 한 트랜잭션이라 중간에 실패하면 아무것도 저장되지 않는다.
+
+        ``return_ids``면 청크마다 users 시퀀스의 currval로 새 id 구간을 구한다.
+        구간이 끊기지 않도록 저장하는 동안 다른 쓰기를 막는다 (읽기는 가능).
+
+        Args:
+            source: 저장할 데이터 (USER_COLUMNS 컬럼/키 포함)
+            chunk_size: COPY 한 번에 보낼 행 수. Defaults to COPY_CHUNK_ROWS.
+            return_ids: 새 id 구간을 함께 반환할지 여부. Defaults to False.
+
+        Returns:
+            CopyResult: 저장된 행 수와 id 구간
+
+        Raises:
+            ValueError: chunk_size가 1보다 작거나 필요한 컬럼이 없는 경우
         """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+
+        columns = ", ".join(USER_COLUMNS)
+        copy_sql = f"COPY users ({columns}) FROM STDIN WITH (FORMAT csv)"
+        result = CopyResult()
 
         with self.connector.connect() as cur:
-            execute_batch(cur, query, data_list, page_size=1000)
-            self.logger.info(f"Bulk inserted {len(data_list)} users")
-            return len(data_list)
+            if return_ids:
+                cur.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+            for buffer, rows in self._copy_chunks(source, chunk_size):
+                cur.copy_expert(copy_sql, buffer)
+                result.rows += rows
+                if return_ids:
+                    cur.execute("SELECT currval(pg_get_serial_sequence('users', 'id'))")
+                    last = cur.fetchone()[0]
+                    result.add_ids(last - rows + 1, last)
+
+        self.logger.info(f"COPY로 {result.rows}명의 사용자 저장 완료")
+        return result
+
+    def _copy_chunks(
+        self, source: CopySource, chunk_size: int
+    ) -> Iterator[Tuple[io.StringIO, int]]:
+        """저장할 데이터를 (CSV 버퍼, 행 수) 청크로 나눈다."""
+        if isinstance(source, pd.DataFrame):
+            frames = (
+                source.iloc[start : start + chunk_size]
+                for start in range(0, len(source), chunk_size)
+            )
+        elif isinstance(source, (str, Path)):
+            frames = iter_dataset(source, batch_size=chunk_size)
+        else:
+            frames = None
+
+        if frames is not None:
+            for frame in frames:
+                missing = [c for c in USER_COLUMNS if c not in frame.columns]
+                if missing:
+                    raise ValueError(f"필요한 컬럼이 없습니다: {missing}")
+                if len(frame):
+                    buffer = io.StringIO()
+                    frame.to_csv(
+                        buffer, columns=USER_COLUMNS, header=False, index=False
+                    )
+                    buffer.seek(0)
+                    yield buffer, len(frame)
+            return
+
+        records = iter(source)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(
+                [record.get(column) for column in USER_COLUMNS] for record in chunk
+            )
+            buffer.seek(0)
+            yield buffer, len(chunk)
 
     def check_connection(self) -> bool:
         """데이터베이스 연결 상태 확인
@@ -1,6 +1,8 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 import logging
 from src.database.repository import ElasticsearchRepository, ElasticsearchConnector
+from src.models.issue_schema import ISSUE_FIELDS, es_mapping, grid_field
+from src.utils.fingerprint_store import FingerprintStore
 
 logger = logging.getLogger(__name__)
 
@@ -9,15 +11,23 @@ class SeeClickFixRepository(ElasticsearchRepository):
     """SeeClickFix 데이터를 위한 Elasticsearch 저장소"""
 
     def __init__(
-        self, connector: Optional[ElasticsearchConnector] = None, index: str = "scf"
+        self,
+        connector: Optional[ElasticsearchConnector] = None,
+        index: str = "scf",
+        fingerprints: Optional[FingerprintStore] = None,
     ):
         """초기화
 
         Args:
             connector (Optional[ElasticsearchConnector], optional): Elasticsearch 연결 객체. Defaults to None.
             index (str, optional): 사용할 index 이름. Defaults to 'scf'.
+            fingerprints (Optional[FingerprintStore], optional): 이슈별 내용 지문 저장소.
+                있으면 지문이 바뀌지 않은 이슈는 다시 보내지 않는다. Defaults to None.
         """
         super().__init__(connector, index)
+        self.fingerprints = fingerprints
+        # 변경 없어 건너뛴 이슈 수 (누적)
+        self.skipped = 0
 
     def setup_index_mapping(self) -> bool:
         """index mapping에 필요한 설정
@@ -34,37 +44,57 @@ class SeeClickFixRepository(ElasticsearchRepository):
         if not client.indices.exists(index=self.index):
             self.logger.info("SCF index가 존재하지 않아. 새롭게 만들겠습니다.")
 
-            mapping = {
-                "mappings": {
-                    "properties": {
-                        "id": {"type": "keyword"},
-                        "summary": {"type": "text"},
-                        "description": {"type": "text"},
-                        "status": {"type": "keyword"},
-                        "lat": {"type": "float"},
-                        "lng": {"type": "float"},
-                        "coords": {"type": "geo_point"},
-                        "address": {"type": "text"},
-                        "rating": {"type": "integer"},
-                        "comment_count": {"type": "integer"},
-                        "view_count": {"type": "integer"},
-                        "reporter": {"type": "keyword"},
-                        "created_at": {"type": "date"},
-                        "opendate": {"type": "date"},
-                    }
-                }
-            }
+            # transform_issue와 같은 스키마(ISSUE_FIELDS)로 만든 매핑
+            mapping = es_mapping(ISSUE_FIELDS)
 
             try:
                 client.indices.create(index=self.index, body=mapping)
                 self.logger.info(f"인덱스 {self.index} 생성 및 매핑 설정 완료")
+                # 새 인덱스는 비어 있으므로 이전 인덱스의 지문으로 건너뛰면 안 된다
+                if self.fingerprints is not None:
+                    self.fingerprints.clear()
                 return True
             except Exception as e:
+                # 다른 프로세스(샤드)가 먼저 만든 경우는 성공으로 본다
+                if getattr(e, "error", None) == "resource_already_exists_exception":
+                    self.logger.info(f"인덱스 {self.index}가 이미 만들어졌습니다.")
+                    return True
                 self.logger.error(f"인덱스 생성 실패: {e}")
                 return False
 
+        # 이미 있는 인덱스에는 새로 추가된 필드(geohash_N, fingerprint 등)의 매핑을 더한다
+        try:
+            client.indices.put_mapping(
+                index=self.index,
+                properties=es_mapping(ISSUE_FIELDS)["mappings"]["properties"],
+            )
+        except Exception as e:
+            # 기존 필드의 타입이 바뀐 경우는 delete_index 후 다시 색인해야 한다
+            self.logger.error(f"인덱스 매핑 갱신 실패: {e}")
+            return False
         return True
 
+    def delete_index(self) -> bool:
+        """인덱스 삭제 (매핑을 바꿔 다시 색인할 때 사용)
+
+        Returns:
+            bool: 성공 여부 (인덱스가 없어도 True)
+        """
+        client = self.connector.get_client()
+        if not client:
+            return False
+
+        try:
+            client.indices.delete(index=self.index, ignore_unavailable=True)
+            self.logger.info(f"인덱스 {self.index} 삭제 완료")
+            # 지운 인덱스의 지문이 남아 있으면 다시 색인할 때 모두 건너뛴다
+            if self.fingerprints is not None:
+                self.fingerprints.clear()
+            return True
+        except Exception as e:
+            self.logger.error(f"인덱스 삭제 실패: {e}")
+            return False
+
     def save_issue(self, issue: Dict[str, Any]) -> str:
         """개별 SeeClickFix 이슈 저장
 
@@ -96,54 +126,131 @@ class SeeClickFixRepository(ElasticsearchRepository):
     ) -> int:
         """SeeClickFix 이슈 대량 저장
 
+        지문 저장소가 있으면 새 이슈와 내용이 바뀐 이슈만 보내고, 저장에 성공한
+        이슈의 지문을 기록한다. 변경 없어 건너뛴 이슈는 이미 저장된 것으로 센다.
+
         Args:
             issues (List[Dict[str, Any]]): 저장할 이슈 데이터 딕션너리 목록
             chunk_size (int, optional): 자르는 기준이 되는 사이즈 Defaults to 1000.
 
         Returns:
-            int: 성공적으로 저장된 Issue 수
+            int: 성공적으로 저장된 Issue 수 (건너뛴 이슈 포함)
         """
         if not issues:
             return 0
 
+        issues, skipped = self._skip_unchanged(issues)
+        if not issues:
+            return skipped
+
         # 작은 청크로 분할하지 않고 한 번에 더 많은 문서 처리
         client = self.connector.get_client()
         if not client:
             return 0
 
-        operations = []
-        for issue in issues:
-            issue_id = str(issue.get("id", ""))
-            if not issue_id:
-                continue
-
-            operations.append({"index": {"_index": self.index, "_id": issue_id}})
-            operations.append(issue)
-
+        operations = self._bulk_operations(issues)
         if not operations:
             return 0
 
         # 벌크 크기 최적화
         total_saved = 0
+        failed_ids = set()
         for i in range(0, len(operations), chunk_size * 2):
             chunk = operations[i : i + chunk_size * 2]
             response = client.bulk(
                 operations=chunk, refresh=False
             )  # refresh=False로 속도 향상
-
-            if response.get("errors", False):
-                failed = sum(
-                    1 for item in response["items"] if item["index"].get("error")
-                )
-                chunk_docs = len(chunk) // 2
-                self.logger.warning(f"{failed}개 이슈 저장 실패 (총 {chunk_docs}개 중)")
-                total_saved += chunk_docs - failed
-            else:
-                total_saved += len(chunk) // 2
+            total_saved += self._count_saved(response, len(chunk) // 2)
+            failed_ids.update(self._failed_ids(response))
 
         # 모든 처리가 끝난 후 한 번만 refresh
         client.indices.refresh(index=self.index)
-        return total_saved
+        self._record_fingerprints(issues, failed_ids)
+        return total_saved + skipped
+
+    async def async_bulk_save_issues(
+        self, client, issues: List[Dict[str, Any]], chunk_size: int = 1000
+    ) -> int:
+        """SeeClickFix 이슈 대량 저장 (asyncio)
+
+        refresh는 하지 않으므로 수집이 끝난 뒤 호출한 쪽에서 한 번만 refresh한다.
+
+        Args:
+            client: ``connector.create_async_client()``로 만든 AsyncElasticsearch
+            issues (List[Dict[str, Any]]): 저장할 이슈 데이터 딕션너리 목록
+            chunk_size (int, optional): 자르는 기준이 되는 사이즈 Defaults to 1000.
+
+        Returns:
+            int: 성공적으로 저장된 Issue 수 (건너뛴 이슈 포함)
+        """
+        issues, skipped = self._skip_unchanged(issues)
+        operations = self._bulk_operations(issues)
+        total_saved = 0
+        failed_ids = set()
+        for i in range(0, len(operations), chunk_size * 2):
+            chunk = operations[i : i + chunk_size * 2]
+            response = await client.bulk(operations=chunk, refresh=False)
+            total_saved += self._count_saved(response, len(chunk) // 2)
+            failed_ids.update(self._failed_ids(response))
+        self._record_fingerprints(issues, failed_ids)
+        return total_saved + skipped
+
+    def _skip_unchanged(
+        self, issues: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """지문이 저장된 것과 같은 이슈를 빼고 (보낼 이슈, 건너뛴 수)를 반환"""
+        if self.fingerprints is None or not issues:
+            return issues, 0
+        changed = self.fingerprints.changed(issues)
+        skipped = len(issues) - len(changed)
+        if skipped:
+            self.skipped += skipped
+            self.logger.info(
+                f"변경 없는 이슈 {skipped}개 건너뜀 (총 {len(issues)}개 중)"
+            )
+        return changed, skipped
+
+    def _record_fingerprints(
+        self, issues: List[Dict[str, Any]], failed_ids: Set[str]
+    ) -> None:
+        """저장에 성공한 이슈의 지문을 기록"""
+        if self.fingerprints is None:
+            return
+        self.fingerprints.record(
+            issue for issue in issues if str(issue.get("id")) not in failed_ids
+        )
+
+    def _failed_ids(self, response: Dict[str, Any]) -> Set[str]:
+        """bulk 응답에서 저장에 실패한 문서 id"""
+        if not response.get("errors", False):
+            return set()
+        return {
+            str(item["index"].get("_id"))
+            for item in response["items"]
+            if item["index"].get("error")
+        }
+
+    def _bulk_operations(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """이슈 목록을 bulk API의 (action, document) 목록으로 변환"""
+        operations = []
+        for issue in issues:
+            # transform_issue는 id가 없으면 None을 넣는다
+            issue_id = issue.get("id")
+            issue_id = "" if issue_id is None else str(issue_id)
+            if not issue_id:
+                continue
+
+            operations.append({"index": {"_index": self.index, "_id": issue_id}})
+            operations.append(issue)
+        return operations
+
+    def _count_saved(self, response: Dict[str, Any], chunk_docs: int) -> int:
+        """bulk 응답에서 성공한 문서 수를 계산"""
+        if response.get("errors", False):
+            failed = sum(1 for item in response["items"] if item["index"].get("error"))
+            self.logger.warning(f"{failed}개 이슈 저장 실패 (총 {chunk_docs}개 중)")
+            return chunk_docs - failed
+        return chunk_docs
 
     def count_issues(self) -> int:
         """저장된 이슈 개수 반환
@@ -161,3 +268,67 @@ class SeeClickFixRepository(ElasticsearchRepository):
         except Exception as e:
             self.logger.error(f"이슈 수 조회 실패: {e}")
             return 0
+
+    def count_by_grid(
+        self,
+        precision: int,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        query: Optional[Dict[str, Any]] = None,
+        size: int = 10_000,
+    ) -> Dict[str, int]:
+        """geohash 격자별 이슈 수 (히트맵용)
+
+        색인할 때 미리 계산한 ``geohash_{precision}`` keyword 필드에 terms 집계를
+        하므로 요청마다 좌표로 격자를 계산하지 않는다. 지도 확대 수준에 맞는
+        precision을 고른다.
+
+        Args:
+            precision (int): geohash 길이 (GEOHASH_PRECISIONS 중 하나)
+            bounds (Optional[Tuple[float, float, float, float]], optional):
+                지도 영역 (top, left, bottom, right). Defaults to None (전체).
+            query (Optional[Dict[str, Any]], optional): 추가 필터 쿼리. Defaults to None.
+            size (int, optional): 돌려받을 최대 격자 수. Defaults to 10_000.
+
+        Returns:
+            Dict[str, int]: 격자 키별 이슈 수 (조회 실패 시 빈 딕셔너리)
+
+        Raises:
+            ValueError: 지원하지 않는 precision인 경우
+        """
+        field = grid_field(precision)
+        client = self.connector.get_client()
+        if not client:
+            return {}
+
+        filters = []
+        if bounds is not None:
+            top, left, bottom, right = bounds
+            filters.append(
+                {
+                    "geo_bounding_box": {
+                        "coords": {
+                            "top_left": {"lat": top, "lon": left},
+                            "bottom_right": {"lat": bottom, "lon": right},
+                        }
+                    }
+                }
+            )
+        if query is not None:
+            filters.append(query)
+
+        body: Dict[str, Any] = {
+            "size": 0,
+            "aggs": {"grid": {"terms": {"field": field, "size": size}}},
+        }
+        if filters:
+            body["query"] = {"bool": {"filter": filters}}
+
+        try:
+            response = client.search(index=self.index, body=body)
+        except Exception as e:
+            self.logger.error(f"격자별 이슈 수 조회 실패: {e}")
+            return {}
+        return {
+            bucket["key"]: bucket["doc_count"]
+            for bucket in response["aggregations"]["grid"]["buckets"]
+        }
@@ -1,5 +1,10 @@
+from dataclasses import replace
 from pathlib import Path
-from src.services.data_generation import DataGenerator, DatasetConfig
+from src.services.data_generation import (
+    DataGenerator,
+    DatasetConfig,
+    read_checkpoint,
+)
 from src.services.data_extraction import collect_all_issues
 from src.database.repository import (
     RepositoryFactory,
@@ -9,9 +14,10 @@ from src.database.repository import (
 from src.database.scf_repository import SeeClickFixRepository
 import logging
 import sys
-import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from src.services.data_streaming import KafkaProducer, KafkaConsumer
+from src.services.data_sinks import DataSink
+from src.utils.dataset_io import read_dataset
 
 
 def setup_logging() -> None:
@@ -50,28 +56,52 @@ def check_db_connections() -> Dict[str, bool]:
     return connection_status
 
 
-def ensure_data_exists(record_count: int = 1000) -> Path:
+def ensure_data_exists(
+    record_count: int = 1000,
+    output_format: str = "csv",
+    compression: Optional[str] = None,
+) -> Path:
     """프로그램 시작 시 생성한 데이터 존재하는지 체크
 
+    중단된 CSV 데이터셋은 체크포인트부터 이어서 생성하고, record_count보다
+    작은 데이터셋은 기존 행을 유지한 채 뒤에 추가한다.
+
     Args:
         record_count (int, optional): 존재하지 않을 시 생성할 데이터셋의 Row 수 Defaults to 1000.
+        output_format (str, optional): 데이터셋 포맷 ("csv" | "parquet"). Defaults to "csv".
+        compression (Optional[str], optional): 압축 방식. Defaults to None.
 
     Returns:
-        Path: CSV 데이터 경로
+        Path: 데이터셋 경로
     """
     output_path = Path("./data/raw")
-    data_file = output_path / "test_data.csv"
-
-    if not data_file.exists():
+    config = DatasetConfig(
+        record_count=record_count,
+        output_format=output_format,
+        compression=compression,
+    )
+    data_file = output_path / config.filename
+    checkpoint = read_checkpoint(data_file) if output_format == "csv" else None
+
+    if (
+        data_file.exists()
+        and checkpoint is not None
+        and (not checkpoint["complete"] or checkpoint["rows_written"] < record_count)
+    ):
+        logging.info(
+            f"데이터셋을 이어서 생성합니다: {checkpoint['rows_written']} -> {record_count}"
+        )
+        DataGenerator(replace(config, resume=True)).create_sample_dataset()
+    elif not data_file.exists():
         logging.info(f"{output_path}에 데이터셋이 존재하지 않습니다...")
         try:
             output_path.mkdir(parents=True, exist_ok=True)
-            generator = DataGenerator(DatasetConfig(record_count=record_count))
+            generator = DataGenerator(config)
             generator.create_sample_dataset()
 
-            logging.info(f"CSV 데이터셋이 생성되었습니다: {data_file}")
+            logging.info(f"데이터셋이 생성되었습니다: {data_file}")
         except Exception as e:
-            logging.error(f"CSV 데이터셋을 생성도중 에러가 발생했습니다: {e}")
+            logging.error(f"데이터셋을 생성도중 에러가 발생했습니다: {e}")
             raise
     else:
         logging.info(f"데이터셋이 이미 존재합니다: {data_file}")
@@ -79,23 +109,43 @@ def ensure_data_exists(record_count: int = 1000) -> Path:
     return data_file
 
 
-def save_data_to_postgresql(csv_path: Path) -> int:
-    """PostgreSQL에 CSV 데이터 저장
+def generate_to_sinks(
+    sinks: List[DataSink], record_count: int = 1000, batch_size: int = 10_000
+) -> int:
+    """데이터셋 파일을 만들지 않고 생성한 레코드를 바로 Sink로 전송
 
     Args:
-        csv_path (Path): CSV 파일 경로
+        sinks (List[DataSink]): 레코드를 받을 Sink 목록 (Kafka, Repository, File)
+        record_count (int, optional): 생성할 레코드 수. Defaults to 1000.
+        batch_size (int, optional): 메모리에 유지할 배치 크기. Defaults to 10_000.
 
     Returns:
-        int: 저장된 레코드 수
+        int: 생성된 레코드 수
     """
+    config = DatasetConfig(record_count=record_count, batch_size=batch_size)
     try:
-        df = pd.read_csv(csv_path)
-        logging.info(f"PostgreSQL: {len(df)}개 레코드를 {csv_path}에서 읽었습니다")
-        records = df.to_dict(orient="records")
+        generated = DataGenerator(config).stream_to_sinks(sinks)
+        logging.info(f"{generated}개 레코드를 {len(sinks)}개 Sink로 전송 완료")
+        return generated
+    except Exception as e:
+        logging.error(f"Sink 전송 중 오류: {e}")
+        raise
 
+
+def save_data_to_postgresql(data_path: Path) -> int:
+    """PostgreSQL에 데이터셋(CSV/Parquet) 저장
+
+    Args:
+        data_path (Path): 데이터셋 파일 경로
+
+    Returns:
+        int: 저장된 레코드 수
+    """
+    try:
+        # 파일을 청크 단위로 읽어 COPY로 바로 보낸다 (전체를 메모리에 올리지 않음)
         pg_repo = RepositoryFactory.create("postgresql")
-        saved_count = pg_repo.bulk_save(records)
-        logging.info(f"PostgreSQL에 {saved_count}개 레코드 저장 완료")
+        saved_count = pg_repo.copy_save(data_path).rows
+        logging.info(f"PostgreSQL에 {saved_count}개 레코드 저장 완료 ({data_path})")
 
         return saved_count
     except Exception as e:
@@ -103,18 +153,18 @@ def save_data_to_postgresql(csv_path: Path) -> int:
         raise
 
 
-def save_data_to_elasticsearch(csv_path: Path) -> int:
-    """Elasticsearch에 CSV 데이터 저장
+def save_data_to_elasticsearch(data_path: Path) -> int:
+    """Elasticsearch에 데이터셋(CSV/Parquet) 저장
 
     Args:
-        csv_path (Path): CSV 파일 경로
+        data_path (Path): 데이터셋 파일 경로
 
     Returns:
         int: 저장된 레코드 수
     """
     try:
-        df = pd.read_csv(csv_path)
-        logging.info(f"Elasticsearch: {len(df)}개 레코드를 {csv_path}에서 읽었습니다")
+        df = read_dataset(data_path)
+        logging.info(f"Elasticsearch: {len(df)}개 레코드를 {data_path}에서 읽었습니다")
         records = df.to_dict(orient="records")
 
         es_repo = RepositoryFactory.create("elasticsearch")
@@ -0,0 +1,311 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+COLUMN_TYPES = ("string", "int", "float")
+DISTRIBUTIONS = ("uniform", "zipf", "normal", "categorical")
+# Column type -> dtype for reading a generated CSV back without inference
+READ_DTYPES = {"string": "string", "int": "int64", "float": "float64"}
+
+
+@dataclass
+class ColumnSpec:
+    """Declarative description of a generated column.
+
+    Discrete columns (strings, ``zipf`` and ``categorical``) draw ranks from a
+    table of ``cardinality`` distinct values: explicit ``values``, a Faker
+    ``provider`` sampled once (e.g. ``"city"``), ``low + rank`` for ints or
+    ``"{name}_{rank}"`` strings. Rank 0 is the most frequent value under Zipf,
+    which models hot keys. Numeric ``uniform`` and ``normal`` columns are
+    continuous over ``[low, high]`` or ``mean``/``std`` and reject
+    ``cardinality`` and ``values``.
+    """
+
+    name: str
+    type: str = "string"
+    distribution: str = "uniform"
+    cardinality: Optional[int] = None
+    null_rate: float = 0.0
+    low: float = 0
+    high: float = 1
+    mean: float = 0.0
+    std: float = 1.0
+    zipf_exponent: float = 1.1
+    values: Optional[List[Any]] = None
+    weights: Optional[List[float]] = None
+    provider: Optional[str] = None
+    decimals: Optional[int] = None
+
+    def __post_init__(self):
+        if self.type not in COLUMN_TYPES:
+            raise ValueError(f"Unsupported column type for {self.name}: {self.type}")
+
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(
+                f"Unsupported distribution for {self.name}: {self.distribution}"
+            )
+
+        if not 0.0 <= self.null_rate <= 1.0:
+            raise ValueError(f"null_rate must be within [0, 1]: {self.null_rate}")
+
+        if self.cardinality is not None and self.cardinality <= 0:
+            raise ValueError(f"cardinality must be positive: {self.cardinality}")
+
+        if self.distribution == "normal" and self.type == "string":
+            raise ValueError(f"String column {self.name} cannot be normal")
+
+        if self.distribution == "zipf" and self.type == "float" and not self.values:
+            raise ValueError(f"Float column {self.name} needs values to be zipf")
+
+        if not self.is_discrete and (
+            self.cardinality is not None or self.values is not None
+        ):
+            raise ValueError(
+                f"{self.distribution} {self.type} column {self.name} is continuous; "
+                "cardinality and values need a zipf or categorical distribution"
+            )
+
+        if self.distribution == "categorical":
+            if not self.values:
+                raise ValueError(f"Categorical column {self.name} needs values")
+            if self.weights is not None and len(self.weights) != len(self.values):
+                raise ValueError(
+                    f"weights of {self.name} must match its {len(self.values)} values"
+                )
+
+    @property
+    def is_discrete(self) -> bool:
+        """Whether values are drawn from a table of distinct values."""
+        return self.type == "string" or self.distribution in ("zipf", "categorical")
+
+
+class CompiledColumn:
+    """Column sampler that maps uniform draws in ``[0, 1)`` to values.
+
+    Every sampler is an inverse CDF over ``draws`` uniform rows, so the same
+    schema works with NumPy generators and counter-based streams alike.
+    """
+
+    def __init__(
+        self,
+        spec: ColumnSpec,
+        draws: int,
+        transform: Callable[[np.ndarray], np.ndarray],
+        dtype: str,
+    ):
+        self.spec = spec
+        self.draws = draws + (1 if spec.null_rate > 0 else 0)
+        self.dtype = dtype
+        self._transform = transform
+
+    def sample(self, uniforms: np.ndarray) -> pd.Series:
+        """Turn a ``(draws, size)`` array of uniforms into a column.
+
+        Args:
+            uniforms: Uniform draws in ``[0, 1)``, one row per draw
+
+        Returns:
+            Series named after the column, nulls included
+        """
+        values = self._transform(uniforms)
+        column = pd.Series(values, name=self.spec.name)
+        if self.spec.null_rate > 0:
+            column = column.astype(self.dtype)
+            column[uniforms[-1] < self.spec.null_rate] = None
+        return column
+
+
+class CompiledSchema:
+    """Vectorized batch generator compiled from a list of ``ColumnSpec``."""
+
+    def __init__(self, columns: List[CompiledColumn]):
+        self.columns = columns
+        self.header = [column.spec.name for column in columns]
+        self.offsets = np.cumsum([0] + [column.draws for column in columns])
+        self.draws = int(self.offsets[-1])
+
+    def sample(self, uniforms: np.ndarray) -> pd.DataFrame:
+        """Build a batch from a ``(draws, size)`` array of uniforms."""
+        return pd.DataFrame(
+            {
+                column.spec.name: column.sample(uniforms[start:end])
+                for column, start, end in zip(
+                    self.columns, self.offsets[:-1], self.offsets[1:]
+                )
+            }
+        )
+
+    def generate(self, rng: np.random.Generator, size: int) -> pd.DataFrame:
+        """Generate ``size`` records from a NumPy generator."""
+        return self.sample(rng.random((self.draws, size)))
+
+
+def zipf_cdf(cardinality: int, exponent: float) -> np.ndarray:
+    """Cumulative probabilities of ranks ``1..cardinality`` under bounded Zipf."""
+    weights = np.arange(1, cardinality + 1, dtype=np.float64) ** -exponent
+    return _normalized_cdf(weights)
+
+
+def _normalized_cdf(weights: Sequence[float]) -> np.ndarray:
+    cdf = np.cumsum(np.asarray(weights, dtype=np.float64))
+    if cdf[-1] <= 0:
+        raise ValueError("weights must have a positive sum")
+    return cdf / cdf[-1]
+
+
+def _value_table(spec: ColumnSpec, fake, default_cardinality: int) -> np.ndarray:
+    """Distinct values a discrete column draws ranks from."""
+    if spec.values:
+        return np.array(spec.values, dtype=object if spec.type == "string" else None)
+
+    if spec.type == "int":
+        size = spec.cardinality or int(spec.high - spec.low + 1)
+        return np.arange(size, dtype=np.int64) + int(spec.low)
+
+    size = spec.cardinality or default_cardinality
+    if spec.provider:
+        provider = getattr(fake, spec.provider)
+        return np.array([provider() for _ in range(size)], dtype=object)
+    return np.array([f"{spec.name}_{rank}" for rank in range(size)], dtype=object)
+
+
+def compile_column(
+    spec: ColumnSpec, fake=None, default_cardinality: int = 1_000
+) -> CompiledColumn:
+    """Compile a column spec into an inverse-CDF sampler.
+
+    Args:
+        spec: Column description
+        fake: Seeded Faker instance, required when ``spec.provider`` is set
+        default_cardinality: Table size of string columns without cardinality
+
+    Returns:
+        CompiledColumn
+    """
+    nullable_dtype = {"string": "object", "int": "Int64", "float": "float64"}[spec.type]
+
+    if spec.is_discrete:
+        table = _value_table(spec, fake, default_cardinality)
+        if spec.distribution == "zipf":
+            cdf = zipf_cdf(len(table), spec.zipf_exponent)
+        elif spec.distribution == "categorical":
+            cdf = _normalized_cdf(spec.weights or [1.0] * len(table))
+        else:
+            cdf = None
+
+        def pick(uniforms: np.ndarray) -> np.ndarray:
+            if cdf is None:
+                ranks = (uniforms[0] * len(table)).astype(np.int64)
+            else:
+                ranks = np.searchsorted(cdf, uniforms[0], side="right")
+            return table[np.minimum(ranks, len(table) - 1)]
+
+        return CompiledColumn(spec, 1, pick, nullable_dtype)
+
+    if spec.distribution == "normal":
+
+        def continuous(uniforms: np.ndarray) -> np.ndarray:
+            # Box-Muller transform over two uniform rows
+            radius = np.sqrt(-2.0 * np.log1p(-uniforms[0]))
+            return spec.mean + spec.std * radius * np.cos(2 * math.pi * uniforms[1])
+
+        draws = 2
+    else:
+
+        def continuous(uniforms: np.ndarray) -> np.ndarray:
+            if spec.type == "int":
+                span = int(spec.high) - int(spec.low) + 1
+                return int(spec.low) + (uniforms[0] * span).astype(np.int64)
+            return spec.low + uniforms[0] * (spec.high - spec.low)
+
+        draws = 1
+
+    def finish(uniforms: np.ndarray) -> np.ndarray:
+        values = continuous(uniforms)
+        if spec.type == "int":
+            return np.rint(values).astype(np.int64)
+        if spec.decimals is not None:
+            return np.round(values, spec.decimals)
+        return values
+
+    return CompiledColumn(spec, draws, finish, nullable_dtype)
+
+
+def compile_schema(
+    columns: List[ColumnSpec], fake=None, default_cardinality: int = 1_000
+) -> CompiledSchema:
+    """Compile column specs into a vectorized batch generator.
+
+    Args:
+        columns: Column descriptions in output order
+        fake: Seeded Faker instance used for provider vocabularies
+        default_cardinality: Table size of string columns without cardinality
+
+    Returns:
+        CompiledSchema
+
+    Raises:
+        ValueError: If column names repeat
+    """
+    names = [column.name for column in columns]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate column names in schema: {names}")
+    return CompiledSchema(
+        [compile_column(spec, fake, default_cardinality) for spec in columns]
+    )
+
+
+def schema_dtypes(columns: List[ColumnSpec]) -> Dict[str, str]:
+    """Read dtypes of a dataset generated from ``columns``.
+
+    Int columns that can be null read as nullable ``Int64``; float columns
+    keep nulls as NaN.
+
+    Args:
+        columns: Column descriptions the dataset was generated from
+
+    Returns:
+        Column name -> pandas dtype
+    """
+    return {
+        column.name: (
+            "Int64"
+            if column.type == "int" and column.null_rate > 0
+            else READ_DTYPES[column.type]
+        )
+        for column in columns
+    }
+
+
+def user_schema() -> List[ColumnSpec]:
+    """Users dataset layout with uniformly distributed columns."""
+    return [
+        ColumnSpec("name", provider="name"),
+        ColumnSpec("age", type="int", low=18, high=80),
+        ColumnSpec("street", provider="street_address"),
+        ColumnSpec("city", provider="city"),
+        ColumnSpec("state", provider="state"),
+        ColumnSpec("zip", provider="zipcode"),
+        ColumnSpec("lng", type="float", low=-180.0, high=180.0, decimals=6),
+        ColumnSpec("lat", type="float", low=-90.0, high=90.0, decimals=6),
+    ]
+
+
+def skewed_user_schema() -> List[ColumnSpec]:
+    """User dataset layout with Zipf-distributed cities and states.
+
+    A handful of cities and states dominate, like hot keys in production
+    Kafka partitions and Elasticsearch terms.
+    """
+    skewed = {
+        "city": ColumnSpec(
+            "city", distribution="zipf", provider="city", cardinality=500
+        ),
+        "state": ColumnSpec(
+            "state", distribution="zipf", provider="state", cardinality=50
+        ),
+    }
+    return [skewed.get(column.name, column) for column in user_schema()]
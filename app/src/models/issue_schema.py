@@ -0,0 +1,321 @@
+import hashlib
+import math
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from src.utils.geohash import MAX_PRECISION, encode
+
+FIELD_TYPES = ("keyword", "text", "integer", "float", "date", "geo_point")
+# derivation -> (field type, number of inputs, takes a precision)
+DERIVATIONS = {
+    "point": ("geo_point", 2, False),
+    "day": ("date", 1, False),
+    "geohash": ("keyword", 2, True),
+    "prefix": ("keyword", 1, True),
+    "fingerprint": ("keyword", 0, False),
+}
+# Grid key precisions, from city districts (3) down to single blocks (7)
+GEOHASH_PRECISIONS = (3, 4, 5, 6, 7)
+
+
+@dataclass(frozen=True)
+class IssueField:
+    """One field of an indexed SeeClickFix issue.
+
+    ``type`` is the Elasticsearch mapping type and decides how the API value is
+    coerced. Source fields read ``source`` (default: ``name``) from the API
+    issue and fall back to ``default`` when the value is missing or cannot be
+    coerced; ``source_type`` is the API's own type when it differs (numeric
+    ids indexed as keywords). Derived fields are computed from earlier,
+    already coerced ``inputs``: ``"point"`` builds a geo_point object from
+    (lat, lon), ``"day"`` truncates an ISO timestamp to its date, ``"geohash"``
+    encodes (lat, lon) as a geohash of ``precision`` characters,
+    ``"prefix"`` cuts a longer geohash down to ``precision`` and
+    ``"fingerprint"`` hashes every source field before it.
+    """
+
+    name: str
+    type: str
+    source: Optional[str] = None
+    source_type: Optional[str] = None
+    default: Any = None
+    derive: Optional[str] = None
+    inputs: Tuple[str, ...] = ()
+    precision: Optional[int] = None
+
+    def __post_init__(self):
+        if self.type not in FIELD_TYPES:
+            raise ValueError(f"Unsupported field type for {self.name}: {self.type}")
+
+        if self.derive is None:
+            if self.type == "geo_point":
+                raise ValueError(f"geo_point field {self.name} must be derived")
+            if self.source_type is not None and self.source_type not in COERCERS:
+                raise ValueError(
+                    f"Unsupported source type for {self.name}: {self.source_type}"
+                )
+            return
+
+        if self.derive not in DERIVATIONS:
+            raise ValueError(f"Unsupported derivation for {self.name}: {self.derive}")
+        if self.source is not None:
+            raise ValueError(f"Derived field {self.name} cannot have a source")
+        field_type, inputs, has_precision = DERIVATIONS[self.derive]
+        if self.type != field_type or len(self.inputs) != inputs:
+            raise ValueError(
+                f"{self.derive} field {self.name} must be a {field_type} "
+                f"with {inputs} inputs"
+            )
+        if has_precision and not (
+            self.precision is not None and 1 <= self.precision <= MAX_PRECISION
+        ):
+            raise ValueError(
+                f"{self.derive} field {self.name} needs a precision "
+                f"between 1 and {MAX_PRECISION}: {self.precision}"
+            )
+
+    @property
+    def key(self) -> str:
+        """Key of the value in the API issue."""
+        return self.source or self.name
+
+
+def coerce_string(value: Any) -> Optional[str]:
+    """keyword/text: strings pass through, scalars are stringified."""
+    if value is None or type(value) is str:
+        return value
+    if isinstance(value, (dict, list)):
+        return None
+    return str(value)
+
+
+def coerce_integer(value: Any) -> Optional[int]:
+    """integer: ints pass through, numeric strings and floats are truncated."""
+    if type(value) is int:
+        return value
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def coerce_float(value: Any) -> Optional[float]:
+    """float: finite numbers and numeric strings, anything else is None."""
+    if type(value) is not float:
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+    return value if math.isfinite(value) else None
+
+
+def coerce_date(value: Any) -> Optional[str]:
+    """date: ISO 8601 strings that parse are kept as sent, dates are formatted."""
+    if type(value) is str:
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return None
+
+
+def derive_point(lat: Optional[float], lon: Optional[float]) -> Optional[dict]:
+    """geo_point object, or None unless both coordinates are present and valid."""
+    if lat is None or lon is None:
+        return None
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        return None
+    return {"lat": lat, "lon": lon}
+
+
+def derive_day(timestamp: Optional[str]) -> Optional[str]:
+    """Calendar date (``YYYY-MM-DD``) of an ISO timestamp."""
+    return timestamp[:10] if timestamp else None
+
+
+def derive_geohash(
+    lat: Optional[float], lon: Optional[float], precision: int
+) -> Optional[str]:
+    """Geohash cell of (lat, lon), or None without valid coordinates."""
+    if lat is None or lon is None:
+        return None
+    return encode(lat, lon, precision)
+
+
+def derive_prefix(geohash: Optional[str], precision: int) -> Optional[str]:
+    """Enclosing cell of a geohash at a lower precision."""
+    return geohash[:precision] if geohash else None
+
+
+def derive_fingerprint(*values: Any) -> str:
+    """Stable content hash of coerced source values.
+
+    Coerced values are only str, int, float and None, whose reprs do not change
+    between runs, so equal content always gives the same 16 hex digits.
+    """
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=8).hexdigest()
+
+
+COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "keyword": coerce_string,
+    "text": coerce_string,
+    "integer": coerce_integer,
+    "float": coerce_float,
+    "date": coerce_date,
+}
+
+DERIVERS: Dict[str, Callable[..., Any]] = {
+    "point": derive_point,
+    "day": derive_day,
+    "geohash": derive_geohash,
+    "prefix": derive_prefix,
+    "fingerprint": derive_fingerprint,
+}
+
+
+def grid_field(precision: int) -> str:
+    """Name of the grid key field for a geohash precision."""
+    if precision not in GEOHASH_PRECISIONS:
+        raise ValueError(
+            f"Unsupported grid precision: {precision} (use {GEOHASH_PRECISIONS})"
+        )
+    return f"geohash_{precision}"
+
+
+def _grid_fields() -> Tuple[IssueField, ...]:
+    """Grid keys: the finest geohash first, coarser ones as its prefixes."""
+    finest = max(GEOHASH_PRECISIONS)
+    fields = [
+        IssueField(
+            grid_field(finest),
+            "keyword",
+            derive="geohash",
+            inputs=("lat", "lng"),
+            precision=finest,
+        )
+    ]
+    for precision in sorted(GEOHASH_PRECISIONS, reverse=True)[1:]:
+        fields.append(
+            IssueField(
+                grid_field(precision),
+                "keyword",
+                derive="prefix",
+                inputs=(grid_field(finest),),
+                precision=precision,
+            )
+        )
+    return tuple(fields)
+
+
+# Indexed SeeClickFix issue, in document field order
+ISSUE_FIELDS: Tuple[IssueField, ...] = (
+    IssueField("id", "keyword", source_type="integer"),
+    IssueField("summary", "text"),
+    IssueField("description", "text"),
+    IssueField("status", "keyword"),
+    IssueField("lat", "float"),
+    IssueField("lng", "float"),
+    IssueField("coords", "geo_point", derive="point", inputs=("lat", "lng")),
+    *_grid_fields(),
+    IssueField("address", "text"),
+    IssueField("rating", "integer", default=0),
+    IssueField("comment_count", "integer", default=0),
+    IssueField("view_count", "integer", default=0),
+    IssueField("created_at", "date"),
+    IssueField("opendate", "date", derive="day", inputs=("created_at",)),
+    IssueField("fingerprint", "keyword", derive="fingerprint"),
+)
+
+
+def _check_fields(fields: Sequence[IssueField]) -> None:
+    seen = set()
+    for field in fields:
+        if field.name in seen:
+            raise ValueError(f"Duplicate field: {field.name}")
+        missing = [name for name in field.inputs if name not in seen]
+        if missing:
+            raise ValueError(f"{field.name} depends on undefined fields {missing}")
+        seen.add(field.name)
+
+
+def compile_transform(
+    fields: Sequence[IssueField] = ISSUE_FIELDS,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Generate a transform specialised to ``fields``.
+
+    The generated function reads each source key once, calls that field's
+    coercer directly and returns a dict literal in field order, so there is no
+    per-field dispatch or second pass at call time. Defaults only cost a
+    branch on the fields that have one.
+
+    Args:
+        fields: Field definitions, derived fields after their inputs
+
+    Returns:
+        ``transform(issue) -> document`` with values typed for the mapping
+    """
+    _check_fields(fields)
+
+    namespace: Dict[str, Any] = {}
+    variables = {}
+    sources = []
+    lines = ["def transform_issue(issue):", "    get = issue.get"]
+    for index, field in enumerate(fields):
+        variable = variables[field.name] = f"v{index}"
+        function = f"_f{index}"
+        if field.derive is None:
+            namespace[function] = COERCERS[field.type]
+            lines.append(f"    {variable} = {function}(get({field.key!r}))")
+            sources.append(variable)
+        elif field.derive == "fingerprint":
+            namespace[function] = DERIVERS[field.derive]
+            lines.append(f"    {variable} = {function}({', '.join(sources)})")
+        else:
+            namespace[function] = DERIVERS[field.derive]
+            arguments = [variables[name] for name in field.inputs]
+            if field.precision is not None:
+                arguments.append(str(field.precision))
+            arguments = ", ".join(arguments)
+            lines.append(f"    {variable} = {function}({arguments})")
+        if field.default is not None:
+            namespace[f"_d{index}"] = field.default
+            lines.append(f"    if {variable} is None:")
+            lines.append(f"        {variable} = _d{index}")
+    items = ", ".join(f"{field.name!r}: {variables[field.name]}" for field in fields)
+    lines.append(f"    return {{{items}}}")
+
+    exec("\n".join(lines), namespace)
+    transform = namespace["transform_issue"]
+    transform.__doc__ = "Coerce an API issue into an index document."
+    return transform
+
+
+def es_mapping(fields: Sequence[IssueField] = ISSUE_FIELDS) -> Dict[str, Any]:
+    """Elasticsearch index mapping for ``fields``.
+
+    Grid keys load their global ordinals at refresh time instead of on the
+    first terms aggregation after each refresh, since every heat-map request
+    aggregates on them. Fingerprints are kept in ``_source`` only.
+    """
+    _check_fields(fields)
+    properties = {}
+    for field in fields:
+        properties[field.name] = {"type": field.type}
+        if field.derive in ("geohash", "prefix"):
+            properties[field.name]["eager_global_ordinals"] = True
+        elif field.derive == "fingerprint":
+            # change detection only, never searched or aggregated
+            properties[field.name].update(index=False, doc_values=False)
+    return {"mappings": {"properties": properties}}
@@ -1,4 +1,7 @@
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
 
 
 def print_progress_bar(
@@ -39,3 +42,205 @@ def print_progress_bar(
     end_char = "\n" if iteration == total else ""
 
     print(f"\r{prefix} |{bar}| {percent}% {suffix}", end=end_char)
+
+
+@dataclass
+class ProgressStats:
+    """ProgressReporter가 집계한 진행 상황 스냅샷"""
+
+    completed: int
+    total: Optional[int]
+    bytes_processed: int
+    elapsed: float
+    rate: float
+    byte_rate: float
+    eta: Optional[float]
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    """초 단위 시간을 HH:MM:SS 문자열로 변환"""
+    if seconds is None:
+        return "--:--:--"
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """일정 시간 간격으로만 다시 그리는 thread-safe 진행 표시기
+
+    ``update``는 카운터만 갱신하고, 마지막으로 그린 뒤 ``interval``초가 지났을 때만
+    처리량(지수 이동 평균), ETA, 처리 바이트를 계산해 진행 표시줄을 다시 그린다.
+    여러 작업 스레드에서 동시에 호출해도 안전하다.
+
+    Example:
+        >>> with ProgressReporter(total=1000, prefix="Progress") as progress:
+        >>>     for batch in batches:
+        >>>         progress.update(len(batch))
+        >>> progress.stats().rate
+    """
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        prefix: str = "",
+        suffix: str = "",
+        length: int = 50,
+        interval: float = 0.5,
+        smoothing: float = 0.3,
+        enabled: bool = True,
+        on_report: Optional[Callable[[ProgressStats], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            total: 전체 작업 수 (모르면 None)
+            prefix: 진행 표시줄 앞에 표시할 문자열
+            suffix: 진행 표시줄 뒤에 표시할 문자열
+            length: 진행 표시줄 너비
+            interval: 다시 그리는 최소 간격 (초)
+            smoothing: 처리량 이동 평균 가중치 (0~1, 클수록 최근 값 반영)
+            enabled: False면 집계만 하고 출력하지 않음
+            on_report: 다시 그릴 때마다 통계를 전달받을 콜백 (로그/메트릭 내보내기용)
+            clock: 시간 함수 (테스트용)
+        """
+        self.total = total
+        self.prefix = prefix
+        self.suffix = suffix
+        self.length = length
+        self.interval = interval
+        self.smoothing = smoothing
+        self.enabled = enabled
+        self.on_report = on_report
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._completed = 0
+        self._bytes = 0
+        self._started = clock()
+        self._last_draw: Optional[float] = None
+        self._sample_time = self._started
+        self._sample_completed = 0
+        self._sample_bytes = 0
+        self._rate: Optional[float] = None
+        self._byte_rate: Optional[float] = None
+        self._closed = False
+        self._drawn_complete = False
+
+    def update(self, count: int = 1, nbytes: int = 0) -> None:
+        """처리한 작업 수와 바이트 수를 더한다.
+
+        Args:
+            count: 새로 완료된 작업 수
+            nbytes: 새로 처리한 바이트 수
+        """
+        stats = None
+        with self._lock:
+            self._completed += count
+            self._bytes += nbytes
+            now = self._clock()
+            if self._last_draw is None or now - self._last_draw >= self.interval:
+                stats = self._report(now)
+        self._notify(stats)
+
+    def stats(self) -> ProgressStats:
+        """현재 진행 상황 스냅샷을 반환한다."""
+        with self._lock:
+            return self._snapshot(self._clock())
+
+    def close(self) -> ProgressStats:
+        """마지막 상태를 그리고 최종 통계를 반환한다."""
+        stats = None
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                stats = self._report(self._clock(), final=True)
+            final = self._snapshot(self._clock())
+        self._notify(stats)
+        return final
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _sample(self, now: float) -> None:
+        """마지막 샘플 이후 구간의 처리량을 이동 평균에 반영한다."""
+        elapsed = now - self._sample_time
+        if elapsed <= 0:
+            return
+        rate = (self._completed - self._sample_completed) / elapsed
+        byte_rate = (self._bytes - self._sample_bytes) / elapsed
+        if self._rate is None:
+            self._rate, self._byte_rate = rate, byte_rate
+        else:
+            alpha = self.smoothing
+            self._rate = alpha * rate + (1 - alpha) * self._rate
+            self._byte_rate = alpha * byte_rate + (1 - alpha) * self._byte_rate
+        self._sample_time = now
+        self._sample_completed = self._completed
+        self._sample_bytes = self._bytes
+
+    def _snapshot(self, now: float) -> ProgressStats:
+        elapsed = now - self._started
+        rate = self._rate
+        if rate is None:
+            # 아직 샘플이 없으면 전체 평균으로 대신한다
+            rate = self._completed / elapsed if elapsed > 0 else 0.0
+        byte_rate = self._byte_rate
+        if byte_rate is None:
+            byte_rate = self._bytes / elapsed if elapsed > 0 else 0.0
+
+        eta = None
+        if self.total is not None:
+            remaining = max(self.total - self._completed, 0)
+            if remaining == 0:
+                eta = 0.0
+            elif rate > 0:
+                eta = remaining / rate
+
+        return ProgressStats(
+            completed=self._completed,
+            total=self.total,
+            bytes_processed=self._bytes,
+            elapsed=elapsed,
+            rate=rate,
+            byte_rate=byte_rate,
+            eta=eta,
+        )
+
+    def _notify(self, stats: Optional[ProgressStats]) -> None:
+        """on_report 콜백 호출 (콜백이 stats()를 부를 수 있도록 lock 밖에서 호출)"""
+        if stats is not None and self.on_report:
+            self.on_report(stats)
+
+    def _report(self, now: float, final: bool = False) -> ProgressStats:
+        """통계를 갱신하고 진행 표시줄을 그린다. (lock을 잡은 상태에서 호출)"""
+        if self._last_draw is not None:
+            self._sample(now)
+        self._last_draw = now
+        stats = self._snapshot(now)
+
+        if not self.enabled or self._drawn_complete:
+            return stats
+
+        details = f"{stats.rate:,.1f}/s ETA {_format_duration(stats.eta)}"
+        if stats.bytes_processed:
+            details += f" {stats.bytes_processed / 1_048_576:,.1f}MiB"
+        suffix = f"{self.suffix} {details}".strip()
+
+        if self.total:
+            self._drawn_complete = stats.completed >= self.total
+            print_progress_bar(
+                min(stats.completed, self.total),
+                self.total,
+                prefix=self.prefix,
+                suffix=suffix,
+                length=self.length,
+            )
+            if final and stats.completed < self.total:
+                print()
+        else:
+            end = "\n" if final else ""
+            print(f"\r{self.prefix} {stats.completed:,} {suffix}", end=end)
+        return stats
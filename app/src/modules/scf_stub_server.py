@@ -0,0 +1,341 @@
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+_TZ = timezone(timedelta(hours=-6))
+_EPOCH = datetime(2015, 1, 1, tzinfo=_TZ)
+# 응답에 영향을 주는 쿼리 파라미터 (나머지는 무시)
+_QUERY_PARAMS = (
+    "page",
+    "per_page",
+    "status",
+    "updated_at_after",
+    "after",
+    "sort",
+    "sort_direction",
+)
+
+
+@dataclass
+class StubServerConfig:
+    """로컬 SeeClickFix API 대역 설정
+
+    Attributes:
+        total_issues: 생성할 이슈 수
+        status: 이슈의 status 값 (요청의 status 파라미터와 다르면 빈 결과)
+        latency: 응답마다 추가할 지연 시간(초)
+        jitter: 지연 시간에 더할 ±jitter 범위의 균등 난수(초)
+        error_rate: 500으로 응답할 비율
+        rate_limit: 초당 허용 요청 수. 넘으면 429로 응답한다 (None이면 제한 없음)
+        burst: 요청 제한 버킷 크기 (None이면 rate_limit을 올림한 값)
+        retry_after: 429 응답의 Retry-After 값(초). None이면 헤더를 보내지 않는다
+        seed: 이슈 데이터와 오류 발생 난수 시드
+    """
+
+    total_issues: int = 5_000
+    status: str = "Archived"
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: Optional[float] = None
+    burst: Optional[int] = None
+    retry_after: Optional[float] = 1.0
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.total_issues < 0:
+            raise ValueError("total_issues는 0 이상이어야 합니다.")
+        if not 0 <= self.error_rate <= 1:
+            raise ValueError("error_rate는 0과 1 사이여야 합니다.")
+        if self.latency < 0 or self.jitter < 0:
+            raise ValueError("latency와 jitter는 0 이상이어야 합니다.")
+        if self.rate_limit is not None and self.rate_limit <= 0:
+            raise ValueError("rate_limit은 0보다 커야 합니다.")
+
+
+def generate_issues(config: StubServerConfig) -> List[Dict[str, Any]]:
+    """SeeClickFix 이슈 형식의 데이터를 시드에 따라 재현 가능하게 생성한다."""
+    rng = random.Random(config.seed)
+    issues = []
+    for issue_id in range(1, config.total_issues + 1):
+        created_at = _EPOCH + timedelta(minutes=rng.randrange(0, 5 * 365 * 24 * 60))
+        updated_at = created_at + timedelta(minutes=rng.randrange(0, 90 * 24 * 60))
+        issues.append(
+            {
+                "id": issue_id,
+                "status": config.status,
+                "summary": f"Issue {issue_id}",
+                "description": f"Generated issue {issue_id}",
+                "rating": rng.randint(1, 5),
+                "lat": round(35.08 + rng.uniform(-0.2, 0.2), 6),
+                "lng": round(-106.65 + rng.uniform(-0.2, 0.2), 6),
+                "address": f"{rng.randint(1, 9999)} Central Ave SW, Albuquerque, NM",
+                "comment_count": rng.randint(0, 20),
+                "view_count": rng.randint(0, 500),
+                "created_at": created_at.isoformat(),
+                "updated_at": updated_at.isoformat(),
+                "html_url": f"https://seeclickfix.com/issues/{issue_id}",
+            }
+        )
+    return issues
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """``GET /api/v2/issues`` 요청을 처리한다."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def do_GET(self):
+        stub = self.server.stub
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip("/") != "/api/v2/issues":
+            self._send(404, b"")
+            return
+
+        stub._delay()
+        status, retry_after = stub._admit()
+        if status != 200:
+            headers = {}
+            if retry_after is not None:
+                headers["Retry-After"] = f"{retry_after:g}"
+            self._send(status, b"", headers)
+            return
+
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        try:
+            body, etag = stub.page_body(query)
+        except ValueError as e:
+            self._send(400, json.dumps({"error": str(e)}).encode())
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            stub._count(304)
+            self._send(304, b"", {"ETag": etag})
+            return
+        stub._count(200)
+        self._send(200, body, {"ETag": etag, "Content-Type": "application/json"})
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict] = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, stub: "StubSeeClickFixServer"):
+        super().__init__(address, _StubHandler)
+        self.stub = stub
+
+
+class StubSeeClickFixServer:
+    """SeeClickFix API v2 ``issues`` 엔드포인트를 흉내 내는 로컬 서버
+
+    생성한 이슈를 ``issues`` + ``metadata.pagination`` 형식으로 페이지 단위로
+    돌려준다. ``page``, ``per_page``, ``status``, ``updated_at_after``, ``after``,
+    ``sort``, ``sort_direction`` 파라미터와 ETag 조건부 GET을 지원하고, 설정에
+    따라 지연 시간, 500 오류, 429 요청 제한을 재현한다. 외부 API 없이 수집 경로를
+    테스트하거나 벤치마크할 때 사용한다.
+
+    Example:
+        >>> with StubSeeClickFixServer(StubServerConfig(latency=0.05)) as server:
+        ...     fetch_page(server.url, {"page": 1, "per_page": 100})
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubServerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """초기화
+
+        Args:
+            config (Optional[StubServerConfig], optional): 서버 설정
+            host (str, optional): 바인딩할 주소. Defaults to "127.0.0.1".
+            port (int, optional): 포트. Defaults to 0 (빈 포트 자동 선택).
+        """
+        self.config = config or StubServerConfig()
+        self.issues = generate_issues(self.config)
+        self._host = host
+        self._port = port
+        self._server: Optional[_StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._burst = self.config.burst or math.ceil(self.config.rate_limit or 1)
+        self._tokens = float(self._burst)
+        self._refilled_at = time.monotonic()
+        self._body_for = lru_cache(maxsize=1024)(self._render)
+        self.stats: Dict[int, int] = {}
+
+    @property
+    def url(self) -> str:
+        """issues 엔드포인트 URL"""
+        if self._server is None:
+            raise ValueError("서버가 시작되지 않았습니다.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v2/issues"
+
+    @property
+    def requests(self) -> int:
+        """받은 요청 수"""
+        return sum(self.stats.values())
+
+    def start(self) -> "StubSeeClickFixServer":
+        """백그라운드 스레드에서 서버를 시작한다."""
+        self._server = _StubHTTPServer((self._host, self._port), self)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"SeeClickFix API 대역 서버 시작: {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료한다."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "StubSeeClickFixServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _count(self, status: int) -> None:
+        with self._lock:
+            self.stats[status] = self.stats.get(status, 0) + 1
+
+    def _delay(self) -> None:
+        delay = self.config.latency
+        if self.config.jitter:
+            with self._lock:
+                delay += self._rng.uniform(-self.config.jitter, self.config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _admit(self) -> Tuple[int, Optional[float]]:
+        """요청 제한과 오류율을 적용해 (상태 코드, Retry-After)를 정한다."""
+        with self._lock:
+            if self.config.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst,
+                    self._tokens + (now - self._refilled_at) * self.config.rate_limit,
+                )
+                self._refilled_at = now
+                if self._tokens < 1:
+                    self.stats[429] = self.stats.get(429, 0) + 1
+                    return 429, self.config.retry_after
+                self._tokens -= 1
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                self.stats[500] = self.stats.get(500, 0) + 1
+                return 500, None
+        return 200, None
+
+    def page_body(self, query: Dict[str, str]) -> Tuple[bytes, str]:
+        """쿼리 파라미터에 맞는 응답 본문과 ETag"""
+        key = tuple(sorted((k, v) for k, v in query.items() if k in _QUERY_PARAMS))
+        return self._body_for(key)
+
+    def _render(self, key: Tuple[Tuple[str, str], ...]) -> Tuple[bytes, str]:
+        query = dict(key)
+        page = int(query.get("page", 1))
+        per_page = int(query.get("per_page", 20))
+        if page < 1 or per_page < 1:
+            raise ValueError("page와 per_page는 1 이상이어야 합니다.")
+
+        issues = self.issues
+        if "status" in query:
+            statuses = {s.strip().lower() for s in query["status"].split(",")}
+            issues = [i for i in issues if i["status"].lower() in statuses]
+        for param, field in (
+            ("updated_at_after", "updated_at"),
+            ("after", "created_at"),
+        ):
+            if param in query:
+                since = datetime.fromisoformat(query[param].replace("Z", "+00:00"))
+                issues = [i for i in issues if datetime.fromisoformat(i[field]) > since]
+        sort = query.get("sort")
+        if sort in ("created_at", "updated_at"):
+            issues = sorted(
+                issues,
+                key=lambda i: (datetime.fromisoformat(i[sort]), i["id"]),
+                reverse=query.get("sort_direction", "DESC").upper() == "DESC",
+            )
+
+        pages = math.ceil(len(issues) / per_page)
+        body = json.dumps(
+            {
+                "issues": issues[(page - 1) * per_page : page * per_page],
+                "metadata": {
+                    "pagination": {
+                        "entries": len(issues),
+                        "page": page,
+                        "per_page": per_page,
+                        "pages": pages,
+                        "next_page": page + 1 if page < pages else None,
+                        "previous_page": page - 1 if page > 1 else None,
+                    }
+                },
+            }
+        ).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        return body, etag
+
+
+def main() -> None:
+    """명령행에서 대역 서버를 실행한다."""
+    parser = argparse.ArgumentParser(description="로컬 SeeClickFix API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--issues", type=int, default=5_000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = StubServerConfig(
+        total_issues=args.issues,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+    )
+    server = StubSeeClickFixServer(config, args.host, args.port).start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
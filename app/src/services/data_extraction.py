@@ -1,14 +1,31 @@
+import asyncio
 import concurrent.futures
+from dataclasses import dataclass
 from functools import partial
+import queue
+import re
+import threading
 import time
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from src.utils.http_client import fetch_page
-from src.utils.data_transform import transform_issue
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+from src.utils.http_client import AsyncHttpClient, HttpClient
+from src.utils.json_stream import JsonArrayStream, iter_chunks
+from src.utils.page_cache import PageCache
+from src.utils.page_manifest import PageManifest, page_checksum
+from src.utils.rate_limiter import RateLimiter
+from src.utils.watermark import (
+    WatermarkStore,
+    WatermarkTracker,
+    issue_timestamp,
+    latest_timestamp,
+    rewind_timestamp,
+)
+from src.utils.data_transform import transform_issue, transform_issues
+from src.utils.fingerprint_store import FingerprintStore
 from src.database.scf_repository import SeeClickFixRepository
-from src.modules.progress_bar import print_progress_bar
+from src.modules.progress_bar import ProgressReporter
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -23,130 +40,1282 @@ PLACE_URL = "bernalillo-county"
 PER_PAGE = 100
 STATUS = "Archived"  # 또는 "open", "acknowledged", "closed" 등
 
+# 조건부 GET 응답 캐시 디렉토리 (DATA_DIR 아래)
+CACHE_DIRNAME = "http_cache"
+# 증분 수집 워터마크 파일 (DATA_DIR 아래)
+WATERMARK_FILENAME = "watermarks.json"
+# 전체 수집 페이지 매니페스트 파일 (DATA_DIR 아래)
+MANIFEST_FILENAME = "manifest.jsonl"
+# 증분 수집 페이지 매니페스트 파일 (전체 수집의 이어받기 상태를 덮어쓰지 않도록 분리)
+INCREMENTAL_MANIFEST_FILENAME = "manifest-incremental.jsonl"
+# 색인한 이슈의 내용 지문 파일 (DATA_DIR 아래)
+FINGERPRINT_FILENAME = "fingerprints.tsv"
 
-def save_to_file(data: Dict[str, Any], page_num: int) -> None:
-    """데이터를 로컬 파일로 저장합니다."""
+# 색인 단계의 bulk 요청 크기 (이슈 수 또는 원본 바이트 수 중 먼저 차는 쪽)
+BULK_SIZE = 1_000
+BULK_BYTES = 5 * 1024 * 1024
+
+# 공유 RateLimiter 기본값: 초당 요청 수와, AIMD가 시작 동시 요청 수의 몇 배까지
+# 늘릴 수 있는지
+REQUEST_RATE = 10.0
+CONCURRENCY_HEADROOM = 2
+
+# 증분 수집의 키셋 커서를 앞당기는 시간 (초). 같은 updated_at의 이슈가 페이지
+# 경계에서 나뉘어도 다음 요청에서 다시 받는다
+KEYSET_OVERLAP = 1.0
+
+
+@dataclass
+class ParsedPage:
+    """스트리밍으로 읽은 API 응답 페이지"""
+
+    # transform_issue로 변환한 이슈 (transform=False면 원본)
+    issues: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
+    latest: Optional[str] = None  # 페이지에서 가장 늦은 updated_at/created_at
+
+
+def save_to_file(body: bytes, page_num: int) -> None:
+    """응답 본문을 받은 그대로 로컬 파일로 저장합니다."""
     filename = DATA_DIR / f"seeclickfix_page_{page_num}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    filename.write_bytes(body)
     logger.info(f"Saved page {page_num} to {filename}")
 
 
+def parse_page(body: Optional[bytes], transform: bool = True) -> Optional[ParsedPage]:
+    """응답 본문의 issues 배열을 스트리밍으로 읽으며 이슈마다 바로 변환합니다.
+
+    본문 전체를 문자열로 디코딩하거나 파싱 트리를 만들지 않고, 이슈 하나가
+    완성될 때마다 transform_issue에 넘긴다.
+
+    Args:
+        body (Optional[bytes]): 응답 본문
+        transform (bool, optional): False면 원본 이슈를 그대로 모은다 (여러 페이지를
+            모아 transform_issues로 한 번에 변환할 때). Defaults to True.
+
+    Returns:
+        Optional[ParsedPage]: 변환된 페이지 || 본문이 없거나 형식이 잘못되면 None
+    """
+    if body is None:
+        return None
+    parser = JsonArrayStream("issues")
+    issues, timestamps = [], []
+    try:
+        for issue in parser.iter_items(iter_chunks(body)):
+            issues.append(transform_issue(issue) if transform else issue)
+            timestamps.append(issue_timestamp(issue))
+    except ValueError as e:
+        logger.error(f"응답 본문을 읽을 수 없습니다: {e}")
+        return None
+    if not parser.found:
+        return None
+    metadata = parser.fields.get("metadata") or {}
+    return ParsedPage(issues, metadata, latest_timestamp(timestamps))
+
+
+def _default_repository() -> SeeClickFixRepository:
+    """지문 저장소를 쓰는 기본 저장소 (변경 없는 이슈는 다시 색인하지 않음)"""
+    return SeeClickFixRepository(
+        fingerprints=FingerprintStore(DATA_DIR / FINGERPRINT_FILENAME)
+    )
+
+
+def _prepare_repository(repo: SeeClickFixRepository) -> bool:
+    """Elasticsearch 연결과 인덱스 매핑을 확인한다."""
+    if not repo.check_connection():
+        logger.error("Elasticsearch 연결 실패. 데이터 수집을 중단합니다.")
+        return False
+
+    # 인덱스 매핑 설정
+    if not repo.setup_index_mapping():
+        logger.error("인덱스 매핑 설정 실패. 데이터 수집을 중단합니다.")
+        return False
+    return True
+
+
+def prepare_index(repository: Optional[SeeClickFixRepository] = None) -> None:
+    """수집 전에 Elasticsearch 연결을 확인하고 인덱스를 한 번 만든다.
+
+    샤드를 여러 프로세스나 태스크로 나누기 전에 호출해, 샤드들이 동시에 인덱스를
+    만들려고 다투지 않게 한다.
+
+    Raises:
+        RuntimeError: 연결이나 인덱스 매핑 설정에 실패한 경우
+    """
+    if not _prepare_repository(repository or _default_repository()):
+        raise RuntimeError("Elasticsearch 인덱스를 준비하지 못했습니다.")
+
+
+def _total_pages(first_page: ParsedPage, max_pages: Optional[int] = None) -> int:
+    """첫 페이지의 pagination 정보로 수집할 페이지 수를 정한다 (max_pages로 제한)."""
+    total_pages = max(1, first_page.metadata["pagination"]["pages"])
+    if max_pages is not None:
+        total_pages = min(total_pages, max_pages)
+    logger.info(f"총 페이지: {total_pages}")
+    return total_pages
+
+
+def _page_params(page: int = 1) -> Dict[str, Any]:
+    """SeeClickFix API 페이지 요청 파라미터"""
+    return {
+        "place_url": PLACE_URL,
+        "per_page": PER_PAGE,
+        "status": STATUS,
+        "page": page,
+    }
+
+
+@dataclass(frozen=True)
+class PageShard:
+    """수집할 페이지 범위 [first, last] (양 끝 포함)"""
+
+    first: int
+    last: int
+
+    def __post_init__(self):
+        if not 1 <= self.first <= self.last:
+            raise ValueError(f"잘못된 페이지 범위입니다: {self.first}-{self.last}")
+
+    def pages(self, total_pages: int) -> range:
+        """전체 페이지 수를 넘지 않는 범위의 페이지 번호"""
+        return range(self.first, min(self.last, total_pages) + 1)
+
+    @classmethod
+    def split(cls, total_pages: int, shards: int) -> List["PageShard"]:
+        """1..total_pages를 크기가 거의 같은 연속 범위 shards개로 나눈다.
+
+        페이지 수보다 많은 샤드는 만들지 않는다.
+        """
+        if total_pages < 1 or shards < 1:
+            raise ValueError("total_pages와 shards는 1 이상이어야 합니다.")
+        shards = min(shards, total_pages)
+        base, extra = divmod(total_pages, shards)
+        result, first = [], 1
+        for index in range(shards):
+            size = base + (1 if index < extra else 0)
+            result.append(cls(first, first + size - 1))
+            first += size
+        return result
+
+
+def _incremental_params(params: Dict[str, Any], since: Optional[str]) -> Dict[str, Any]:
+    """워터마크 이후에 바뀐 이슈만 오래된 순서로 요청하는 파라미터를 만든다.
+
+    오래된 순서로 받으면 수집 중에 바뀐 이슈는 결과의 끝으로 옮겨 가므로
+    키셋 커서(마지막으로 본 updated_at) 뒤에서 다시 받게 된다.
+    """
+    params = dict(params, sort="updated_at", sort_direction="ASC")
+    if since:
+        params["updated_at_after"] = since
+    return params
+
+
+def _store_page(
+    page_num: int,
+    body: bytes,
+    page: ParsedPage,
+    repo: SeeClickFixRepository,
+    tracker: Optional[WatermarkTracker] = None,
+    manifest: Optional[PageManifest] = None,
+) -> int:
+    """가져온 페이지를 파일과 Elasticsearch에 저장하고 결과를 기록한다.
+
+    일부 이슈만 저장되면 실패로 기록해 재시도 대상으로 남긴다.
+    """
+    # 로컬 파일에 원본 데이터 저장
+    save_to_file(body, page_num)
+
+    # 변환된 이슈 저장
+    issues = page.issues
+    saved_count = 0
+    if issues:
+        saved_count = repo.bulk_save_issues(issues)
+        logger.info(f"저장 완료: {saved_count}/{len(issues)} 이슈 (페이지 {page_num})")
+
+    error = None
+    if saved_count < len(issues):
+        error = f"{saved_count}/{len(issues)} 이슈만 저장됨"
+    _record_page(page_num, page, page_checksum(body), error, tracker, manifest)
+    return saved_count
+
+
+def _record_page(
+    page_num: int,
+    page: ParsedPage,
+    checksum: str,
+    error: Optional[str],
+    tracker: Optional[WatermarkTracker],
+    manifest: Optional[PageManifest],
+) -> None:
+    """저장 결과를 매니페스트와 워터마크에 반영한다.
+
+    저장까지 끝난 페이지만 워터마크에 반영하고, 실패한 페이지는 재시도 대상으로 남긴다.
+    """
+    if error is not None:
+        if manifest is not None:
+            manifest.mark_failed(page_num, error)
+        return
+    if tracker is not None:
+        tracker.record(page.latest)
+    if manifest is not None:
+        manifest.mark_done(page_num, len(page.issues), checksum)
+
+
+@dataclass
+class _QueuedPage:
+    """색인 단계 큐에 들어가는 페이지 (원본 본문 대신 체크섬과 크기만 담는다)"""
+
+    page_num: int
+    page: ParsedPage
+    checksum: str
+    nbytes: int
+
+
+class IndexingStage:
+    """페이지 수집과 Elasticsearch 색인을 분리하는 색인 단계
+
+    fetch 작업자는 변환된 페이지를 크기 제한이 있는 큐에 넣고 바로 다음 페이지를
+    받으러 간다. 색인 스레드 하나가 큐에서 페이지를 꺼내 여러 페이지의 이슈를
+    ``bulk_size``개 또는 원본 ``bulk_bytes`` 바이트가 찰 때까지 모아 한 번에 bulk
+    저장한다. 색인이 밀려 큐가 가득 차면 ``put``이 막히므로 fetch 속도가 색인
+    속도에 맞춰진다.
+
+    한 페이지의 이슈는 항상 같은 bulk 요청에 들어간다. bulk 요청에서 일부라도
+    저장에 실패하면 그 요청에 담긴 페이지를 모두 실패로 기록해 재시도하게 한다
+    (문서 ID로 저장하므로 다시 저장해도 중복되지 않는다).
+    """
+
+    def __init__(
+        self,
+        repo: SeeClickFixRepository,
+        tracker: Optional[WatermarkTracker] = None,
+        manifest: Optional[PageManifest] = None,
+        bulk_size: int = BULK_SIZE,
+        bulk_bytes: int = BULK_BYTES,
+        queue_size: int = 10,
+    ):
+        """초기화
+
+        Args:
+            repo (SeeClickFixRepository): 저장소
+            tracker (Optional[WatermarkTracker], optional): 워터마크 추적기
+            manifest (Optional[PageManifest], optional): 페이지 매니페스트
+            bulk_size (int, optional): bulk 요청당 최대 이슈 수. Defaults to BULK_SIZE.
+            bulk_bytes (int, optional): bulk 요청당 최대 원본 바이트 수. Defaults to BULK_BYTES.
+            queue_size (int, optional): 색인을 기다릴 수 있는 최대 페이지 수. Defaults to 10.
+        """
+        self.repo = repo
+        self.tracker = tracker
+        self.manifest = manifest
+        self.bulk_size = bulk_size
+        self.bulk_bytes = bulk_bytes
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._batch: List[_QueuedPage] = []
+        self._batch_docs = 0
+        self._batch_bytes = 0
+        # 통계
+        self.saved = 0
+        self.bulk_requests = 0
+
+    def start(self) -> "IndexingStage":
+        self._thread.start()
+        return self
+
+    def put(self, page_num: int, body: bytes, page: ParsedPage) -> None:
+        """페이지를 색인 큐에 넣는다. 큐가 가득 차면 자리가 날 때까지 기다린다."""
+        self.queue.put(_QueuedPage(page_num, page, page_checksum(body), len(body)))
+
+    def flush(self) -> None:
+        """지금까지 넣은 페이지가 모두 저장되고 기록될 때까지 기다린다."""
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """남은 페이지를 저장하고 색인 스레드를 종료한다."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+
+    def __enter__(self) -> "IndexingStage":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self._flush_batch()
+                return
+            if isinstance(item, threading.Event):
+                self._flush_batch()
+                item.set()
+                continue
+
+            self._batch.append(item)
+            self._batch_docs += len(item.page.issues)
+            self._batch_bytes += item.nbytes
+            if (
+                self._batch_docs >= self.bulk_size
+                or self._batch_bytes >= self.bulk_bytes
+            ):
+                self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        batch, self._batch = self._batch, []
+        self._batch_docs = self._batch_bytes = 0
+        if not batch:
+            return
+
+        docs = [issue for item in batch for issue in item.page.issues]
+        error = None
+        if docs:
+            try:
+                saved_count = self.repo.bulk_save_issues(docs)
+            except Exception as e:
+                saved_count, error = 0, f"bulk 저장 중 오류: {e}"
+            self.saved += saved_count
+            self.bulk_requests += 1
+            logger.info(
+                f"bulk 저장 완료: {saved_count}/{len(docs)} 이슈 ({len(batch)} 페이지)"
+            )
+            if error is None and saved_count < len(docs):
+                error = f"bulk 요청에서 {saved_count}/{len(docs)} 이슈만 저장됨"
+
+        for item in batch:
+            _record_page(
+                item.page_num,
+                item.page,
+                item.checksum,
+                error,
+                self.tracker,
+                self.manifest,
+            )
+
+
 def process_page(
-    page_num: int, base_url: str, params: Dict[str, Any], repo: SeeClickFixRepository
+    page_num: int,
+    base_url: str,
+    params: Dict[str, Any],
+    repo: SeeClickFixRepository,
+    client: HttpClient,
+    tracker: Optional[WatermarkTracker] = None,
+    manifest: Optional[PageManifest] = None,
+    indexer: Optional[IndexingStage] = None,
 ) -> int:
-    """단일 페이지를 처리하는 함수"""
+    """단일 페이지를 처리하는 함수
+
+    ``indexer``를 주면 저장을 색인 단계에 넘기고 넘긴 이슈 수를 반환한다
+    (실제 저장 수는 ``indexer.saved``).
+    """
     page_params = params.copy()
     page_params["page"] = page_num
 
-    page_data = fetch_page(base_url, page_params)
-    if not page_data or "issues" not in page_data:
+    body = client.fetch_raw(base_url, page_params)
+    page = parse_page(body)
+    if page is None:
         logger.error(f"페이지 {page_num} 가져오기 실패")
+        if manifest is not None:
+            manifest.mark_failed(page_num, "페이지 가져오기 실패")
         return 0
 
-    # 로컬 파일에 원본 데이터 저장
-    save_to_file(page_data, page_num)
+    if indexer is None:
+        return _store_page(page_num, body, page, repo, tracker, manifest)
 
-    # 데이터 변환 및 저장
-    issues = [transform_issue(issue) for issue in page_data.get("issues", [])]
-    if issues:
-        saved_count = repo.bulk_save_issues(issues)
-        logger.info(f"저장 완료: {saved_count}/{len(issues)} 이슈 (페이지 {page_num})")
-        return saved_count
-    return 0
+    # 로컬 파일에 원본 데이터 저장 후 색인 단계로 넘김
+    save_to_file(body, page_num)
+    indexer.put(page_num, body, page)
+    return len(page.issues)
+
+
+def _check_page_range(
+    pages: Optional[PageShard], shard: Optional[Tuple[int, int]]
+) -> None:
+    """pages/shard 인자를 확인한다."""
+    if pages is not None and shard is not None:
+        raise ValueError("pages와 shard 중 하나만 지정해야 합니다.")
+    if shard is not None and not 0 <= shard[0] < shard[1]:
+        raise ValueError(f"잘못된 샤드입니다: {shard}")
+
+
+@dataclass
+class _PagePlan:
+    """수집할 페이지 번호와 그 결과를 기록하는 매니페스트"""
+
+    page_nums: List[int]
+    manifest: PageManifest
+
+    def pending(self, skip: Optional[int] = None) -> List[int]:
+        """아직 완료되지 않은 페이지 (skip 제외)"""
+        return [p for p in self.page_nums if p != skip and not self.manifest.is_done(p)]
+
+
+def _plan_pages(
+    first_page: ParsedPage,
+    params: Dict[str, Any],
+    pages: Optional[PageShard],
+    shard: Optional[Tuple[int, int]],
+    max_pages: Optional[int],
+    manifest: Optional[PageManifest],
+    resume: bool,
+) -> Optional[_PagePlan]:
+    """첫 페이지의 pagination으로 받을 페이지를 정하고 매니페스트를 시작한다.
+
+    스레드 경로와 asyncio 경로가 같은 페이지를 같은 매니페스트에 기록하도록 함께
+    쓴다. 샤드에 해당하는 페이지가 없으면 None을 돌려준다.
+    """
+    # 나눠 받는 범위는 빠짐없이 받아야 하므로 max_pages로 제한하지 않는다
+    sharded = pages is not None or shard is not None
+    total_pages = _total_pages(first_page, None if sharded else max_pages)
+
+    manifest_params = params
+    manifest_name = MANIFEST_FILENAME
+    if shard is not None:
+        if shard[0] >= min(shard[1], total_pages):
+            logger.info(f"샤드 {shard}에 해당하는 페이지가 없습니다.")
+            return None
+        pages = PageShard.split(total_pages, shard[1])[shard[0]]
+    if pages is not None:
+        manifest_params = dict(params, pages=f"{pages.first}-{pages.last}")
+        manifest_name = f"manifest-{pages.first}-{pages.last}.jsonl"
+        page_nums = list(pages.pages(total_pages))
+        logger.info(
+            f"샤드 수집: 페이지 {pages.first}-{pages.last} / 전체 {total_pages}"
+        )
+    else:
+        page_nums = list(range(1, total_pages + 1))
+
+    manifest = manifest or PageManifest(DATA_DIR / manifest_name)
+    completed = manifest.start(manifest_params, resume=resume)
+    if completed:
+        logger.info(f"매니페스트에서 완료된 {completed}개 페이지를 건너뜁니다.")
+    return _PagePlan(page_nums, manifest)
 
 
-def collect_all_issues(repository: Optional[SeeClickFixRepository] = None) -> int:
-    """모든 페이지의 데이터를 가져와 Elasticsearch에 저장합니다."""
+def _report_failed_pages(
+    page_range: List[int], manifest: PageManifest, sharded: bool
+) -> None:
+    """재시도 뒤에도 남은 실패 페이지를 알린다 (샤드면 RuntimeError)."""
+    if not page_range:
+        return
+    message = (
+        f"{len(page_range)}개 페이지 수집 실패 ({manifest.path}). "
+        "resume=True로 다시 실행하면 완료된 페이지를 건너뛰고 이어서 받습니다."
+    )
+    # 샤드는 예외로 알려야 Airflow 재시도나 collect_sharded가 실패를 안다
+    if sharded:
+        raise RuntimeError(message)
+    logger.warning(message)
+
+
+def collect_all_issues(
+    repository: Optional[SeeClickFixRepository] = None,
+    client: Optional[HttpClient] = None,
+    max_workers: int = 5,
+    incremental: bool = False,
+    watermarks: Optional[WatermarkStore] = None,
+    resume: bool = False,
+    retry_passes: int = 2,
+    manifest: Optional[PageManifest] = None,
+    bulk_size: int = BULK_SIZE,
+    bulk_bytes: int = BULK_BYTES,
+    queue_size: Optional[int] = None,
+    pages: Optional[PageShard] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    rate: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    max_pages: Optional[int] = None,
+) -> int:
+    """모든 페이지의 데이터를 가져와 Elasticsearch에 저장합니다.
+
+    모든 페이지 요청은 작업자 수만큼의 연결을 가진 HttpClient 하나와
+    RateLimiter 하나를 공유한다. RateLimiter는 초당 ``rate``개로 요청을 제한하고
+    ``max_workers``개의 동시 요청으로 시작한다. 429 응답을 받으면 모든 작업자가
+    함께 쉬고 동시 요청 수를 줄였다가, 성공하는 만큼 ``max_concurrency``까지 다시
+    늘린다. 응답은 페이지 캐시에
+    저장되고, 다음 실행부터는 조건부 GET으로 바뀌지 않은 페이지를 다시 받지 않는다.
+
+    ``incremental=True``이면 ``PLACE_URL``/``STATUS``의 워터마크 이후에 바뀐
+    이슈만 ``updated_at`` 오름차순으로 요청한다. 페이지 번호 대신 앞 페이지의
+    마지막 ``updated_at``을 다음 요청의 ``updated_at_after``로 쓰는 키셋
+    페이지네이션으로 한 페이지씩 받으므로, 수집 중에 바뀐 이슈가 있어도 빠지지
+    않는다 (_collect_changes 참고). 모든 페이지를 받은 경우에만 본 이슈 중 가장 늦은
+    ``updated_at`` (없으면 ``created_at``)으로 워터마크를 올리므로, 실패한 실행은
+    다음 실행에서 같은 워터마크부터 다시 받는다. ``max_workers``는 연결 풀 크기에만
+    쓰인다.
+
+    페이지마다 상태, 이슈 수, 체크섬을 매니페스트에 기록한다. 첫 번째 패스에서
+    실패한 페이지는 ``retry_passes``번까지 다시 시도하고, 그래도 남은 실패는
+    ``resume=True``로 다시 실행하면 완료된 페이지를 건너뛰고 이어서 받는다.
+    증분 수집은 워터마크가 이어받기 역할을 하므로 ``resume``을 무시하고, 별도의
+    매니페스트를 써서 중단된 전체 수집의 이어받기 상태를 건드리지 않는다.
+
+    페이지를 받는 작업자와 Elasticsearch 색인은 IndexingStage로 분리되어 있다.
+    작업자는 변환된 페이지를 큐에 넣고, 색인 스레드가 여러 페이지를 모아
+    ``bulk_size``/``bulk_bytes`` 단위로 저장한다. 색인이 밀리면 큐가 차서 작업자가
+    기다린다.
+
+    ``pages``나 ``shard``를 주면 전체 아카이브(pagination의 모든 페이지) 중 그
+    범위만 수집한다. 샤드마다 별도의 매니페스트를 쓰므로 여러 프로세스나
+    Airflow 태스크가 나눠 수집할 수 있다 (collect_sharded 참고). 샤드는 실패하면
+    0을 돌려주는 대신 RuntimeError를 발생시켜 재시도되게 한다.
+
+    Args:
+        repository (Optional[SeeClickFixRepository], optional): 저장소
+        client (Optional[HttpClient], optional): 공유할 HTTP 클라이언트.
+            Defaults to None (max_workers 크기의 풀, RateLimiter, 페이지 캐시를 만들고
+            끝나면 닫는다).
+        max_workers (int, optional): 동시에 요청할 작업자 수 (너무 많으면 API 제한에 걸릴 수 있음).
+            Defaults to 5.
+        incremental (bool, optional): 워터마크 이후 바뀐 이슈만 수집할지 여부. Defaults to False.
+        watermarks (Optional[WatermarkStore], optional): 워터마크 저장소.
+            Defaults to None (DATA_DIR의 워터마크 파일).
+        resume (bool, optional): 매니페스트에서 완료된 페이지를 건너뛸지 여부.
+            Defaults to False (새 매니페스트로 시작).
+        retry_passes (int, optional): 실패한 페이지를 다시 시도할 횟수. Defaults to 2.
+        manifest (Optional[PageManifest], optional): 페이지 매니페스트.
+            Defaults to None (DATA_DIR의 매니페스트 파일).
+        bulk_size (int, optional): bulk 요청당 최대 이슈 수. Defaults to BULK_SIZE.
+        bulk_bytes (int, optional): bulk 요청당 최대 원본 바이트 수. Defaults to BULK_BYTES.
+        queue_size (Optional[int], optional): 색인을 기다릴 수 있는 최대 페이지 수.
+            Defaults to None (max_workers의 2배).
+        pages (Optional[PageShard], optional): 수집할 페이지 범위. Defaults to None.
+        shard (Optional[Tuple[int, int]], optional): (샤드 번호, 샤드 수). 전체 페이지를
+            PageShard.split으로 나눈 범위 중 하나만 수집한다. Defaults to None.
+        rate (Optional[float], optional): client를 만들 때 RateLimiter의 초당 요청 수
+            (0이면 제한 없음). Defaults to None (REQUEST_RATE).
+        max_concurrency (Optional[int], optional): 동시 요청 수 상한 (작업자 스레드와
+            연결 수). Defaults to None (client를 만들면 max_workers의
+            CONCURRENCY_HEADROOM배, 아니면 max_workers).
+        max_pages (Optional[int], optional): 전체 수집에서 받을 최대 페이지 수 (증분/샤드
+            수집에는 적용하지 않음). Defaults to None (pagination의 모든 페이지).
+
+    Returns:
+        int: 저장된 이슈 수
+
+    Raises:
+        ValueError: pages와 shard를 함께 주거나, 증분 수집을 샤드로 나누려는 경우
+        RuntimeError: 샤드 수집에서 인덱스나 첫 페이지를 준비하지 못했거나, 재시도
+            뒤에도 실패한 페이지가 남은 경우
+    """
+    _check_page_range(pages, shard)
+    sharded = pages is not None or shard is not None
+    if sharded and incremental:
+        raise ValueError("증분 수집은 샤드로 나눌 수 없습니다.")
+
+    if client is None:
+        max_concurrency = max_concurrency or max_workers * CONCURRENCY_HEADROOM
+        rate_limiter = RateLimiter(
+            rate=REQUEST_RATE if rate is None else rate,
+            initial_concurrency=max_workers,
+            max_concurrency=max(max_workers, max_concurrency),
+        )
+        with HttpClient(
+            max_connections=max(max_workers, max_concurrency),
+            rate_limiter=rate_limiter,
+            cache=PageCache(DATA_DIR / CACHE_DIRNAME),
+        ) as client:
+            return collect_all_issues(
+                repository,
+                client,
+                max_workers,
+                incremental,
+                watermarks,
+                resume,
+                retry_passes,
+                manifest,
+                bulk_size,
+                bulk_bytes,
+                queue_size,
+                pages,
+                shard,
+                rate,
+                max_concurrency,
+                max_pages,
+            )
+
     logger.info("Starting data collection from SeeClickFix API...")
 
     # 저장소 초기화
-    repo = repository or SeeClickFixRepository()
-    if not repo.check_connection():
-        logger.error("Elasticsearch 연결 실패. 데이터 수집을 중단합니다.")
+    repo = repository or _default_repository()
+    if not _prepare_repository(repo):
+        if sharded:
+            raise RuntimeError("Elasticsearch 인덱스를 준비하지 못했습니다.")
         return 0
 
-    # 인덱스 매핑 설정
-    if not repo.setup_index_mapping():
-        logger.error("인덱스 매핑 설정 실패. 데이터 수집을 중단합니다.")
-        return 0
+    if incremental:
+        return _collect_changes(
+            repo,
+            client,
+            watermarks,
+            retry_passes,
+            manifest,
+            bulk_size,
+            bulk_bytes,
+            queue_size or 2 * max_workers,
+        )
 
-    # 첫 페이지를 가져와 총 페이지 수 확인
-    params = {"place_url": PLACE_URL, "per_page": PER_PAGE, "status": STATUS, "page": 1}
+    # 첫 페이지(샤드면 범위의 첫 페이지)를 가져와 총 페이지 수 확인
+    first_num = pages.first if pages is not None else 1
+    params = _page_params(first_num)
 
-    first_page = fetch_page(BASE_URL, params)
-    if not first_page or "metadata" not in first_page:
+    first_body = client.fetch_raw(BASE_URL, params)
+    first_page = parse_page(first_body)
+    if first_page is None or "pagination" not in first_page.metadata:
+        if sharded:
+            raise RuntimeError("첫 번째 페이지 가져오기 실패 또는 응답 형식 오류")
         logger.error("첫 번째 페이지 가져오기 실패 또는 응답 형식 오류")
         return 0
 
-    pagination = first_page["metadata"]["pagination"]
-    # 기본적으로 3273개의 pages가 존재한다. 하지만 이렇게 돌릴 경우 너무 시간이 오래 걸리기에 100정도로 낮춰서 테스트해본다.
-    # total_pages = pagination["pages"]
-    # logger.info(f"총 페이지: {total_pages}")
-
-    total_pages = 50
+    plan = _plan_pages(first_page, params, pages, shard, max_pages, manifest, resume)
+    if plan is None:
+        return 0
+    page_nums, manifest = plan.page_nums, plan.manifest
 
-    # 첫 페이지 처리
-    save_to_file(first_page, 1)
-    issues = [transform_issue(issue) for issue in first_page.get("issues", [])]
-    total_processed = 0
-    if issues:
-        saved_count = repo.bulk_save_issues(issues)
-        logger.info(f"첫 페이지 저장 완료: {saved_count}/{len(issues)} 이슈")
-        total_processed += saved_count
-
-    # 페이지 범위 설정 (첫 페이지는 이미 처리했으므로 2부터 시작)
-    page_range = range(2, total_pages + 1)
-
-    # 작업자 수 설정 (너무 많으면 API 제한에 걸릴 수 있음)
-    max_workers = 5
-
-    # 진행 상황 표시 초기화
-    print_progress_bar(
-        1,
-        total_pages,
-        prefix="데이터 수집:",
-        suffix=f"1/{total_pages} 페이지",
-        length=50,
+    indexer = IndexingStage(
+        repo,
+        manifest=manifest,
+        bulk_size=bulk_size,
+        bulk_bytes=bulk_bytes,
+        queue_size=queue_size or 2 * max_workers,
     )
 
-    # 처리된 페이지 수 카운터
-    processed_pages = 1  # 첫 페이지는 이미 처리함
+    # 페이지 범위 설정 (첫 페이지는 이미 받았으므로 제외)
+    page_range = plan.pending(skip=first_num)
+
+    # 진행 상황 표시 초기화 (일정 간격으로만 다시 그림)
+    progress = ProgressReporter(
+        total=len(page_nums), prefix="데이터 수집:", suffix="페이지"
+    )
+    # 첫 페이지와 이전 실행에서 완료된 페이지는 이미 처리함
+    progress.update(len(page_nums) - len(page_range))
 
     # 부분 함수로 process_page 함수의 일부 인자 고정
-    process_func = partial(process_page, base_url=BASE_URL, params=params, repo=repo)
+    process_func = partial(
+        process_page,
+        base_url=BASE_URL,
+        params=params,
+        repo=repo,
+        client=client,
+        manifest=manifest,
+        indexer=indexer,
+    )
 
-    # ThreadPoolExecutor를 사용한 병렬 처리
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # 페이지 번호를 작업으로 제출
-        future_to_page = {
-            executor.submit(process_func, page_num): page_num for page_num in page_range
-        }
+    # ThreadPoolExecutor를 사용한 병렬 처리 (실제 동시 요청 수는 RateLimiter가 정한다)
+    with indexer, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(max_workers, max_concurrency or max_workers)
+    ) as executor:
+        # 첫 페이지 처리
+        if first_num in page_nums and not manifest.is_done(first_num):
+            save_to_file(first_body, first_num)
+            indexer.put(first_num, first_body, first_page)
+
+        for attempt in range(retry_passes + 1):
+            if attempt:
+                logger.info(
+                    f"재시도 {attempt}/{retry_passes}: 실패한 페이지 {len(page_range)}개"
+                )
 
-        # 완료된 작업 처리
-        for future in concurrent.futures.as_completed(future_to_page):
-            page_num = future_to_page[future]
+            # 페이지 번호를 작업으로 제출
+            future_to_page = {
+                executor.submit(process_func, page_num): page_num
+                for page_num in page_range
+            }
+
+            # 완료된 작업 처리
+            for future in concurrent.futures.as_completed(future_to_page):
+                page_num = future_to_page[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
+                    manifest.mark_failed(page_num, str(e))
+
+                # 진행 상황 업데이트 (재시도는 이미 센 페이지)
+                if not attempt:
+                    progress.update(1)
+
+            # 이번 패스의 페이지가 모두 저장되고 기록된 뒤 실패한 페이지를 고른다
+            indexer.flush()
+            page_range = plan.pending()
+            if not page_range:
+                break
+
+    stats = progress.close()
+    total_processed = indexer.saved
+    _report_failed_pages(page_range, manifest, sharded)
+
+    # 최종 저장된 항목 수 확인
+    final_count = repo.count_issues()
+    logger.info(
+        f"데이터 수집 완료. 총 {len(page_nums)} 페이지, {total_processed} 이슈 처리됨 "
+        f"({stats.elapsed:.1f}초, {stats.rate:.2f} 페이지/초, "
+        f"bulk 요청 {indexer.bulk_requests}회)"
+    )
+    if isinstance(repo, SeeClickFixRepository) and repo.fingerprints is not None:
+        logger.info(f"그중 변경 없어 다시 보내지 않은 이슈: {repo.skipped}")
+    logger.info(f"Elasticsearch에 저장된 총 이슈 수: {final_count}")
+
+    return total_processed
+
+
+def _collect_changes(
+    repo: SeeClickFixRepository,
+    client: HttpClient,
+    watermarks: Optional[WatermarkStore],
+    retry_passes: int,
+    manifest: Optional[PageManifest],
+    bulk_size: int,
+    bulk_bytes: int,
+    queue_size: int,
+) -> int:
+    """워터마크 이후 바뀐 이슈를 키셋 페이지네이션으로 한 페이지씩 수집한다.
+
+    페이지 번호로 나눠 동시에 받으면 수집 중에 바뀐 이슈가 결과의 끝으로 옮겨 갈 때
+    뒤의 이슈가 한 칸씩 당겨져 페이지 경계에서 빠지고, 워터마크가 그 이슈를 넘어
+    올라가 다시는 받지 못한다. 그래서 각 요청은 앞 페이지에서 본 가장 늦은
+    updated_at(커서)을 ``KEYSET_OVERLAP``초 앞당긴 ``updated_at_after``로 받고,
+    이미 본 (id, updated_at)은 건너뛴다. 커서가 그대로인 페이지(같은 시각의 이슈가
+    한 페이지를 넘는 경우)에서만 페이지 번호를 늘린다.
+
+    마지막 페이지까지 받고 모두 저장된 경우에만 워터마크를 올린다.
+
+    Returns:
+        int: 저장된 이슈 수
+    """
+    watermarks = watermarks or WatermarkStore(DATA_DIR / WATERMARK_FILENAME)
+    since = watermarks.get(PLACE_URL, STATUS)
+    logger.info(f"증분 수집: {since or '워터마크 없음 (전체 수집)'} 이후 변경분")
+    params = _incremental_params(_page_params(), since)
+
+    manifest = manifest or PageManifest(DATA_DIR / INCREMENTAL_MANIFEST_FILENAME)
+    manifest.start(params, resume=False)
+    tracker = WatermarkTracker()
+    indexer = IndexingStage(
+        repo,
+        tracker,
+        manifest,
+        bulk_size=bulk_size,
+        bulk_bytes=bulk_bytes,
+        queue_size=queue_size,
+    )
+    progress = ProgressReporter(prefix="증분 수집:", suffix="페이지")
+
+    seen: Set[Tuple[Any, Optional[str]]] = set()
+    cursor, offset, page_num, complete = since, 1, 0, False
+    with indexer:
+        while True:
+            page_params = dict(params, page=offset)
+            if cursor != since:
+                page_params["updated_at_after"] = rewind_timestamp(
+                    cursor, KEYSET_OVERLAP
+                )
+            page_num += 1
+            body, page = _fetch_page_with_retries(client, page_params, retry_passes)
+            if page is None:
+                manifest.mark_failed(page_num, "페이지 가져오기 실패")
+                break
+
+            new = []
+            for issue in page.issues:
+                key = (issue.get("id"), issue_timestamp(issue))
+                if key not in seen:
+                    seen.add(key)
+                    new.append(transform_issue(issue))
+            save_to_file(body, page_num)
+            indexer.put(page_num, body, ParsedPage(new, page.metadata, page.latest))
+            progress.update(1)
+
+            if not page.issues or page.metadata["pagination"]["pages"] <= offset:
+                complete = True
+                break
+            if page.latest is not None and page.latest != cursor:
+                cursor, offset = page.latest, 1
+            else:
+                offset += 1
+
+    stats = progress.close()
+    if complete and tracker.pages == page_num:
+        watermarks.advance(PLACE_URL, STATUS, tracker.latest)
+        if client.cache is not None:
+            compact_page_cache(client.cache)
+    else:
+        logger.warning(
+            f"증분 수집 실패 ({manifest.path}). 워터마크를 유지하고 다음 실행에서 "
+            "같은 워터마크부터 다시 받습니다."
+        )
+
+    logger.info(
+        f"증분 수집 완료. {page_num} 페이지, {indexer.saved} 이슈 처리됨 "
+        f"({stats.elapsed:.1f}초, bulk 요청 {indexer.bulk_requests}회)"
+    )
+    return indexer.saved
+
+
+def _fetch_page_with_retries(
+    client: HttpClient, params: Dict[str, Any], retry_passes: int
+) -> Tuple[Optional[bytes], Optional[ParsedPage]]:
+    """페이지를 원본 이슈 그대로 읽는다. 실패하면 retry_passes번까지 다시 요청한다."""
+    for attempt in range(retry_passes + 1):
+        if attempt:
+            logger.info(f"재시도 {attempt}/{retry_passes}: 페이지 {params['page']}")
+        body = client.fetch_raw(BASE_URL, params)
+        page = parse_page(body, transform=False)
+        if page is not None and "pagination" in page.metadata:
+            return body, page
+        logger.error(f"페이지 {params['page']} 가져오기 실패 또는 응답 형식 오류")
+    return None, None
+
+
+def discover_total_pages(client: Optional[HttpClient] = None) -> int:
+    """첫 페이지의 pagination 정보로 전체 아카이브의 페이지 수를 확인합니다.
+
+    Raises:
+        ValueError: 첫 페이지를 가져오지 못했거나 pagination 정보가 없는 경우
+    """
+    if client is None:
+        with HttpClient(cache=PageCache(DATA_DIR / CACHE_DIRNAME)) as client:
+            return discover_total_pages(client)
+
+    page = parse_page(client.fetch_raw(BASE_URL, _page_params()))
+    if page is None or "pagination" not in page.metadata:
+        raise ValueError("첫 번째 페이지 가져오기 실패 또는 응답 형식 오류")
+    return page.metadata["pagination"]["pages"]
+
+
+def merge_shard_counts(counts: Iterable[Optional[int]]) -> int:
+    """샤드별 저장 이슈 수를 합친다 (실패해 결과가 없는 샤드는 0)."""
+    return sum(count or 0 for count in counts)
+
+
+def collect_sharded(
+    shards: int = 4,
+    max_workers: int = 5,
+    repository: Optional[SeeClickFixRepository] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    resume: bool = False,
+) -> int:
+    """전체 아카이브를 shards개의 페이지 범위로 나눠 병렬로 수집합니다.
+
+    첫 페이지로 전체 페이지 수를 확인해 PageShard.split으로 나누고, 인덱스를 한 번
+    만든 뒤 샤드마다 collect_all_issues를 실행하고 저장 수를 합친다. 기본적으로
+    샤드마다 별도 프로세스에서 실행하며, 각 프로세스는 자기 HttpClient와
+    RateLimiter를 쓰므로 API에 보내는 동시 요청 수는 최대 ``shards * max_workers``개다.
+    실패한 샤드가 있으면 모든 샤드가 끝난 뒤 RuntimeError를 발생시키고, 같은 인자에
+    ``resume=True``로 다시 실행하면 샤드별 매니페스트에서 이어서 받는다.
+
+    Args:
+        shards (int, optional): 샤드 수. Defaults to 4.
+        max_workers (int, optional): 샤드당 작업자 수. Defaults to 5.
+        repository (Optional[SeeClickFixRepository], optional): 저장소. 프로세스로 실행하면
+            전달할 수 없으므로 각 샤드가 새로 만든다. Defaults to None.
+        executor (Optional[concurrent.futures.Executor], optional): 샤드를 실행할 executor.
+            Defaults to None (샤드 수만큼의 ProcessPoolExecutor).
+        resume (bool, optional): 샤드별 매니페스트에서 완료된 페이지를 건너뛸지 여부.
+            Defaults to False.
+
+    Returns:
+        int: 모든 샤드에서 저장된 이슈 수
+
+    Raises:
+        RuntimeError: 인덱스를 준비하지 못했거나 실패한 샤드가 있는 경우
+    """
+    total_pages = discover_total_pages()
+    plan = PageShard.split(total_pages, shards)
+    logger.info(f"전체 {total_pages} 페이지를 {len(plan)}개 샤드로 나눠 수집합니다.")
+    prepare_index(repository)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=len(plan))
+    counts: Dict[PageShard, Optional[int]] = {}
+    try:
+        future_to_shard = {
+            executor.submit(
+                collect_all_issues,
+                repository,
+                max_workers=max_workers,
+                resume=resume,
+                pages=page_shard,
+            ): page_shard
+            for page_shard in plan
+        }
+        for future in concurrent.futures.as_completed(future_to_shard):
+            page_shard = future_to_shard[future]
             try:
-                saved_count = future.result()
-                total_processed += saved_count
+                counts[page_shard] = future.result()
             except Exception as e:
-                logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
-
-            # 진행 상황 업데이트
-            processed_pages += 1
-            print_progress_bar(
-                processed_pages,
-                total_pages,
-                prefix="데이터 수집:",
-                suffix=f"{processed_pages}/{total_pages} 페이지",
-                length=50,
+                logger.error(
+                    f"샤드 {page_shard.first}-{page_shard.last} 수집 중 오류: {e}"
+                )
+                counts[page_shard] = None
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    total = merge_shard_counts(counts.values())
+    failed = [f"{p.first}-{p.last}" for p, count in counts.items() if count is None]
+    if failed:
+        raise RuntimeError(
+            f"실패한 샤드: {', '.join(failed)} (저장된 이슈 {total}개). "
+            "resume=True로 다시 실행하세요."
+        )
+    logger.info(f"샤드 수집 완료. {len(plan)}개 샤드, {total} 이슈 처리됨")
+    return total
+
+
+def collect_shard(
+    pages: PageShard,
+    run_id: str,
+    attempt: int = 1,
+    max_workers: int = 5,
+    repository: Optional[SeeClickFixRepository] = None,
+) -> int:
+    """스케줄러(Airflow) 실행 하나에 속한 샤드 태스크를 수집합니다.
+
+    매니페스트는 실행(run_id)과 샤드마다 따로 쓰고, 같은 실행의 재시도
+    (``attempt > 1``)에서만 완료된 페이지를 건너뛴다. 샤드를 끝까지 받으면
+    매니페스트를 지우므로, 다음 실행은 (같은 run_id로 다시 실행해도) 처음부터
+    다시 수집한다.
+
+    Args:
+        pages (PageShard): 수집할 페이지 범위
+        run_id (str): 실행 ID
+        attempt (int, optional): 이 실행에서 몇 번째 시도인지 (1부터). Defaults to 1.
+        max_workers (int, optional): 작업자 수. Defaults to 5.
+        repository (Optional[SeeClickFixRepository], optional): 저장소. Defaults to None.
+
+    Returns:
+        int: 저장된 이슈 수
+
+    Raises:
+        RuntimeError: 실패한 페이지가 남은 경우 (매니페스트는 재시도를 위해 남긴다)
+    """
+    run_key = re.sub(r"[^A-Za-z0-9_.-]", "_", run_id)
+    manifest = PageManifest(
+        DATA_DIR / f"manifest-{pages.first}-{pages.last}-{run_key}.jsonl"
+    )
+    saved = collect_all_issues(
+        repository,
+        max_workers=max_workers,
+        resume=attempt > 1,
+        manifest=manifest,
+        pages=pages,
+    )
+    manifest.path.unlink(missing_ok=True)
+    return saved
+
+
+async def process_page_async(
+    page_num: int,
+    base_url: str,
+    params: Dict[str, Any],
+    repo: SeeClickFixRepository,
+    client: AsyncHttpClient,
+    es_client,
+    manifest: Optional[PageManifest] = None,
+) -> int:
+    """단일 페이지를 처리하는 코루틴 (process_page의 asyncio 버전)"""
+    page_params = params.copy()
+    page_params["page"] = page_num
+
+    body = await client.fetch_raw(base_url, page_params)
+    page = parse_page(body)
+    if page is None:
+        logger.error(f"페이지 {page_num} 가져오기 실패")
+        if manifest is not None:
+            await asyncio.to_thread(
+                manifest.mark_failed, page_num, "페이지 가져오기 실패"
             )
+        return 0
 
-    # 최종 저장된 항목 수 확인
-    final_count = repo.count_issues()
+    return await _store_page_async(page_num, body, page, repo, es_client, manifest)
+
+
+async def _store_page_async(
+    page_num: int,
+    body: bytes,
+    page: ParsedPage,
+    repo: SeeClickFixRepository,
+    es_client,
+    manifest: Optional[PageManifest] = None,
+) -> int:
+    """_store_page의 asyncio 버전"""
+    # 로컬 파일에 원본 데이터 저장 (파일 쓰기가 이벤트 루프를 막지 않도록 스레드에서)
+    await asyncio.to_thread(save_to_file, body, page_num)
+
+    issues = page.issues
+    saved_count = 0
+    if issues:
+        saved_count = await repo.async_bulk_save_issues(es_client, issues)
+        logger.info(f"저장 완료: {saved_count}/{len(issues)} 이슈 (페이지 {page_num})")
+
+    error = None
+    if saved_count < len(issues):
+        error = f"{saved_count}/{len(issues)} 이슈만 저장됨"
+    await asyncio.to_thread(
+        _record_page, page_num, page, page_checksum(body), error, None, manifest
+    )
+    return saved_count
+
+
+async def collect_all_issues_async(
+    repository: Optional[SeeClickFixRepository] = None,
+    client: Optional[AsyncHttpClient] = None,
+    concurrency: int = 100,
+    max_pages: Optional[int] = None,
+    resume: bool = False,
+    retry_passes: int = 2,
+    manifest: Optional[PageManifest] = None,
+    pages: Optional[PageShard] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> int:
+    """모든 페이지의 데이터를 asyncio로 가져와 Elasticsearch에 저장합니다.
+
+    스레드 대신 하나의 이벤트 루프에서 최대 ``concurrency``개의 페이지를 동시에
+    처리한다. 공유 RateLimiter가 10개에서 시작해 429 응답과 성공에 맞춰 실제 동시
+    요청 수를 조절한다. 받을 페이지, 매니페스트, 재시도 패스, 이어받기, 샤드 범위는
+    collect_all_issues와 같은 규칙(_plan_pages)을 따르므로 두 경로가 같은 매니페스트를
+    이어받을 수 있다. ``asyncio.run(collect_all_issues_async())``로 실행한다.
+
+    전체 수집만 지원한다. 증분 수집(워터마크, 키셋 페이지네이션)은 한 페이지씩
+    차례로 받으므로 동시 요청의 이점이 없어 collect_all_issues(incremental=True)로만
+    실행한다. 또 IndexingStage를 쓰지 않고 페이지마다 비동기 bulk 요청을 하나씩 보낸다.
+
+    Args:
+        repository (Optional[SeeClickFixRepository], optional): 저장소
+        client (Optional[AsyncHttpClient], optional): 공유할 HTTP 클라이언트.
+            Defaults to None (concurrency 크기의 풀, RateLimiter, 페이지 캐시를 만들고
+            끝나면 닫는다).
+        concurrency (int, optional): 동시에 처리할 최대 페이지 수. Defaults to 100.
+        max_pages (Optional[int], optional): 받을 최대 페이지 수 (샤드 수집에는 적용하지
+            않음). Defaults to None (pagination의 모든 페이지).
+        resume (bool, optional): 매니페스트에서 완료된 페이지를 건너뛸지 여부.
+            Defaults to False (새 매니페스트로 시작).
+        retry_passes (int, optional): 실패한 페이지를 다시 시도할 횟수. Defaults to 2.
+        manifest (Optional[PageManifest], optional): 페이지 매니페스트.
+            Defaults to None (DATA_DIR의 매니페스트 파일).
+        pages (Optional[PageShard], optional): 수집할 페이지 범위. Defaults to None.
+        shard (Optional[Tuple[int, int]], optional): (샤드 번호, 샤드 수).
+            Defaults to None.
+
+    Returns:
+        int: 저장된 이슈 수
+
+    Raises:
+        ValueError: pages와 shard를 함께 주거나 샤드가 잘못된 경우
+        RuntimeError: 샤드 수집에서 인덱스나 첫 페이지를 준비하지 못했거나, 재시도
+            뒤에도 실패한 페이지가 남은 경우
+    """
+    _check_page_range(pages, shard)
+    sharded = pages is not None or shard is not None
+
+    if client is None:
+        rate_limiter = RateLimiter(
+            initial_concurrency=min(10, concurrency), max_concurrency=concurrency
+        )
+        async with AsyncHttpClient(
+            max_connections=concurrency,
+            rate_limiter=rate_limiter,
+            cache=PageCache(DATA_DIR / CACHE_DIRNAME),
+        ) as client:
+            return await collect_all_issues_async(
+                repository,
+                client,
+                concurrency,
+                max_pages,
+                resume,
+                retry_passes,
+                manifest,
+                pages,
+                shard,
+            )
+
+    logger.info("Starting async data collection from SeeClickFix API...")
+
+    # Elasticsearch 동기 호출은 이벤트 루프를 막지 않도록 스레드에서
+    repo = repository or _default_repository()
+    if not await asyncio.to_thread(_prepare_repository, repo):
+        if sharded:
+            raise RuntimeError("Elasticsearch 인덱스를 준비하지 못했습니다.")
+        return 0
+
+    first_num = pages.first if pages is not None else 1
+    params = _page_params(first_num)
+
+    first_body = await client.fetch_raw(BASE_URL, params)
+    first_page = parse_page(first_body)
+    if first_page is None or "pagination" not in first_page.metadata:
+        if sharded:
+            raise RuntimeError("첫 번째 페이지 가져오기 실패 또는 응답 형식 오류")
+        logger.error("첫 번째 페이지 가져오기 실패 또는 응답 형식 오류")
+        return 0
+
+    plan = await asyncio.to_thread(
+        _plan_pages, first_page, params, pages, shard, max_pages, manifest, resume
+    )
+    if plan is None:
+        return 0
+    manifest = plan.manifest
+    page_range = plan.pending(skip=first_num)
+
+    es_client = repo.connector.create_async_client()
+    try:
+        # 첫 페이지 처리
+        total_processed = 0
+        if first_num in plan.page_nums and not manifest.is_done(first_num):
+            total_processed += await _store_page_async(
+                first_num, first_body, first_page, repo, es_client, manifest
+            )
+
+        progress = ProgressReporter(
+            total=len(plan.page_nums), prefix="데이터 수집:", suffix="페이지"
+        )
+        # 첫 페이지와 이전 실행에서 완료된 페이지는 이미 처리함
+        progress.update(len(plan.page_nums) - len(page_range))
+
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+
+        async def run(page_num: int, count_progress: bool) -> int:
+            async with semaphore:
+                try:
+                    return await process_page_async(
+                        page_num, BASE_URL, params, repo, client, es_client, manifest
+                    )
+                except Exception as e:
+                    logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
+                    await asyncio.to_thread(manifest.mark_failed, page_num, str(e))
+                    return 0
+                finally:
+                    # 재시도는 이미 센 페이지
+                    if count_progress:
+                        progress.update(1)
+
+        for attempt in range(retry_passes + 1):
+            if attempt:
+                logger.info(
+                    f"재시도 {attempt}/{retry_passes}: 실패한 페이지 {len(page_range)}개"
+                )
+            results = await asyncio.gather(
+                *(run(page_num, not attempt) for page_num in page_range)
+            )
+            total_processed += sum(results)
+            page_range = plan.pending()
+            if not page_range:
+                break
+        stats = progress.close()
+
+        # 모든 처리가 끝난 후 한 번만 refresh
+        await es_client.indices.refresh(index=repo.index)
+    finally:
+        await es_client.close()
+
+    _report_failed_pages(page_range, manifest, sharded)
+
+    final_count = await asyncio.to_thread(repo.count_issues)
     logger.info(
-        f"데이터 수집 완료. 총 {total_pages} 페이지, {total_processed} 이슈 처리됨"
+        f"데이터 수집 완료. 총 {len(plan.page_nums)} 페이지, "
+        f"{total_processed} 이슈 처리됨 "
+        f"({stats.elapsed:.1f}초, {stats.rate:.2f} 페이지/초)"
     )
     logger.info(f"Elasticsearch에 저장된 총 이슈 수: {final_count}")
 
     return total_processed
+
+
+def _is_incremental_url(url: str) -> bool:
+    """증분 수집 요청(updated_at 정렬)의 URL인지 여부"""
+    return parse_qs(urlsplit(url).query).get("sort") == ["updated_at"]
+
+
+def compact_page_cache(cache: Optional[PageCache] = None) -> int:
+    """다시 재생할 필요가 없는 증분 수집 응답을 캐시에서 지웁니다.
+
+    증분 수집은 실행마다 워터마크가 달라 새 URL로 저장되므로 조건부 GET에 다시
+    쓰이지 않고 캐시에 계속 쌓인다. 응답에 담긴 이슈가 모두 나중에 저장된 응답에
+    다시 나오면 (또는 이슈가 없으면) 재생해도 덮어써질 내용뿐이므로 지운다.
+    전체 수집 응답은 조건부 GET에 쓰이므로 남긴다.
+
+    Args:
+        cache (Optional[PageCache], optional): 페이지 캐시. Defaults to None (DATA_DIR의 캐시).
+
+    Returns:
+        int: 지운 응답 수
+    """
+    cache = cache or PageCache(DATA_DIR / CACHE_DIRNAME)
+    pages = []
+    for page in cache.iter_pages():
+        parsed = parse_page(page.body, transform=False)
+        ids = None if parsed is None else {str(i.get("id")) for i in parsed.issues}
+        pages.append((page.url, ids))
+
+    # 최신 응답부터 거슬러 가며 이미 더 새로운 응답에 나온 이슈를 모은다
+    newer: set = set()
+    removed = 0
+    for url, ids in reversed(pages):
+        if ids is None:
+            continue
+        if _is_incremental_url(url) and ids <= newer:
+            cache.delete(url)
+            removed += 1
+        newer |= ids
+
+    if removed:
+        logger.info(f"캐시에서 대체된 증분 수집 응답 {removed}개 삭제")
+    return removed
+
+
+def replay_cached_pages(
+    repository: Optional[SeeClickFixRepository] = None,
+    cache: Optional[PageCache] = None,
+    recreate_index: bool = False,
+    batch_size: int = 5_000,
+) -> int:
+    """API를 호출하지 않고 캐시된 페이지만으로 Elasticsearch 인덱스를 다시 만듭니다.
+
+    매핑을 바꾼 뒤 다시 색인할 때 사용한다. 여러 페이지의 원본 이슈를 모아
+    ``batch_size``개 단위로 transform_issues(열 단위 변환)를 거쳐 bulk 저장한다.
+    페이지는 캐시에 저장된 순서로 재생하므로 같은 이슈는 가장 최근에 받은
+    내용으로 남는다.
+
+    Args:
+        repository (Optional[SeeClickFixRepository], optional): 저장소
+        cache (Optional[PageCache], optional): 페이지 캐시. Defaults to None (DATA_DIR의 캐시).
+        recreate_index (bool, optional): 인덱스를 지우고 현재 매핑으로 다시 만들지 여부.
+            Defaults to False.
+        batch_size (int, optional): bulk 저장 단위. Defaults to 5_000.
+
+    Returns:
+        int: 저장된 이슈 수
+    """
+    repo = repository or _default_repository()
+    cache = cache or PageCache(DATA_DIR / CACHE_DIRNAME)
+
+    if recreate_index and repo.check_connection():
+        repo.delete_index()
+    if not _prepare_repository(repo):
+        return 0
+
+    total_pages = 0
+    total_processed = 0
+    pending: List[Dict[str, Any]] = []
+    for page in cache.iter_pages():
+        parsed = parse_page(page.body, transform=False)
+        if parsed is None:
+            logger.error(f"캐시된 페이지를 읽을 수 없습니다: {page.url}")
+            continue
+        total_pages += 1
+        pending.extend(parsed.issues)
+        if len(pending) >= batch_size:
+            total_processed += repo.bulk_save_issues(transform_issues(pending))
+            pending = []
+    if pending:
+        total_processed += repo.bulk_save_issues(transform_issues(pending))
+
+    logger.info(
+        f"캐시 재생 완료. 총 {total_pages} 페이지, {total_processed} 이슈 처리됨"
+    )
+    return total_processed
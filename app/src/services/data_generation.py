@@ -1,25 +1,84 @@
-import csv
+import concurrent.futures
+import json
 import logging
+import os
 import shutil
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 from faker import Faker
-from src.modules.progress_bar import print_progress_bar
-import time
+from src.models.dataset_schema import (
+    ColumnSpec,
+    CompiledSchema,
+    compile_schema,
+    schema_dtypes,
+)
+from src.modules.progress_bar import ProgressReporter
+from src.utils.atomic_file import write_atomic
+from src.utils.dataset_io import (
+    DATASET_DTYPES,
+    dataset_suffix,
+    open_dataset_writer,
+    validate_format,
+)
+
+if TYPE_CHECKING:
+    from src.services.data_sinks import DataSink
 
 
 @dataclass
 class DatasetConfig:
-    """Configuration for fake dataset generation."""
+    """Configuration for fake dataset generation.
+
+    ``output_format`` is "csv" or "parquet". ``compression`` selects gzip/zstd
+    for CSV or snappy/gzip/zstd for Parquet. When ``filename`` is omitted it is
+    derived from the format, e.g. ``test_data.csv.gz`` or ``test_data.parquet``.
 
-    filename: str = "test_data.csv"
+    CSV output keeps a checkpoint next to the dataset. With ``resume`` set, an
+    interrupted run continues after the last complete batch and a finished
+    dataset is extended to a larger ``record_count`` without rewriting rows.
+
+    ``schema`` replaces the built-in columns with declarative ``ColumnSpec``
+    columns (Zipf, normal, weighted categorical, null rates); ``header`` then
+    defaults to the schema's column names.
+    """
+
+    filename: str = None
     record_count: int = 1_000_000
     output_dirs: List[str] = None
     header: List[str] = None
+    batch_size: int = 100_000
+    vocabulary_size: int = 1_000
+    seed: Optional[int] = None
+    throttle: float = 0.0
+    shards: int = 1
+    workers: Optional[int] = None
+    merge_shards: bool = True
+    output_format: str = "csv"
+    compression: Optional[str] = None
+    row_group_size: int = 100_000
+    resume: bool = False
+    schema: Optional[List[ColumnSpec]] = None
 
     def __post_init__(self):
+        validate_format(self.output_format, self.compression)
+        if self.filename is None:
+            suffix = dataset_suffix(self.output_format, self.compression)
+            self.filename = f"test_data{suffix}"
+
+        if self.schema is not None:
+            names = [column.name for column in self.schema]
+            if self.header is None:
+                self.header = names
+            elif self.header != names:
+                raise ValueError(
+                    f"header {self.header} does not match schema columns {names}"
+                )
+
         if self.header is None:
             self.header = [
                 "name",
@@ -35,15 +94,44 @@ class DatasetConfig:
         if self.output_dirs is None:
             self.output_dirs = ["./data/raw", "../nifi/data/raw"]
 
+        if self.batch_size <= 0:
+            raise ValueError(f"batch_size must be positive: {self.batch_size}")
+
+        if self.shards <= 0:
+            raise ValueError(f"shards must be positive: {self.shards}")
+
+        if self.resume and self.output_format != "csv":
+            raise ValueError("resume is only supported for CSV output")
+
+        if self.resume and self.throttle > 0:
+            raise ValueError("resume is not supported for throttled generation")
+
 
 class DataGenerator:
-    """Generator for fake datasets using Faker library."""
+    """Generator for fake datasets using Faker library.
+
+    Records are produced in vectorized batches: numeric columns are drawn with
+    NumPy and text columns are picked from small Faker vocabularies sampled once
+    per generator. Setting ``DatasetConfig.throttle`` writes one-record batches
+    from the same generator with a per-record delay.
+
+    With ``DatasetConfig.shards > 1`` the records are split into shards that
+    are written by worker processes. Every shard draws from its own stream
+    spawned from the master seed, so a given seed and shard count always
+    produce the same bytes regardless of the number of workers.
+    """
 
     def __init__(self, config: Optional[DatasetConfig] = None):
         """Initialize generator with optional custom configuration."""
         self.config = config or DatasetConfig()
+        seed = self.config.seed
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
         self.fake = Faker()
         self.logger = logging.getLogger(__name__)
+        self._use_seed(seed)
+        # Reporter of the latest run; progress.stats() exposes throughput and ETA
+        self.progress: Optional[ProgressReporter] = None
 
     def create_sample_dataset(self) -> Tuple[List[Path], int]:
         """Generate a sample dataset with random personal information.
@@ -55,13 +143,19 @@ class DataGenerator:
 
         # Create primary file first
         primary_output_path = Path(self.config.output_dirs[0]) / self.config.filename
-        record_count = self._write_records(primary_output_path)
+        if self.config.shards > 1:
+            record_count = self._write_sharded(primary_output_path)
+        else:
+            record_count = self._write_records(primary_output_path)
 
         # Copy to additional locations
         output_paths = [primary_output_path]
         for output_dir in self.config.output_dirs[1:]:
             target_path = Path(output_dir) / self.config.filename
-            shutil.copy2(primary_output_path, target_path)
+            if primary_output_path.is_dir():
+                shutil.copytree(primary_output_path, target_path, dirs_exist_ok=True)
+            else:
+                shutil.copy2(primary_output_path, target_path)
             output_paths.append(target_path)
             self.logger.info(f"✓ Copied data to {target_path}")
 
@@ -70,58 +164,466 @@ class DataGenerator:
         )
         return output_paths, record_count
 
+    def _use_seed(self, seed: int) -> None:
+        """Reset Faker, the record stream and the vocabularies to ``seed``."""
+        self.seed = seed
+        self.fake.seed_instance(seed)
+        self.rng = np.random.default_rng(seed)
+        self._vocabularies: Optional[Dict[str, np.ndarray]] = None
+        self._schema: Optional[CompiledSchema] = None
+
+    def iter_batches(
+        self, record_count: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yield records as DataFrame batches.
+
+        Args:
+            record_count: Number of records to yield, ``record_count`` of the
+                config by default
+
+        Yields:
+            DataFrame with at most ``batch_size`` rows and ``header`` columns
+        """
+        remaining = self.config.record_count if record_count is None else record_count
+        while remaining > 0:
+            size = min(self.config.batch_size, remaining)
+            yield self._generate_batch(size)
+            remaining -= size
+
+    def stream_to_sinks(self, sinks: List["DataSink"]) -> int:
+        """Stream generated batches straight into sinks without a dataset file.
+
+        Only one batch of ``batch_size`` records is held in memory at a time.
+        Every sink is closed once generation finishes or fails.
+
+        Args:
+            sinks: Destinations that receive every batch
+
+        Returns:
+            int: Number of records generated
+        """
+        generated = 0
+        self.progress = ProgressReporter(
+            total=self.config.record_count, prefix="Streaming", suffix="Complete"
+        )
+        try:
+            for batch in self.iter_batches():
+                for sink in sinks:
+                    sink.write_batch(batch)
+                generated += len(batch)
+                self.progress.update(len(batch))
+        finally:
+            self.progress.close()
+            for sink in sinks:
+                sink.close()
+
+        self.logger.info(f"✓ Streamed {generated:,} records to {len(sinks)} sinks")
+        return generated
+
+    def dataset_dtypes(self) -> Dict[str, str]:
+        """Column dtypes to pass to ``read_dataset`` for the generated CSV."""
+        if self.config.schema is not None:
+            return schema_dtypes(self.config.schema)
+        return dict(DATASET_DTYPES)
+
     def _ensure_output_directories(self) -> None:
         """Create all output directories if they don't exist."""
         for directory in self.config.output_dirs:
             Path(directory).mkdir(parents=True, exist_ok=True)
 
-    def _write_records(self, output_path: Path) -> int:
-        """Write fake records to CSV file and return count of records written.
+    def shard_sizes(self) -> List[int]:
+        """Split ``record_count`` into ``shards`` nearly equal record counts."""
+        base, extra = divmod(self.config.record_count, self.config.shards)
+        return [base + (1 if i < extra else 0) for i in range(self.config.shards)]
+
+    def use_shard_stream(self, shard_index: int) -> None:
+        """Switch the record stream to the one derived for ``shard_index``.
+
+        Args:
+            shard_index: Zero-based shard number
+        """
+        streams = np.random.SeedSequence(self.seed).spawn(self.config.shards)
+        self.rng = np.random.default_rng(streams[shard_index])
+
+    def _write_sharded(self, output_path: Path) -> int:
+        """Write the dataset as shards generated by worker processes.
+
+        Parts are concatenated into ``output_path`` when ``merge_shards`` is
+        set; otherwise ``output_path`` becomes a directory of part files that
+        each carry the header. With ``resume`` set, finished shards are kept
+        and interrupted ones continue from their own checkpoints.
 
         Args:
-            output_path: Path where the CSV file will be written
+            output_path: Path of the merged file or partitioned directory
 
         Returns:
             int: Number of records written
+
+        Raises:
+            ValueError: If a finished sharded dataset would have to be extended
         """
-        with open(output_path, mode="w", newline="") as output_file:
-            writer = csv.writer(output_file)
-            writer.writerow(self.config.header)
-
-            # Initialize the progress bar
-            print_progress_bar(
-                iteration=0,
-                total=self.config.record_count,
-                prefix="Progress",
-                suffix="Complete",
-                length=50,
+        merge = self.config.merge_shards
+        parts_dir = (
+            output_path.with_name(f".{output_path.name}.parts")
+            if merge
+            else output_path
+        )
+
+        checkpoint = read_checkpoint(output_path) if self.config.resume else None
+        if checkpoint is not None:
+            self._check_checkpoint(checkpoint)
+            if checkpoint["complete"]:
+                if checkpoint["rows_written"] != self.config.record_count:
+                    raise ValueError("Sharded datasets cannot be extended")
+                self.logger.info(f"✓ {output_path} is already complete")
+                return checkpoint["rows_written"]
+            self._use_seed(checkpoint["seed"])
+        else:
+            for stale in {output_path, parts_dir}:
+                if stale.is_dir():
+                    shutil.rmtree(stale)
+                elif stale.exists():
+                    stale.unlink()
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        self._save_checkpoint(output_path, rows_written=0, complete=False)
+
+        suffix = "".join(Path(self.config.filename).suffixes)
+        part_paths = [
+            parts_dir / f"part-{i:05d}{suffix}" for i in range(self.config.shards)
+        ]
+        workers = self.config.workers or min(self.config.shards, os.cpu_count() or 1)
+        self.logger.info(
+            f"Generating {self.config.shards} shards with {workers} workers (seed={self.seed})"
+        )
+
+        written = 0
+        self.progress = ProgressReporter(
+            total=self.config.record_count, prefix="Shards", suffix="Complete"
+        )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _write_shard,
+                    replace(self.config, record_count=count, seed=self.seed),
+                    shard_index,
+                    part_paths[shard_index],
+                    not merge,
+                ): part_paths[shard_index]
+                for shard_index, count in enumerate(self.shard_sizes())
+            }
+            for future in concurrent.futures.as_completed(futures):
+                count = future.result()
+                written += count
+                self.progress.update(count, nbytes=futures[future].stat().st_size)
+        self.progress.close()
+
+        if merge:
+            self._merge_parts(part_paths, output_path)
+            shutil.rmtree(parts_dir)
+        else:
+            for part_path in part_paths:
+                checkpoint_path(part_path).unlink(missing_ok=True)
+
+        self._save_checkpoint(output_path, rows_written=written, complete=True)
+        return written
+
+    def _merge_parts(self, part_paths: List[Path], output_path: Path) -> None:
+        """Concatenate shard part files into a single dataset file.
+
+        Compressed CSV parts are appended byte-wise (gzip members and zstd
+        frames concatenate into a valid stream); Parquet parts are re-emitted
+        row group by row group.
+
+        Args:
+            part_paths: Part files in shard order
+            output_path: Path of the merged dataset
+        """
+        if self.config.output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            schema = pq.read_schema(part_paths[0])
+            with pq.ParquetWriter(
+                output_path, schema, compression=self.config.compression or "none"
+            ) as writer:
+                for part_path in part_paths:
+                    part = pq.ParquetFile(part_path)
+                    for index in range(part.num_row_groups):
+                        writer.write_table(part.read_row_group(index))
+            return
+
+        # Header-only file first, then the headerless parts
+        self._open_writer(output_path).close()
+        with open(output_path, mode="ab") as output_file:
+            for part_path in part_paths:
+                with open(part_path, mode="rb") as part_file:
+                    shutil.copyfileobj(part_file, output_file)
+
+    def _open_writer(
+        self, output_path: Path, header: bool = True, append_at: Optional[int] = None
+    ):
+        """Open a dataset writer for the configured output format."""
+        return open_dataset_writer(
+            output_path,
+            self.config.header,
+            output_format=self.config.output_format,
+            compression=self.config.compression,
+            row_group_size=self.config.row_group_size,
+            header=header,
+            append_at=append_at,
+        )
+
+    def _write_records(
+        self, output_path: Path, header: bool = True, show_progress: bool = True
+    ) -> int:
+        """Write fake records to the dataset file and return count of records written.
+
+        CSV output checkpoints the row count, file offset and record stream
+        state after every batch. With ``resume`` set and a checkpoint present,
+        bytes past the last complete batch are dropped and generation continues
+        from there up to ``record_count``.
+
+        Args:
+            output_path: Path where the dataset file will be written
+            header: Whether to write the CSV header row
+            show_progress: Whether to draw the progress bar
+
+        Returns:
+            int: Number of records in the dataset file
+
+        Raises:
+            ValueError: If the checkpoint does not match the configuration
+        """
+        if self.config.throttle > 0:
+            return self._write_records_throttled(output_path, header)
+
+        written, append_at = 0, None
+        checkpoint = read_checkpoint(output_path) if self.config.resume else None
+        if checkpoint is not None and output_path.exists():
+            written, append_at = self._restore_checkpoint(checkpoint, output_path)
+            header = False
+            self.logger.info(f"Resuming {output_path} after {written:,} records")
+
+        checkpointed = self.config.output_format == "csv"
+        remaining = self.config.record_count - written
+        self.progress = ProgressReporter(
+            total=remaining,
+            prefix="Progress",
+            suffix="Complete",
+            enabled=show_progress,
+        )
+        with self.progress, self._open_writer(output_path, header, append_at) as writer:
+            if checkpointed:
+                self._save_checkpoint(output_path, written, False, writer.tell())
+            for batch in self.iter_batches(remaining):
+                writer.write(batch)
+                written += len(batch)
+                if checkpointed:
+                    self._save_checkpoint(output_path, written, False, writer.tell())
+                self.progress.update(len(batch))
+            if checkpointed:
+                self._save_checkpoint(output_path, written, True, writer.tell())
+
+        return written
+
+    def _checkpoint_layout(self) -> dict:
+        """Settings that must not change between a checkpoint and its resume."""
+        schema = self.config.schema
+        layout = {
+            "header": self.config.header,
+            "output_format": self.config.output_format,
+            "compression": self.config.compression,
+            "vocabulary_size": self.config.vocabulary_size,
+            "shards": self.config.shards,
+            "batch_size": self.config.batch_size,
+            "schema": None if schema is None else [asdict(c) for c in schema],
+        }
+        # Compare in the form the checkpoint is stored in (tuples become lists)
+        return json.loads(json.dumps(layout))
+
+    def _check_checkpoint(self, checkpoint: dict) -> None:
+        """Raise ValueError if ``checkpoint`` was written with another layout."""
+        for key, value in self._checkpoint_layout().items():
+            if checkpoint.get(key) != value:
+                raise ValueError(
+                    f"Checkpoint {key} {checkpoint.get(key)!r} does not match {value!r}"
+                )
+        if self.config.seed is not None and checkpoint["seed"] != self.config.seed:
+            raise ValueError(
+                f"Checkpoint seed {checkpoint['seed']} does not match {self.config.seed}"
             )
 
+    def _restore_checkpoint(
+        self, checkpoint: dict, output_path: Path
+    ) -> Tuple[int, int]:
+        """Restore the record stream saved in ``checkpoint``.
+
+        Args:
+            checkpoint: Checkpoint of ``output_path``
+            output_path: Dataset file the checkpoint belongs to
+
+        Returns:
+            Tuple of the rows already written and the offset to append at
+        """
+        self._check_checkpoint(checkpoint)
+        rows_written, offset = checkpoint["rows_written"], checkpoint["offset"]
+        if rows_written > self.config.record_count:
+            raise ValueError(
+                f"{output_path} already holds {rows_written:,} records, "
+                f"more than record_count {self.config.record_count:,}"
+            )
+        if output_path.stat().st_size < offset:
+            raise ValueError(f"{output_path} is shorter than its checkpoint")
+
+        self._use_seed(checkpoint["seed"])
+        self.rng.bit_generator.state = checkpoint["rng_state"]
+        return rows_written, offset
+
+    def _save_checkpoint(
+        self,
+        output_path: Path,
+        rows_written: int,
+        complete: bool,
+        offset: Optional[int] = None,
+    ) -> None:
+        """Atomically record generation progress next to ``output_path``."""
+        state = {
+            "seed": self.seed,
+            **self._checkpoint_layout(),
+            "rows_written": rows_written,
+            "complete": complete,
+            "offset": offset,
+            "rng_state": self.rng.bit_generator.state,
+        }
+        write_atomic(checkpoint_path(output_path), json.dumps(state))
+
+    def _write_records_throttled(self, output_path: Path, header: bool = True) -> int:
+        """Write records one by one, sleeping ``throttle`` seconds per record.
+
+        Records come from the same batch generator as the unthrottled path, so
+        ``schema`` and ``header`` apply.
+
+        Args:
+            output_path: Path where the dataset file will be written
+            header: Whether to write the CSV header row
+
+        Returns:
+            int: Number of records written
+        """
+        self.progress = ProgressReporter(
+            total=self.config.record_count, prefix="Progress", suffix="Complete"
+        )
+        with self.progress, self._open_writer(output_path, header) as writer:
             # Generate and write records one by one
-            for i in range(self.config.record_count):
-                writer.writerow(self._generate_record())
-                time.sleep(0.1)  # Simulate processing time
-
-                # Update the progress bar
-                print_progress_bar(
-                    iteration=i + 1,
-                    total=self.config.record_count,
-                    prefix="Progress",
-                    suffix="Complete",
-                    length=50,
-                )
+            for _ in range(self.config.record_count):
+                writer.write(self._generate_batch(1))
+                time.sleep(self.config.throttle)  # Simulate processing time
+                self.progress.update()
 
         return self.config.record_count
 
     def _generate_record(self) -> List:
         """Generate a single fake data record."""
-        return [
-            self.fake.name(),
-            self.fake.random_int(min=18, max=80),
-            self.fake.street_address(),
-            self.fake.city(),
-            self.fake.state(),
-            self.fake.zipcode(),
-            self.fake.longitude(),
-            self.fake.latitude(),
-        ]
+        return list(next(self._generate_batch(1).itertuples(index=False)))
+
+    def _build_vocabularies(self) -> Dict[str, np.ndarray]:
+        """Sample the Faker vocabularies that text columns are drawn from."""
+        size = self.config.vocabulary_size
+
+        def sample(provider) -> np.ndarray:
+            return np.array([provider() for _ in range(size)], dtype=object)
+
+        return {
+            "first_name": sample(self.fake.first_name),
+            "last_name": sample(self.fake.last_name),
+            "street_name": sample(self.fake.street_name),
+            "city": sample(self.fake.city),
+            "state": sample(self.fake.state),
+        }
+
+    def _generate_batch(self, size: int) -> pd.DataFrame:
+        """Generate ``size`` fake records at once.
+
+        Args:
+            size: Number of records in the batch
+
+        Returns:
+            DataFrame with the configured header as columns
+        """
+        if self.config.schema is not None:
+            if self._schema is None:
+                self._schema = compile_schema(
+                    self.config.schema, self.fake, self.config.vocabulary_size
+                )
+            return self._schema.generate(self.rng, size)
+
+        if self._vocabularies is None:
+            self._vocabularies = self._build_vocabularies()
+        vocab = self._vocabularies
+        rng = self.rng
+
+        def pick(name: str) -> np.ndarray:
+            words = vocab[name]
+            return words[rng.integers(0, len(words), size)]
+
+        def digits(low: int, high: int, width: int = 0) -> np.ndarray:
+            values = rng.integers(low, high, size).astype(str)
+            if width:
+                values = np.char.zfill(values, width)
+            return values.astype(object)
+
+        columns = {
+            "name": lambda: pick("first_name") + " " + pick("last_name"),
+            "age": lambda: rng.integers(18, 81, size).astype(DATASET_DTYPES["age"]),
+            "street": lambda: digits(1, 10_000) + " " + pick("street_name"),
+            "city": lambda: pick("city"),
+            "state": lambda: pick("state"),
+            "zip": lambda: digits(501, 99_951, width=5),
+            "lng": lambda: np.round(rng.uniform(-180.0, 180.0, size), 6),
+            "lat": lambda: np.round(rng.uniform(-90.0, 90.0, size), 6),
+        }
+
+        unknown = [name for name in self.config.header if name not in columns]
+        if unknown:
+            raise ValueError(f"Unsupported columns for batch generation: {unknown}")
+
+        return pd.DataFrame({name: columns[name]() for name in self.config.header})
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    """Return the hidden checkpoint file kept next to ``output_path``."""
+    output_path = Path(output_path)
+    return output_path.with_name(f".{output_path.name}.checkpoint.json")
+
+
+def read_checkpoint(output_path: Path) -> Optional[dict]:
+    """Load the generation checkpoint of ``output_path``.
+
+    Args:
+        output_path: Dataset file or partitioned directory
+
+    Returns:
+        The checkpoint, or None if the dataset has none
+    """
+    path = checkpoint_path(output_path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def _write_shard(
+    config: DatasetConfig, shard_index: int, part_path: Path, header: bool
+) -> int:
+    """Worker process entry point that writes a single shard.
+
+    Args:
+        config: Shard configuration carrying the master seed and shard size
+        shard_index: Zero-based shard number
+        part_path: Path of the part file to write
+        header: Whether the part file gets its own header row
+
+    Returns:
+        int: Number of records written
+    """
+    generator = DataGenerator(config)
+    generator.use_shard_stream(shard_index)
+    return generator._write_records(part_path, header=header, show_progress=False)
@@ -0,0 +1,120 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+
+from src.database.repository import PostgreSQLRepository, Repository
+from src.services.data_streaming import KafkaProducer
+from src.utils.dataset_io import DatasetWriter, detect_format, open_dataset_writer
+
+
+class DataSink(ABC):
+    """생성된 레코드 배치를 받아 저장/전송하는 대상의 추상 클래스"""
+
+    @abstractmethod
+    def write_batch(self, batch: pd.DataFrame) -> int:
+        """배치 기록
+
+        Args:
+            batch: 레코드 배치
+
+        Returns:
+            int: 기록된 레코드 수
+        """
+        pass
+
+    def close(self) -> None:
+        """남은 데이터를 내보내고 리소스를 정리"""
+        pass
+
+    def __enter__(self) -> "DataSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class FileSink(DataSink):
+    """데이터셋 파일(CSV/압축 CSV/Parquet)로 기록하는 Sink"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        columns: List[str],
+        output_format: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_group_size: int = 100_000,
+    ):
+        """초기화
+
+        Args:
+            path: 기록할 파일 경로
+            columns: 컬럼 순서
+            output_format: "csv" 또는 "parquet". None이면 확장자로 추정
+            compression: 압축 방식. output_format이 None이면 확장자로 추정
+            row_group_size: Parquet row group 크기
+        """
+        if output_format is None:
+            output_format, compression = detect_format(path)
+        self.writer: DatasetWriter = open_dataset_writer(
+            path,
+            columns,
+            output_format=output_format,
+            compression=compression,
+            row_group_size=row_group_size,
+        )
+
+    def write_batch(self, batch: pd.DataFrame) -> int:
+        self.writer.write(batch)
+        return len(batch)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class KafkaSink(DataSink):
+    """Kafka 토픽으로 전송하는 Sink"""
+
+    def __init__(
+        self,
+        producer: KafkaProducer,
+        topic_name: str,
+        key_field: Optional[str] = None,
+    ):
+        """초기화
+
+        Args:
+            producer: 사용할 KafkaProducer (종료는 호출한 쪽에서 관리)
+            topic_name: 전송할 Kafka 토픽 이름
+            key_field: 메시지 키로 사용할 필드명
+        """
+        self.producer = producer
+        self.topic_name = topic_name
+        self.key_field = key_field
+
+    def write_batch(self, batch: pd.DataFrame) -> int:
+        return self.producer.produce_records(
+            batch.to_dict(orient="records"), self.topic_name, key_field=self.key_field
+        )
+
+    def close(self) -> None:
+        self.producer.flush()
+
+
+class RepositorySink(DataSink):
+    """Repository(PostgreSQL/Elasticsearch)의 bulk_save로 저장하는 Sink"""
+
+    def __init__(self, repository: Repository):
+        """초기화
+
+        Args:
+            repository: 저장에 사용할 Repository 인스턴스
+        """
+        self.repository = repository
+
+    def write_batch(self, batch: pd.DataFrame) -> int:
+        # PostgreSQL은 딕셔너리로 바꾸지 않고 DataFrame을 바로 COPY한다
+        if isinstance(self.repository, PostgreSQLRepository):
+            return self.repository.copy_save(batch).rows
+        return self.repository.bulk_save(batch.to_dict(orient="records"))
@@ -4,6 +4,7 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, Optional, Callable, Any, List
+from src.utils.dataset_io import iter_dataset
 
 
 class KafkaProducer:
@@ -69,12 +70,12 @@ class KafkaProducer:
         transform_func: Optional[Callable[[Dict], Dict]] = None,
     ) -> int:
         """
-        CSV 파일을 읽어 Kafka 토픽으로 전송
+        데이터셋 파일(CSV/압축 CSV/Parquet)을 읽어 Kafka 토픽으로 전송
 
         Args:
-            csv_path: CSV 파일 경로
+            csv_path: 데이터셋 파일 경로
             topic_name: 전송할 Kafka 토픽 이름
-            batch_size: 한 번에 처리할 CSV 레코드 수
+            batch_size: 한 번에 처리할 레코드 수
             key_field: 메시지 키로 사용할 CSV 필드명 (지정하지 않으면 키 없음)
             transform_func: 각 레코드에 적용할 변환 함수 (선택 사항)
 
@@ -94,35 +95,14 @@ class KafkaProducer:
             self.logger.info(f"'{csv_path}' 파일 처리 시작")
             messages_sent = 0
 
-            for chunk in pd.read_csv(csv_path, chunksize=batch_size):
-                for _, row in chunk.iterrows():
-                    # 레코드를 딕셔너리로 변환
-                    record_dict = row.to_dict()
-
-                    # 변환 함수가 지정되었으면 적용
-                    if transform_func:
-                        record_dict = transform_func(record_dict)
-
-                    # 메시지 값을 JSON으로 직렬화
-                    message_value = json.dumps(record_dict).encode("utf-8")
-
-                    # 키 필드가 지정되었으면 키 설정
-                    message_key = None
-                    if key_field and key_field in record_dict:
-                        message_key = str(record_dict[key_field]).encode("utf-8")
-
-                    # 메시지 전송 (비동기)
-                    self.producer.produce(
-                        topic=topic_name,
-                        value=message_value,
-                        key=message_key,
-                        callback=self.delivery_callback,
-                    )
-                    messages_sent += 1
-
-                    # 주기적으로 폴링하여 콜백 처리
-                    self.producer.poll(0)
-
+            for chunk in iter_dataset(csv_path, batch_size=batch_size):
+                # 레코드를 딕셔너리로 변환
+                messages_sent += self.produce_records(
+                    chunk.to_dict(orient="records"),
+                    topic_name,
+                    key_field=key_field,
+                    transform_func=transform_func,
+                )
                 self.logger.info(f"{messages_sent}개 메시지 처리 중...")
 
             # 남은 메시지 전송 보장
@@ -141,6 +121,78 @@ class KafkaProducer:
             self.logger.error(f"메시지 전송 중 오류 발생: {e}")
             return 0
 
+    def produce_records(
+        self,
+        records: List[Dict[str, Any]],
+        topic_name: str,
+        key_field: Optional[str] = None,
+        transform_func: Optional[Callable[[Dict], Dict]] = None,
+    ) -> int:
+        """
+        레코드 목록을 Kafka 토픽으로 전송 (flush는 호출하지 않음)
+
+        Producer 내부 큐가 가득 차면 콜백을 처리하며 자리가 날 때까지 기다리므로
+        메모리에 쌓이는 메시지 양이 큐 크기로 제한된다.
+
+        Args:
+            records: 전송할 레코드 딕셔너리 목록
+            topic_name: 전송할 Kafka 토픽 이름
+            key_field: 메시지 키로 사용할 필드명 (지정하지 않으면 키 없음)
+            transform_func: 각 레코드에 적용할 변환 함수 (선택 사항)
+
+        Returns:
+            int: 전송 요청한 메시지 수
+        """
+        messages_sent = 0
+        for record_dict in records:
+            # 변환 함수가 지정되었으면 적용
+            if transform_func:
+                record_dict = transform_func(record_dict)
+
+            # 메시지 값을 JSON으로 직렬화
+            message_value = json.dumps(record_dict).encode("utf-8")
+
+            # 키 필드가 지정되었으면 키 설정
+            message_key = None
+            if key_field and key_field in record_dict:
+                message_key = str(record_dict[key_field]).encode("utf-8")
+
+            # 메시지 전송 (비동기)
+            while True:
+                try:
+                    self.producer.produce(
+                        topic=topic_name,
+                        value=message_value,
+                        key=message_key,
+                        callback=self.delivery_callback,
+                    )
+                    break
+                except BufferError:
+                    # 로컬 큐가 가득 참: 전송 완료를 기다리며 자리 확보
+                    self.producer.poll(0.5)
+            messages_sent += 1
+
+            # 주기적으로 폴링하여 콜백 처리
+            self.producer.poll(0)
+
+        return messages_sent
+
+    def flush(self, timeout: float = 10) -> int:
+        """대기 중인 메시지 전송
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            int: 시간 내에 전송되지 못한 메시지 수
+        """
+        remaining = self.producer.flush(timeout=timeout)
+        if remaining > 0:
+            self.logger.warning(
+                f"{remaining}개의 메시지가 지정된 시간 내에 전송되지 않았습니다."
+            )
+        return remaining
+
     def close(self):
         """Producer 리소스 정리"""
         self.producer.flush()
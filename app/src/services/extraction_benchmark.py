@@ -0,0 +1,170 @@
+import argparse
+import logging
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from src.modules.scf_stub_server import StubSeeClickFixServer, StubServerConfig
+from src.services import data_extraction
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    """작업자 수 하나에 대한 수집 벤치마크 결과"""
+
+    workers: int
+    pages: int
+    issues: int
+    elapsed: float
+    requests: int
+    throttled: int
+    errors: int
+
+    @property
+    def retries(self) -> int:
+        """성공한 페이지 요청 외에 추가로 보낸 요청 수 (429/500 재시도)"""
+        return self.requests - self.pages
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def issues_per_second(self) -> float:
+        return self.issues / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _CountingRepository:
+    """Elasticsearch 없이 저장 요청 수만 세는 저장소 (수집 경로만 측정)"""
+
+    index = "benchmark"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.saved = 0
+
+    def check_connection(self) -> bool:
+        return True
+
+    def setup_index_mapping(self) -> bool:
+        return True
+
+    def bulk_save_issues(self, issues: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            self.saved += len(issues)
+        return len(issues)
+
+    def count_issues(self) -> int:
+        return self.saved
+
+
+@contextmanager
+def _extraction_target(base_url: str, data_dir: Path) -> Iterator[None]:
+    """수집 모듈의 API 주소와 저장 디렉토리를 잠시 바꾼다."""
+    original = data_extraction.BASE_URL, data_extraction.DATA_DIR
+    data_extraction.BASE_URL, data_extraction.DATA_DIR = base_url, data_dir
+    try:
+        yield
+    finally:
+        data_extraction.BASE_URL, data_extraction.DATA_DIR = original
+
+
+def run_benchmark(
+    worker_counts: Sequence[int] = (1, 5, 10, 20),
+    config: Optional[StubServerConfig] = None,
+) -> List[BenchmarkResult]:
+    """로컬 API 대역 서버를 상대로 collect_all_issues를 작업자 수별로 실행한다.
+
+    실행마다 새 서버와 빈 데이터 디렉토리를 써서 페이지 캐시, 매니페스트,
+    서버의 요청 제한 상태가 다음 실행에 영향을 주지 않게 한다.
+
+    Args:
+        worker_counts (Sequence[int], optional): 측정할 작업자 수. Defaults to (1, 5, 10, 20).
+        config (Optional[StubServerConfig], optional): 대역 서버 설정 (지연, 오류율, 429)
+
+    Returns:
+        List[BenchmarkResult]: 작업자 수별 결과
+    """
+    results = []
+    for workers in worker_counts:
+        repo = _CountingRepository()
+        with StubSeeClickFixServer(config) as server, tempfile.TemporaryDirectory(
+            prefix="scf-benchmark-"
+        ) as data_dir, _extraction_target(server.url, Path(data_dir)):
+            started = time.perf_counter()
+            # 작업자 수 자체를 비교하므로 초당 요청 제한과 동시 요청 수 여유를 끈다
+            issues = data_extraction.collect_all_issues(
+                repo, max_workers=workers, rate=0, max_concurrency=workers
+            )
+            elapsed = time.perf_counter() - started
+            expected = server.config.total_issues
+
+        result = BenchmarkResult(
+            workers=workers,
+            pages=server.stats.get(200, 0) + server.stats.get(304, 0),
+            issues=issues,
+            elapsed=elapsed,
+            requests=server.requests,
+            throttled=server.stats.get(429, 0),
+            errors=server.stats.get(500, 0),
+        )
+        if issues != expected:
+            # 일부만 수집했다면 처리량 수치가 실제 전체 수집을 대표하지 않는다
+            logger.warning(
+                f"작업자 {workers}명: 이슈 {expected}개 중 {issues}개만 수집했습니다."
+            )
+        logger.info(
+            f"작업자 {workers}명: {result.pages_per_second:.1f} 페이지/초, "
+            f"{result.issues_per_second:.1f} 이슈/초, 재시도 {result.retries}회"
+        )
+        results.append(result)
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """결과를 표 형식 문자열로 만든다."""
+    lines = [
+        f"{'workers':>7} {'pages':>6} {'issues':>7} {'seconds':>8} "
+        f"{'pages/s':>8} {'issues/s':>9} {'retries':>7} {'429':>5} {'500':>5}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.workers:>7} {r.pages:>6} {r.issues:>7} {r.elapsed:>8.2f} "
+            f"{r.pages_per_second:>8.1f} {r.issues_per_second:>9.1f} "
+            f"{r.retries:>7} {r.throttled:>5} {r.errors:>5}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """명령행에서 벤치마크를 실행한다."""
+    parser = argparse.ArgumentParser(description="SeeClickFix 수집 벤치마크")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--issues", type=int, default=5_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    config = StubServerConfig(
+        total_issues=args.issues,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+    )
+    print(format_results(run_benchmark(args.workers, config)))
+
+
+if __name__ == "__main__":
+    main()
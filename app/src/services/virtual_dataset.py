@@ -0,0 +1,142 @@
+from dataclasses import replace
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+from src.models.dataset_schema import CompiledSchema, compile_schema, user_schema
+from src.services.data_generation import DatasetConfig
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_UNIT = 2.0**-53
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer; uint64 arithmetic wraps modulo 2**64."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * _MIX_1
+    values = values ^ (values >> np.uint64(27))
+    values = values * _MIX_2
+    return values ^ (values >> np.uint64(31))
+
+
+class VirtualDataset:
+    """Random-access dataset whose records are computed on demand.
+
+    Every uniform draw is a hash of ``(seed, draw, record index)`` instead of
+    the next value of a sequential stream, so record ``i`` or a range
+    ``[i, j)`` costs O(j - i) no matter where it starts. Workers that share a
+    seed and schema pull disjoint slices in parallel and get the same records
+    a single reader would, without a file or any shared state.
+
+    Records follow ``config.schema`` (``user_schema()`` when unset). Value
+    tables of provider columns come from Faker seeded with the same seed.
+    """
+
+    def __init__(self, config: Optional[DatasetConfig] = None):
+        """Initialize the dataset from a generation config.
+
+        Args:
+            config: ``record_count``, ``seed``, ``schema``, ``batch_size`` and
+                ``vocabulary_size`` are used
+        """
+        config = config or DatasetConfig()
+        if config.schema is None:
+            config = replace(config, schema=user_schema(), header=None)
+        self.config = config
+        self.seed = self.config.seed
+        if self.seed is None:
+            self.seed = np.random.SeedSequence().entropy
+
+        fake = Faker()
+        fake.seed_instance(self.seed)
+        self.schema: CompiledSchema = compile_schema(
+            self.config.schema, fake, self.config.vocabulary_size
+        )
+        # One independent key per uniform row the schema consumes
+        root = np.random.SeedSequence(self.seed).generate_state(1, np.uint64)[0]
+        self._keys = _splitmix64(
+            root + np.arange(self.schema.draws, dtype=np.uint64) * _GOLDEN_GAMMA
+        )
+
+    def __len__(self) -> int:
+        return self.config.record_count
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[Dict[str, Any], pd.DataFrame]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("VirtualDataset slices do not support a step")
+            return self.range(start, max(start, stop))
+        return self.record(key)
+
+    def uniforms(self, start: int, stop: int) -> np.ndarray:
+        """Uniform draws in ``[0, 1)`` for records ``[start, stop)``.
+
+        Returns:
+            Array of shape ``(schema.draws, stop - start)``
+        """
+        counters = np.arange(start + 1, stop + 1, dtype=np.uint64) * _GOLDEN_GAMMA
+        bits = _splitmix64(self._keys[:, np.newaxis] + counters[np.newaxis, :])
+        return (bits >> np.uint64(11)).astype(np.float64) * _UNIT
+
+    def range(self, start: int, stop: int) -> pd.DataFrame:
+        """Compute records ``[start, stop)``.
+
+        Args:
+            start: First record index
+            stop: Index after the last record
+
+        Returns:
+            DataFrame indexed by record number
+
+        Raises:
+            IndexError: If the range is outside ``[0, record_count]``
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError(
+                f"Range [{start}, {stop}) is outside a dataset of {len(self):,} records"
+            )
+        batch = self.schema.sample(self.uniforms(start, stop))
+        batch.index = pd.RangeIndex(start, stop)
+        return batch
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Compute a single record as a column → value dictionary."""
+        if index < 0:
+            index += len(self)
+        return self.range(index, index + 1).iloc[0].to_dict()
+
+    def shard_range(self, shard_index: int, shards: int) -> Tuple[int, int]:
+        """Record range of ``shard_index`` out of ``shards`` near-equal parts."""
+        if not 0 <= shard_index < shards:
+            raise IndexError(f"Shard {shard_index} is outside {shards} shards")
+        base, extra = divmod(len(self), shards)
+        start = shard_index * base + min(shard_index, extra)
+        return start, start + base + (1 if shard_index < extra else 0)
+
+    def iter_batches(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield records ``[start, stop)`` as DataFrame batches.
+
+        Args:
+            start: First record index
+            stop: Index after the last record, ``record_count`` by default
+            batch_size: Records per batch, ``config.batch_size`` by default
+
+        Yields:
+            DataFrame batches indexed by record number
+        """
+        stop = len(self) if stop is None else stop
+        batch_size = batch_size or self.config.batch_size
+        for batch_start in range(start, stop, batch_size):
+            yield self.range(batch_start, min(batch_start + batch_size, stop))
@@ -0,0 +1,29 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+def write_atomic(path: Union[str, Path], data: Union[str, bytes]) -> None:
+    """파일 내용을 한 번에 교체한다.
+
+    같은 디렉토리의 임시 파일에 쓴 뒤 ``os.replace``로 바꾸므로, 쓰는 도중
+    중단되거나 여러 작업자가 동시에 써도 읽는 쪽은 이전 내용이나 새 내용
+    중 하나만 본다. 상위 디렉토리가 없으면 만든다.
+
+    Args:
+        path (Union[str, Path]): 기록할 파일 경로
+        data (Union[str, bytes]): 파일 내용 (문자열은 UTF-8로 기록)
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
@@ -1,7 +1,10 @@
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, List, Optional, Tuple
 import logging
+import threading
+import time
 import psycopg2
+from psycopg2.pool import PoolError
 from psycopg2.extensions import connection, cursor
 from psycopg2.extras import DictCursor
 from elasticsearch import Elasticsearch
@@ -20,6 +23,7 @@ class PostgresConnector:
             config: PostgreSQL 설정. None일 경우 기본값 사용
         """
         self.config = config or PostgresConfig()
+        # connect()는 호출마다 자기 연결을 쓰므로 여기에 연결을 저장하지 않는다
         self._conn: Optional[connection] = None
         self._cur: Optional[cursor] = None
 
@@ -33,23 +37,27 @@ class PostgresConnector:
         Raises:
             psycopg2.Error: 데이터베이스 연결 또는 쿼리 실행 중 오류 발생시
         """
+        # 지역 변수로 관리해야 멈춘 제너레이터(iter_all) 안의 연결을 다른 호출이
+        # 덮어쓰거나 엉뚱한 연결을 닫지 않는다
+        conn: Optional[connection] = None
+        cur: Optional[cursor] = None
         try:
-            self._conn = psycopg2.connect(self.config.connection_string)
-            self._cur = self._conn.cursor(cursor_factory=DictCursor)
-            yield self._cur
-            self._conn.commit()
+            conn = psycopg2.connect(self.config.connection_string)
+            cur = conn.cursor(cursor_factory=DictCursor)
+            yield cur
+            conn.commit()
 
         except psycopg2.Error as e:
             logger.error(f"Database error: {e}")
-            if self._conn:
-                self._conn.rollback()
+            if conn:
+                conn.rollback()
             raise
 
         finally:
-            if self._cur:
-                self._cur.close()
-            if self._conn:
-                self._conn.close()
+            if cur:
+                cur.close()
+            if conn:
+                conn.close()
 
     def check_connection(self) -> bool:
         """데이터베이스 연결 확인
@@ -67,6 +75,240 @@ class PostgresConnector:
             return False
 
 
+class PooledPostgresConnector(PostgresConnector):
+    """연결을 재사용하는 PostgreSQL 연결 관리자 (스레드 안전)
+
+    ``PostgresConnector``와 같이 ``with connector.connect() as cur``로 쓰지만
+    블록이 끝나면 연결을 닫지 않고 풀에 돌려준다. 연결은 한 번에 한 스레드만
+    빌려 쓰므로 여러 스레드가 저장소 하나를 함께 써도 서로의 트랜잭션이 섞이지
+    않는다. 빌려줄 때 ``SELECT 1``로 연결 상태를 확인하고, ``max_lifetime``보다
+    오래된 연결은 닫고 새로 연다. 연결이 모두 사용 중이면 ``timeout``초까지
+    기다린다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PostgresConfig] = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_lifetime: float = 1800.0,
+        timeout: float = 30.0,
+        health_check: bool = True,
+    ):
+        """연결 풀 초기화 (첫 connect() 호출 때 min_size개를 연다)
+
+        Args:
+            config: PostgreSQL 설정. None일 경우 기본값 사용
+            min_size: 유지할 최소 연결 수
+            max_size: 동시에 열 수 있는 최대 연결 수
+            max_lifetime: 연결을 재사용할 최대 시간 (초)
+            timeout: 빈 연결을 기다릴 최대 시간 (초)
+            health_check: 빌려줄 때마다 연결 상태를 확인할지 여부
+
+        Raises:
+            ValueError: 풀 크기나 시간 설정이 잘못된 경우
+        """
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError(
+                f"풀 크기가 잘못되었습니다: min_size={min_size}, max_size={max_size}"
+            )
+        if max_lifetime <= 0 or timeout < 0:
+            raise ValueError(
+                f"시간 설정이 잘못되었습니다: max_lifetime={max_lifetime}, timeout={timeout}"
+            )
+        super().__init__(config)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check = health_check
+        self._cond = threading.Condition()
+        # 쉬고 있는 (연결, 연 시각). 최근에 돌려받은 연결부터 빌려준다
+        self._idle: List[Tuple[connection, float]] = []
+        self._created = {}  # id(연결) -> 연 시각 (빌려준 연결 포함)
+        self._opening = 0  # 여는 중인 연결 수
+        self._filled = False
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """열려 있는 연결 수 (빌려준 연결 포함)"""
+        with self._cond:
+            return len(self._created)
+
+    @property
+    def idle(self) -> int:
+        """쉬고 있는 연결 수"""
+        with self._cond:
+            return len(self._idle)
+
+    @contextmanager
+    def connect(self) -> Generator[cursor, None, None]:
+        """풀에서 연결을 빌려 커서를 제공하는 컨텍스트 매니저
+
+        블록이 정상 종료되면 commit, 예외가 나면 rollback한 뒤 연결을 돌려준다.
+
+        Yields:
+            psycopg2 커서 객체
+
+        Raises:
+            psycopg2.pool.PoolError: 풀이 닫혔거나 timeout 안에 연결을 얻지 못한 경우
+            psycopg2.Error: 데이터베이스 연결 또는 쿼리 실행 중 오류 발생시
+        """
+        conn = self._checkout()
+        cur = None
+        healthy = True
+        try:
+            cur = conn.cursor(cursor_factory=DictCursor)
+            yield cur
+            conn.commit()
+
+        except psycopg2.Error as e:
+            logger.error(f"Database error: {e}")
+            healthy = self._rollback(conn)
+            raise
+
+        except BaseException:
+            healthy = self._rollback(conn)
+            raise
+
+        finally:
+            if cur is not None:
+                cur.close()
+            self._checkin(conn, healthy)
+
+    def close(self) -> None:
+        """쉬고 있는 연결을 모두 닫고 풀을 닫는다 (빌려준 연결은 돌려받을 때 닫음)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for conn, _ in idle:
+                self._created.pop(id(conn), None)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close(conn)
+        logger.info(f"PostgreSQL 연결 풀 종료 (연결 {len(idle)}개 닫음)")
+
+    def _checkout(self) -> connection:
+        """쉬고 있는 건강한 연결을 빌리거나 새로 연다"""
+        self._fill()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolError("연결 풀이 닫혔습니다")
+                    if self._idle:
+                        conn, created = self._idle.pop()
+                        break
+                    if len(self._created) + self._opening < self.max_size:
+                        conn = None
+                        self._opening += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolError(
+                            f"{self.timeout}초 안에 연결을 얻지 못했습니다 "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+
+            if conn is None:
+                return self._open()
+            if self._usable(conn, created):
+                return conn
+            self._discard(conn)
+
+    def _fill(self) -> None:
+        """처음 빌릴 때 min_size개까지 연결을 미리 연다"""
+        with self._cond:
+            if self._filled:
+                return
+            self._filled = True
+            missing = max(self.min_size - len(self._created) - self._opening, 0)
+            self._opening += missing
+        opened = []
+        try:
+            for _ in range(missing):
+                opened.append(self._open(reserved=False))
+        finally:
+            with self._cond:
+                self._opening -= missing
+                # 여는 중에 실패하면 다음에 빌릴 때 다시 채운다
+                self._filled = len(opened) == missing
+                now = time.monotonic()
+                for conn in opened:
+                    self._created[id(conn)] = now
+                    self._idle.append((conn, now))
+                self._cond.notify_all()
+
+    def _open(self, reserved: bool = True) -> connection:
+        """새 연결을 연다 (reserved면 _opening 자리를 연결로 바꾼다)"""
+        try:
+            conn = psycopg2.connect(self.config.connection_string)
+        except BaseException:
+            if reserved:
+                with self._cond:
+                    self._opening -= 1
+                    self._cond.notify()
+            raise
+        if reserved:
+            with self._cond:
+                self._opening -= 1
+                self._created[id(conn)] = time.monotonic()
+        return conn
+
+    def _usable(self, conn: connection, created: float) -> bool:
+        """연결이 닫히지 않았고 수명이 남았으며 (health_check면) 응답하는지"""
+        if conn.closed:
+            return False
+        if time.monotonic() - created > self.max_lifetime:
+            logger.debug("수명이 지난 PostgreSQL 연결을 닫습니다")
+            return False
+        if not self.health_check:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            logger.warning(f"끊어진 PostgreSQL 연결을 닫습니다: {e}")
+            return False
+
+    def _rollback(self, conn: connection) -> bool:
+        """rollback하고 연결을 계속 쓸 수 있는지 반환"""
+        try:
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _checkin(self, conn: connection, healthy: bool) -> None:
+        """빌려준 연결을 돌려받는다. 망가졌거나 풀이 닫혔으면 닫는다"""
+        with self._cond:
+            created = self._created.get(id(conn))
+            reusable = healthy and not self._closed and not conn.closed
+            if reusable and created is not None:
+                self._idle.append((conn, created))
+                self._cond.notify()
+                return
+        self._discard(conn)
+
+    def _discard(self, conn: connection) -> None:
+        with self._cond:
+            self._created.pop(id(conn), None)
+            self._cond.notify()
+        self._close(conn)
+
+    @staticmethod
+    def _close(conn: connection) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+
 class ElasticsearchConnector:
     """Elasticsearch 연결 관리자"""
 
@@ -101,6 +343,18 @@ class ElasticsearchConnector:
         """
         return Elasticsearch(self.config.hosts)
 
+    def create_async_client(self):
+        """asyncio용 Elasticsearch 클라이언트 생성
+
+        호출한 쪽에서 이벤트 루프 안에서 사용하고 ``await client.close()``로 닫는다.
+
+        Returns:
+            AsyncElasticsearch 클라이언트
+        """
+        from elasticsearch import AsyncElasticsearch
+
+        return AsyncElasticsearch(self.config.hosts)
+
     def get_client(self) -> Optional[Elasticsearch]:
         """Elasticsearch 클라이언트 반환
 
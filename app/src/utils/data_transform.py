@@ -1,46 +1,188 @@
-from typing import Dict, Any
-
-REQUIRED_FIELDS = {
-    "id",
-    "summary",
-    "description",
-    "status",
-    "lat",
-    "lng",
-    "address",
-    "rating",
-    "comment_count",
-    "view_count",
-    "created_at",
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.models.issue_schema import ISSUE_FIELDS, compile_transform
+from src.utils.geohash import encode_array
+
+logger = logging.getLogger(__name__)
+
+ARROW_TYPES = {
+    "keyword": pa.string(),
+    "text": pa.string(),
+    "integer": pa.int64(),
+    "float": pa.float64(),
+    "date": pa.string(),
 }
 
+# API 응답에서 읽는 키 (문서 필드 순서)
+REQUIRED_FIELDS = tuple(field.key for field in ISSUE_FIELDS if field.derive is None)
+
+# transform_issues가 이슈를 읽어 들일 때 쓰는 열 타입 (API 값의 타입)
+ISSUE_SCHEMA = pa.schema(
+    [
+        (field.key, ARROW_TYPES[field.source_type or field.type])
+        for field in ISSUE_FIELDS
+        if field.derive is None
+    ]
+)
+
+OUTPUT_FORMATS = ("records", "arrow", "pandas")
+
+# 이보다 적은 이슈를 레코드로 변환할 때는 Arrow 테이블을 만들고 다시 읽는 비용이
+# 더 커서 이슈마다 transform_issue로 변환한다
+COLUMNAR_MIN_ISSUES = 500
+
+# repr이 작은따옴표로 감싸기만 하는 문자열 (출력 가능한 ASCII 중 ' 와 \ 제외)
+_PLAIN_STRING = r"^[ -&(-\[\]-~]*$"
+
+# ISSUE_FIELDS로 생성한 이슈 변환 함수
+#
+# 필드마다 매핑 타입에 맞게 변환한다 (float/integer/ISO 날짜, coords는 geo_point
+# 객체, geohash_N은 N자리 geohash 격자 키, fingerprint는 내용 해시). 값이 없거나
+# 변환할 수 없으면 None이고 rating/comment_count/view_count만 0으로 채운다.
+# 결과의 키 순서는 ISSUE_FIELDS 순서로 항상 같다.
+transform_issue = compile_transform(ISSUE_FIELDS)
+
 
-def transform_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+def transform_issues(
+    issues: Iterable[Dict[str, Any]], output: str = "records"
+) -> Union[List[Dict[str, Any]], pa.Table, pd.DataFrame]:
     """
-    API 응답에서 받은 이슈 데이터를 변환합니다.
+    여러 이슈를 한 번에 열 단위로 변환합니다.
+
+    이슈 목록을 ISSUE_SCHEMA 타입의 Arrow 테이블로 읽은 뒤 ISSUE_FIELDS의 변환
+    (기본값, coords, opendate)을 열 전체에 대해 한 번에 계산한다. 결과는
+    transform_issue와 같다. 여러 페이지를 묶어 넘기면 (``itertools.chain``)
+    페이지마다 호출하는 것보다 빠르다. 레코드로 받을 이슈가 ``COLUMNAR_MIN_ISSUES``
+    개보다 적거나, 타입이 맞지 않거나 시간대 없는 날짜처럼 열 단위로 처리할 수
+    없는 값이 있으면 이슈마다 transform_issue로 변환한다.
 
     Args:
-        issue: 원본 이슈 데이터 딕셔너리
+        issues: 원본 이슈 데이터 딕셔너리들
+        output: "records" (bulk 저장용 딕셔너리 목록), "arrow" (pyarrow.Table),
+            "pandas" (DataFrame). Defaults to "records".
 
     Returns:
-        변환된 이슈 데이터 딕셔너리
+        변환된 이슈 데이터
     """
-    # 딕셔너리 컴프리헨션으로 필요한 필드 추출 (None 기본값 활용)
-    # 필요한 필드만 빠르게 추출
-    transformed = {k: issue.get(k, "") for k in REQUIRED_FIELDS}
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output} ({OUTPUT_FORMATS})")
+
+    issues = list(issues)
+    if output == "records" and len(issues) < COLUMNAR_MIN_ISSUES:
+        return [transform_issue(issue) for issue in issues]
+    try:
+        table = _transform_table(pa.Table.from_pylist(issues, schema=ISSUE_SCHEMA))
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        logger.warning(f"열 단위 변환 실패, 이슈별로 변환합니다: {e}")
+        records = [transform_issue(issue) for issue in issues]
+        if output == "records":
+            return records
+        table = pa.Table.from_pylist(records)
+
+    if output == "arrow":
+        return table
+    if output == "pandas":
+        return table.to_pandas()
+    return table.to_pylist()
 
-    # 숫자 필드 처리
-    for num_field in ("lat", "lng", "rating", "comment_count", "view_count"):
-        if num_field in transformed and transformed[num_field] == "":
-            transformed[num_field] = 0
 
-    # 좌표 정보 (조건 검사 최소화)
-    if issue.get("lat") is not None and issue.get("lng") is not None:
-        transformed["coords"] = f"{issue['lat']},{issue['lng']}"
+def _transform_table(table: pa.Table) -> pa.Table:
+    """ISSUE_SCHEMA 테이블을 ISSUE_FIELDS 순서의 문서 테이블로 변환한다."""
+    null = {name: pa.scalar(None, type_) for name, type_ in ARROW_TYPES.items()}
+    columns: Dict[str, pa.Array] = {}
+    for field in ISSUE_FIELDS:
+        if field.derive == "point":
+            lat, lon = (columns[name] for name in field.inputs)
+            valid = pc.and_(
+                pc.and_(pc.greater_equal(lat, -90.0), pc.less_equal(lat, 90.0)),
+                pc.and_(pc.greater_equal(lon, -180.0), pc.less_equal(lon, 180.0)),
+            )
+            column = pa.StructArray.from_arrays(
+                [lat, lon],
+                names=["lat", "lon"],
+                mask=pc.invert(pc.fill_null(valid, False)),
+            )
+        elif field.derive == "day":
+            column = pc.utf8_slice_codeunits(columns[field.inputs[0]], 0, 10)
+        elif field.derive == "geohash":
+            lat, lon = (
+                columns[name].to_numpy(zero_copy_only=False) for name in field.inputs
+            )
+            column = pa.array(encode_array(lat, lon, field.precision), pa.string())
+        elif field.derive == "fingerprint":
+            column = _fingerprint_column(
+                [
+                    (columns[other.name], other.type)
+                    for other in ISSUE_FIELDS
+                    if other.derive is None and other.name in columns
+                ]
+            )
+        elif field.derive == "prefix":
+            column = pc.utf8_slice_codeunits(
+                columns[field.inputs[0]], 0, field.precision
+            )
+        else:
+            column = table[field.key].combine_chunks()
+            if field.source_type is not None:
+                column = pc.cast(column, ARROW_TYPES[field.type])
+            if field.type == "float":
+                column = pc.if_else(pc.is_finite(column), column, null["float"])
+            elif field.type == "date":
+                column = pc.if_else(pc.equal(column, ""), null["date"], column)
+                # ISO 8601이 아니거나 시간대가 없으면 ArrowInvalid (이슈별 변환)
+                pc.cast(column, pa.timestamp("us", tz="UTC"))
+            if field.default is not None:
+                column = pc.fill_null(column, field.default)
+        columns[field.name] = column
+    return pa.Table.from_pydict(columns)
 
-    # 날짜 처리 (간단하게)
-    created_at = issue.get("created_at", "")
-    if created_at:
-        transformed["opendate"] = created_at.split("T")[0]
 
-    return transformed
+def _fingerprint_column(sources: List[Tuple[pa.Array, str]]) -> pa.Array:
+    """derive_fingerprint와 같은 지문 열
+
+    derive_fingerprint는 값 튜플의 repr을 해시한다. 열마다 repr 문자열을 Arrow로
+    만들고 행 단위로 이어 붙인 뒤 해시만 행마다 계산한다.
+    """
+    parts = [_repr_column(column, type_) for column, type_ in sources]
+    rows = pc.binary_join_element_wise(
+        "(", pc.binary_join_element_wise(*parts, ", "), ")", ""
+    )
+    return pa.array(
+        [
+            hashlib.blake2b(row.encode("utf-8"), digest_size=8).hexdigest()
+            for row in rows.to_pylist()
+        ],
+        pa.string(),
+    )
+
+
+def _repr_column(column: pa.Array, type_: str) -> pa.Array:
+    """값마다 repr(값)인 문자열 열 (null은 "None")
+
+    Arrow의 문자열 변환이 repr과 다를 수 있는 값(정수 값이거나 지수 표기인 float,
+    따옴표나 이스케이프가 필요한 문자열)만 파이썬 repr로 바꾼다.
+    """
+    if type_ == "integer":
+        return pc.fill_null(pc.cast(column, pa.string()), "None")
+    if type_ == "float":
+        text = pc.cast(column, pa.string())
+        exact = pc.and_(
+            pc.and_(
+                pc.match_substring(text, "."),
+                pc.invert(pc.match_substring(text, "e")),
+            ),
+            pc.greater_equal(pc.abs(column), 1e-4),
+        )
+    else:
+        text = pc.binary_join_element_wise("'", column, "'", "")
+        exact = pc.match_substring_regex(column, _PLAIN_STRING)
+    inexact = pc.invert(pc.fill_null(exact, True))
+    if pc.any(inexact).as_py():
+        reprs = [repr(value) for value in pc.filter(column, inexact).to_pylist()]
+        text = pc.replace_with_mask(text, inexact, pa.array(reprs, pa.string()))
+    return pc.fill_null(text, "None")
@@ -0,0 +1,354 @@
+import csv
+import io
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 생성 데이터셋 컬럼의 고정 타입 (CSV를 읽을 때 타입 추론을 건너뛴다)
+DATASET_DTYPES: Dict[str, str] = {
+    "name": "string",
+    "age": "int16",
+    "street": "string",
+    "city": "string",
+    "state": "string",
+    "zip": "string",
+    "lng": "float64",
+    "lat": "float64",
+}
+
+OUTPUT_FORMATS = {
+    "csv": (None, "gzip", "zstd"),
+    "parquet": (None, "snappy", "gzip", "zstd"),
+}
+
+_CSV_SUFFIXES = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+
+def dataset_suffix(output_format: str, compression: Optional[str] = None) -> str:
+    """출력 포맷과 압축 방식에 맞는 파일 확장자를 반환한다.
+
+    Args:
+        output_format (str): "csv" 또는 "parquet"
+        compression (Optional[str]): 압축 방식
+
+    Returns:
+        str: 파일 확장자 (예: ".csv.gz", ".parquet")
+    """
+    validate_format(output_format, compression)
+    if output_format == "parquet":
+        return ".parquet"
+    return _CSV_SUFFIXES[compression]
+
+
+def validate_format(output_format: str, compression: Optional[str] = None) -> None:
+    """출력 포맷과 압축 방식 조합을 검증한다.
+
+    Raises:
+        ValueError: 지원하지 않는 포맷 또는 압축 방식일 경우
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 포맷: {output_format}")
+    if compression not in OUTPUT_FORMATS[output_format]:
+        raise ValueError(
+            f"{output_format} 포맷에서 지원하지 않는 압축 방식: {compression}"
+        )
+
+
+def detect_format(path: Union[str, Path]) -> Tuple[str, Optional[str]]:
+    """파일 경로의 확장자로 포맷과 압축 방식을 추정한다.
+
+    Args:
+        path (Union[str, Path]): 데이터셋 파일 경로
+
+    Returns:
+        Tuple[str, Optional[str]]: (output_format, compression)
+    """
+    name = Path(path).name
+    if name.endswith(".parquet"):
+        return "parquet", None
+    if name.endswith(".gz"):
+        return "csv", "gzip"
+    if name.endswith(".zst"):
+        return "csv", "zstd"
+    return "csv", None
+
+
+def _compress_block(data: bytes, compression: Optional[str]) -> bytes:
+    """데이터 블록 하나를 독립된 gzip member / zstd frame으로 압축한다.
+
+    블록마다 압축 스트림을 닫기 때문에 파일은 항상 블록 경계에서 끝나고,
+    블록 단위로 이어 붙이거나 잘라내도 유효한 압축 파일로 남는다.
+    """
+    if compression == "gzip":
+        # wbits=31: gzip 헤더 (mtime=0이라 같은 데이터는 같은 바이트가 된다)
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+class DatasetWriter(ABC):
+    """배치(DataFrame) 단위로 데이터셋 파일을 기록하는 추상 클래스"""
+
+    def __init__(self, path: Union[str, Path], columns: List[str]):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.rows_written = 0
+
+    @abstractmethod
+    def write(self, batch: pd.DataFrame) -> None:
+        """배치 기록"""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """남은 데이터를 기록하고 파일을 닫는다"""
+        pass
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class CsvDatasetWriter(DatasetWriter):
+    """CSV (gzip/zstd 압축 포함) 데이터셋 기록기
+
+    배치마다 독립된 압축 블록으로 기록하므로, 기록 직후의 ``tell()`` 위치에서
+    파일을 잘라내고 ``append_at``으로 다시 열어 이어서 쓸 수 있다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        columns: List[str],
+        compression: Optional[str] = None,
+        header: bool = True,
+        append_at: Optional[int] = None,
+    ):
+        super().__init__(path, columns)
+        self.compression = compression
+        if append_at is None:
+            self._file = open(self.path, "wb")
+        else:
+            # 마지막으로 완료된 블록 뒤의 내용은 버리고 이어서 기록
+            self._file = open(self.path, "r+b")
+            self._file.truncate(append_at)
+            self._file.seek(append_at)
+        if header:
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerow(self.columns)
+            self._write_block(buffer.getvalue())
+
+    def _write_block(self, text: str) -> None:
+        self._file.write(_compress_block(text.encode("utf-8"), self.compression))
+
+    def write(self, batch: pd.DataFrame) -> None:
+        if len(batch):
+            self._write_block(
+                batch.to_csv(header=False, index=False, lineterminator="\n")
+            )
+        self.rows_written += len(batch)
+
+    def tell(self) -> int:
+        """기록된 데이터를 내보내고 현재 파일 위치(바이트)를 반환한다."""
+        self._file.flush()
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetDatasetWriter(DatasetWriter):
+    """Parquet 데이터셋 기록기
+
+    들어온 배치 크기와 상관없이 ``row_group_size`` 행 단위로 row group을 만든다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        columns: List[str],
+        compression: Optional[str] = "snappy",
+        row_group_size: int = 100_000,
+    ):
+        super().__init__(path, columns)
+        self.compression = compression or "none"
+        self.row_group_size = row_group_size
+        self._writer = None
+        self._pending: List[pd.DataFrame] = []
+        self._pending_rows = 0
+        self._closed = False
+
+    def write(self, batch: pd.DataFrame) -> None:
+        self._pending.append(batch)
+        self._pending_rows += len(batch)
+        self.rows_written += len(batch)
+        if self._pending_rows >= self.row_group_size:
+            self._flush(final=False)
+
+    def _flush(self, final: bool) -> None:
+        """대기 중인 배치를 row group 단위로 기록한다."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._pending:
+            return
+        frame = pd.concat(self._pending, ignore_index=True)
+        cut = len(frame) if final else len(frame) - len(frame) % self.row_group_size
+        table = pa.Table.from_pandas(frame.iloc[:cut], preserve_index=False)
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.path, table.schema, compression=self.compression
+            )
+        if cut:
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+
+        rest = frame.iloc[cut:]
+        self._pending = [rest] if len(rest) else []
+        self._pending_rows = len(rest)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is None and not self._pending:
+            # 빈 데이터셋도 컬럼 정보가 담긴 파일을 남긴다
+            self._pending = [_empty_frame(self.columns)]
+        self._flush(final=True)
+        self._writer.close()
+
+
+def _empty_frame(columns: List[str]) -> pd.DataFrame:
+    """고정 타입이 적용된 빈 DataFrame을 만든다."""
+    return pd.DataFrame(
+        {
+            column: pd.Series(dtype=DATASET_DTYPES.get(column, "object"))
+            for column in columns
+        }
+    )
+
+
+def open_dataset_writer(
+    path: Union[str, Path],
+    columns: List[str],
+    output_format: str = "csv",
+    compression: Optional[str] = None,
+    row_group_size: int = 100_000,
+    header: bool = True,
+    append_at: Optional[int] = None,
+) -> DatasetWriter:
+    """포맷에 맞는 데이터셋 기록기를 생성한다.
+
+    Args:
+        path (Union[str, Path]): 기록할 파일 경로
+        columns (List[str]): 컬럼 순서
+        output_format (str, optional): "csv" 또는 "parquet". Defaults to "csv".
+        compression (Optional[str], optional): 압축 방식. Defaults to None.
+        row_group_size (int, optional): Parquet row group 크기. Defaults to 100_000.
+        header (bool, optional): CSV 헤더 기록 여부. Defaults to True.
+        append_at (Optional[int], optional): 이 바이트 위치부터 이어서 기록 (CSV 전용).
+            Defaults to None (새 파일).
+
+    Returns:
+        DatasetWriter: 데이터셋 기록기
+
+    Raises:
+        ValueError: Parquet 파일에 이어쓰기를 요청한 경우
+    """
+    validate_format(output_format, compression)
+    if output_format == "parquet":
+        if append_at is not None:
+            raise ValueError("Parquet 데이터셋은 이어서 기록할 수 없습니다.")
+        return ParquetDatasetWriter(path, columns, compression, row_group_size)
+    return CsvDatasetWriter(path, columns, compression, header, append_at)
+
+
+def _part_files(path: Path) -> List[Path]:
+    """파티션 디렉토리 안의 part 파일 목록을 정렬해서 반환한다."""
+    return sorted(p for p in path.iterdir() if p.name.startswith("part-"))
+
+
+def _csv_options(path: Path, dtypes: Optional[Dict[str, str]] = None) -> dict:
+    _, compression = detect_format(path)
+    return {
+        "dtype": DATASET_DTYPES if dtypes is None else dtypes,
+        "compression": compression,
+        "keep_default_na": False,
+        "na_values": [""],
+    }
+
+
+def read_dataset(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """생성된 데이터셋(CSV/압축 CSV/Parquet 또는 파티션 디렉토리)을 읽는다.
+
+    CSV는 ``dtypes``(기본 ``DATASET_DTYPES``)로 타입을 고정해 추론 비용을 없애고,
+    Parquet은 저장된 타입을 그대로 사용한다. 스키마로 생성한 데이터셋은
+    ``schema_dtypes(config.schema)``를 넘긴다.
+
+    Args:
+        path (Union[str, Path]): 데이터셋 경로
+        columns (Optional[List[str]], optional): 읽을 컬럼. Defaults to None (전체).
+        dtypes (Optional[Dict[str, str]], optional): CSV 컬럼 타입.
+            Defaults to None (DATASET_DTYPES).
+
+    Returns:
+        pd.DataFrame: 데이터셋
+    """
+    path = Path(path)
+    if path.is_dir():
+        parts = [read_dataset(part, columns, dtypes) for part in _part_files(path)]
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+    output_format, _ = detect_format(path)
+    if output_format == "parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, **_csv_options(path, dtypes))
+
+
+def iter_dataset(
+    path: Union[str, Path],
+    batch_size: int = 100_000,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """데이터셋을 ``batch_size`` 행 단위 DataFrame으로 나눠 읽는다.
+
+    Args:
+        path (Union[str, Path]): 데이터셋 경로
+        batch_size (int, optional): 배치 크기. Defaults to 100_000.
+        dtypes (Optional[Dict[str, str]], optional): CSV 컬럼 타입.
+            Defaults to None (DATASET_DTYPES).
+
+    Yields:
+        pd.DataFrame: 배치 데이터
+    """
+    path = Path(path)
+    if path.is_dir():
+        for part in _part_files(path):
+            yield from iter_dataset(part, batch_size, dtypes)
+        return
+
+    output_format, _ = detect_format(path)
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield record_batch.to_pandas()
+        return
+
+    yield from pd.read_csv(path, chunksize=batch_size, **_csv_options(path, dtypes))
@@ -0,0 +1,113 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.utils.atomic_file import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# 파일의 줄 수가 저장된 id 수의 이 배수를 넘으면 읽을 때 압축한다
+COMPACT_RATIO = 2
+
+
+class FingerprintStore:
+    """이슈 id별 내용 지문(fingerprint)을 기록하는 로컬 파일
+
+    ``transform_issue``가 만든 ``fingerprint``와 비교해 새 이슈나 내용이 바뀐
+    이슈만 골라낸다. 파일은 ``id<TAB>fingerprint`` 줄을 덧붙여 쓰며 같은 id는
+    마지막 줄이 이긴다. 이슈 하나에 약 25바이트이고, 덧붙인 줄이 쌓이면 처음 읽을
+    때 id당 한 줄로 다시 쓴다. 기록 도중 중단되어 잘린 마지막 줄은 무시한다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """초기화
+
+        Args:
+            path (Union[str, Path]): 지문 파일 경로 (없으면 첫 기록 때 생성)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._hashes: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        if self._hashes is not None:
+            return self._hashes
+        hashes: Dict[str, str] = {}
+        lines = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    if not line.endswith("\n"):
+                        continue
+                    issue_id, sep, fingerprint = line[:-1].partition("\t")
+                    if sep and fingerprint:
+                        hashes[issue_id] = fingerprint
+        except FileNotFoundError:
+            pass
+        self._hashes = hashes
+        if lines > COMPACT_RATIO * max(len(hashes), 1):
+            self._compact()
+        return hashes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def get(self, issue_id: Any) -> Optional[str]:
+        """저장된 지문. 없으면 None"""
+        with self._lock:
+            return self._load().get(str(issue_id))
+
+    def changed(self, issues: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """새 이슈이거나 지문이 달라진 이슈만 반환한다. 지문이 없는 이슈는 항상 포함"""
+        with self._lock:
+            hashes = self._load()
+            return [
+                issue
+                for issue in issues
+                if issue.get("fingerprint") is None
+                or hashes.get(str(issue.get("id"))) != issue["fingerprint"]
+            ]
+
+    def record(self, issues: Iterable[Dict[str, Any]]) -> int:
+        """저장에 성공한 이슈들의 지문을 기록한다.
+
+        Returns:
+            int: 새로 기록한 지문 수
+        """
+        with self._lock:
+            hashes = self._load()
+            lines = []
+            for issue in issues:
+                fingerprint = issue.get("fingerprint")
+                issue_id = issue.get("id")
+                if fingerprint is None or issue_id is None:
+                    continue
+                issue_id = str(issue_id)
+                if hashes.get(issue_id) != fingerprint:
+                    hashes[issue_id] = fingerprint
+                    lines.append(f"{issue_id}\t{fingerprint}\n")
+            if lines:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            return len(lines)
+
+    def clear(self) -> None:
+        """모든 지문을 지운다 (인덱스를 지우고 다시 만들 때)"""
+        with self._lock:
+            self._hashes = {}
+            self.path.unlink(missing_ok=True)
+        logger.info(f"지문 파일 초기화: {self.path}")
+
+    def _compact(self) -> None:
+        write_atomic(
+            self.path,
+            "".join(
+                f"{issue_id}\t{fingerprint}\n"
+                for issue_id, fingerprint in self._hashes.items()
+            ),
+        )
+        logger.info(f"지문 파일 압축: {self.path} ({len(self._hashes)}개)")
@@ -0,0 +1,112 @@
+from typing import Optional
+
+import numpy as np
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+MAX_PRECISION = 12
+
+_BASE32_BYTES = np.frombuffer(BASE32.encode("ascii"), dtype=np.uint8)
+_SPREAD_STEPS = (
+    (16, 0x0000FFFF0000FFFF),
+    (8, 0x00FF00FF00FF00FF),
+    (4, 0x0F0F0F0F0F0F0F0F),
+    (2, 0x3333333333333333),
+    (1, 0x5555555555555555),
+)
+
+
+def _check_precision(precision: int) -> None:
+    if not 1 <= precision <= MAX_PRECISION:
+        raise ValueError(
+            f"precision은 1과 {MAX_PRECISION} 사이여야 합니다: {precision}"
+        )
+
+
+def _cells(value, low: float, high: float, bits: int):
+    """[low, high] 구간을 2**bits 칸으로 나눈 칸 번호 (이분 탐색을 한 번에 계산)"""
+    cells = 1 << bits
+    return min(int((value - low) / (high - low) * cells), cells - 1)
+
+
+def encode(lat: float, lon: float, precision: int) -> Optional[str]:
+    """좌표의 geohash. 좌표가 범위를 벗어나면 None
+
+    경도와 위도를 각각 칸 번호로 바꾼 뒤 비트를 번갈아 섞는다 (경도가 먼저).
+    비트마다 구간을 반으로 나누는 일반적인 구현과 결과가 같다.
+    precision이 작은 geohash는 큰 geohash의 접두사다.
+
+    Args:
+        lat (float): 위도 (-90 ~ 90)
+        lon (float): 경도 (-180 ~ 180)
+        precision (int): geohash 길이 (1 ~ 12)
+    """
+    _check_precision(precision)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        return None
+
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    lon_cell = _cells(lon, -180.0, 180.0, lon_bits)
+    lat_cell = _cells(lat, -90.0, 90.0, lat_bits)
+
+    # 위도 비트 수를 경도에 맞춰 (경도, 위도) 순서로 섞은 뒤 남는 비트를 버린다
+    lat_cell <<= lon_bits - lat_bits
+    code = (_spread(lon_cell) << 1 | _spread(lat_cell)) >> (2 * lon_bits - bits)
+    return "".join(BASE32[(code >> shift) & 31] for shift in range(bits - 5, -1, -5))
+
+
+def _spread(value: int) -> int:
+    """32비트 정수의 비트 사이에 0을 하나씩 끼워 넣는다 (b1b0 -> 0b10b0)"""
+    for shift, mask in _SPREAD_STEPS:
+        value = (value | (value << shift)) & mask
+    return value
+
+
+def _spread_array(values: np.ndarray) -> np.ndarray:
+    """_spread의 배열 버전"""
+    values = values.astype(np.uint64)
+    for shift, mask in _SPREAD_STEPS:
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def encode_array(lat: np.ndarray, lon: np.ndarray, precision: int) -> np.ndarray:
+    """좌표 배열의 geohash 배열 (encode의 벡터화 버전)
+
+    NaN이거나 범위를 벗어난 좌표는 None이다.
+
+    Args:
+        lat (np.ndarray): 위도 배열
+        lon (np.ndarray): 경도 배열
+        precision (int): geohash 길이 (1 ~ 12)
+
+    Returns:
+        np.ndarray: geohash 문자열(object) 배열
+    """
+    _check_precision(precision)
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    # NaN은 비교가 모두 False라 여기서 함께 걸러진다
+    valid = (lat >= -90.0) & (lat <= 90.0) & (lon >= -180.0) & (lon <= 180.0)
+
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    lon_cell = np.where(valid, (lon + 180.0) / 360.0, 0.0) * (1 << lon_bits)
+    lat_cell = np.where(valid, (lat + 90.0) / 180.0, 0.0) * (1 << lat_bits)
+    lon_cell = np.minimum(lon_cell.astype(np.uint64), (1 << lon_bits) - 1)
+    lat_cell = np.minimum(lat_cell.astype(np.uint64), (1 << lat_bits) - 1)
+
+    # 위도 비트 수를 경도에 맞춰 (경도, 위도) 순서로 섞은 뒤 남는 비트를 버린다
+    lat_cell = lat_cell << np.uint64(lon_bits - lat_bits)
+    code = (_spread_array(lon_cell) << np.uint64(1)) | _spread_array(lat_cell)
+    code = code >> np.uint64(2 * lon_bits - bits)
+
+    shifts = np.arange(bits - 5, -1, -5, dtype=np.uint64)
+    digits = ((code[:, None] >> shifts) & np.uint64(31)).astype(np.intp)
+    chars = np.ascontiguousarray(_BASE32_BYTES[digits]).view(f"S{precision}")[:, 0]
+
+    hashes = chars.astype(f"U{precision}").astype(object)
+    hashes[~valid] = None
+    return hashes
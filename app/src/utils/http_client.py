@@ -1,17 +1,398 @@
 import urllib3
+import asyncio
 import json
 import certifi
-from typing import Dict, Optional, Any
+import ssl
+import threading
+from typing import Dict, Mapping, Optional, Any, Tuple
+from urllib.parse import urlencode
 import logging
 import time
+from src.utils.json_stream import CHUNK_SIZE
+from src.utils.page_cache import CachedPage, PageCache
+from src.utils.rate_limiter import RateLimiter, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+
+
+class HttpClient:
+    """연결을 재사용하는 HTTP 클라이언트
+
+    하나의 urllib3 PoolManager를 공유해 TLS 핸드셰이크와 TCP 연결을
+    페이지마다 다시 맺지 않는다. 풀 크기는 동시에 요청하는 작업자 수에 맞추고,
+    풀이 가득 차면 새 연결을 만들지 않고 반납될 때까지 기다린다.
+
+    ``rate_limiter``를 지정하면 모든 요청이 공유 RateLimiter를 거치고,
+    429 응답 시 작업자마다 따로 쉬지 않고 RateLimiter가 전체 요청을 멈춘다.
+    ``cache``를 지정하면 캐시된 ETag/Last-Modified로 조건부 GET을 보내고
+    304 응답이면 캐시된 본문을 그대로 사용한다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[PageCache] = None,
+    ):
+        """초기화
+
+        Args:
+            max_connections (int, optional): 호스트당 유지할 연결 수 (작업자 수). Defaults to 10.
+            connect_timeout (float, optional): 연결 타임아웃(초). Defaults to 5.0.
+            read_timeout (float, optional): 응답 읽기 타임아웃(초). Defaults to 30.0.
+            max_retries (int, optional): 429 응답 시 최대 시도 횟수. Defaults to 3.
+            headers (Optional[Dict[str, str]], optional): 기본 헤더에 추가할 헤더
+            rate_limiter (Optional[RateLimiter], optional): 공유할 요청 제어기. Defaults to None.
+            cache (Optional[PageCache], optional): 조건부 GET에 사용할 응답 캐시. Defaults to None.
+        """
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._pool = urllib3.PoolManager(
+            maxsize=max_connections,
+            block=True,
+            headers=self.headers,
+            timeout=self.timeout,
+            retries=False,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+        )
+
+    @staticmethod
+    def build_url(base_url: str, params: Dict[str, Any]) -> str:
+        """쿼리 파라미터를 URL 인코딩해 요청 URL을 만든다."""
+        if not params:
+            return base_url
+        return f"{base_url}?{urlencode(params)}"
+
+    def fetch_page(
+        self,
+        base_url: str,
+        params: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """특정 페이지 데이터를 가져온다.
+
+        gzip 응답은 urllib3가 자동으로 풀어서 반환한다.
+
+        Args:
+            base_url (str): API endpoint
+            params (Dict[str, Any]): URL 쿼리 파라미터
+            max_retries (Optional[int], optional): 최대 시도 횟수.
+                Defaults to None (클라이언트 설정값).
+
+        Returns:
+            Optional[Dict[str, Any]]: 응답 데이터 딕션너리 || 오류 시 None
+        """
+        body = self.fetch_raw(base_url, params, max_retries)
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            logger.error(f"Exception occurred: {e}")
+            return None
+
+    def fetch_raw(
+        self,
+        base_url: str,
+        params: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """특정 페이지의 응답 본문을 (gzip을 푼) 원본 바이트 그대로 가져온다.
+
+        본문은 CHUNK_SIZE 단위로 읽으며 조각마다 gzip을 풀고, 다 읽으면 연결을
+        풀에 바로 돌려준다.
+
+        Args:
+            base_url (str): API endpoint
+            params (Dict[str, Any]): URL 쿼리 파라미터
+            max_retries (Optional[int], optional): 최대 시도 횟수.
+                Defaults to None (클라이언트 설정값).
+
+        Returns:
+            Optional[bytes]: 응답 본문 || 오류 시 None
+        """
+        url = self.build_url(base_url, params)
+        max_retries = self.max_retries if max_retries is None else max_retries
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        retries = 0
+        while retries < max_retries:
+            try:
+                response = self._request(url, headers)
+                try:
+                    data = b"".join(response.stream(CHUNK_SIZE))
+                finally:
+                    response.release_conn()
+                body = _cached_body(
+                    self.cache, url, cached, response.status, data, response.headers
+                )
+                if body is not None:
+                    return body
+                elif response.status == 429:  # 요청 제한에 걸린 경우
+                    retries += 1
+                    logger.warning(
+                        f"API 요청 제한 발생. {retries}/{max_retries} 재시도 중..."
+                    )
+                    if self.rate_limiter is None:
+                        time.sleep(2**retries)  # 지수 백오프 적용
+                    continue
+                else:
+                    logger.error(
+                        f"Error fetching page {params.get('page', 'unknown')}: Status code {response.status}"
+                    )
+                    return None
+            except Exception as e:
+                logger.error(f"Exception occurred: {e}")
+                return None
+
+        logger.error(f"최대 재시도 횟수 초과: {params.get('page', 'unknown')}")
+        return None
+
+    def _request(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> urllib3.BaseHTTPResponse:
+        """GET 요청을 보내고, RateLimiter가 있으면 결과를 반영한다.
+
+        본문은 읽지 않은 채로 반환하므로 호출하는 쪽에서 읽고 release_conn해야 한다.
+        """
+        # 요청별 헤더를 넘기면 PoolManager 기본 헤더를 대체하므로 합쳐서 넘긴다
+        headers = {**self.headers, **headers} if headers else None
+        if self.rate_limiter is None:
+            return self._pool.request(
+                "GET", url, headers=headers, preload_content=False
+            )
+
+        with self.rate_limiter.slot() as slot:
+            response = self._pool.request(
+                "GET", url, headers=headers, preload_content=False
+            )
+            slot.status = response.status
+            slot.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        return response
+
+    def close(self) -> None:
+        """열려 있는 연결을 모두 닫는다."""
+        self._pool.clear()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class AsyncHttpClient:
+    """asyncio용 HTTP 클라이언트 (aiohttp)
+
+    HttpClient와 같은 헤더/타임아웃/재시도 규칙을 따르며, 하나의 이벤트 루프에서
+    수백 개의 요청을 동시에 처리할 수 있도록 연결 풀을 공유한다.
+    세션은 처음 요청할 때 실행 중인 이벤트 루프 안에서 만든다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[PageCache] = None,
+    ):
+        """초기화
+
+        Args:
+            max_connections (int, optional): 동시에 유지할 최대 연결 수. Defaults to 100.
+            connect_timeout (float, optional): 연결 타임아웃(초). Defaults to 5.0.
+            read_timeout (float, optional): 응답 읽기 타임아웃(초). Defaults to 30.0.
+            max_retries (int, optional): 429 응답 시 최대 시도 횟수. Defaults to 3.
+            headers (Optional[Dict[str, str]], optional): 기본 헤더에 추가할 헤더
+            rate_limiter (Optional[RateLimiter], optional): 공유할 요청 제어기. Defaults to None.
+            cache (Optional[PageCache], optional): 조건부 GET에 사용할 응답 캐시. Defaults to None.
+        """
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+            )
+        return self._session
+
+    async def fetch_page(
+        self,
+        base_url: str,
+        params: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """특정 페이지 데이터를 가져온다.
+
+        Args:
+            base_url (str): API endpoint
+            params (Dict[str, Any]): URL 쿼리 파라미터
+            max_retries (Optional[int], optional): 최대 시도 횟수.
+                Defaults to None (클라이언트 설정값).
+
+        Returns:
+            Optional[Dict[str, Any]]: 응답 데이터 딕션너리 || 오류 시 None
+        """
+        body = await self.fetch_raw(base_url, params, max_retries)
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            logger.error(f"Exception occurred: {e}")
+            return None
+
+    async def fetch_raw(
+        self,
+        base_url: str,
+        params: Dict[str, Any],
+        max_retries: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """특정 페이지의 응답 본문을 원본 바이트 그대로 가져온다. (HttpClient.fetch_raw 참고)"""
+        url = HttpClient.build_url(base_url, params)
+        max_retries = self.max_retries if max_retries is None else max_retries
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        retries = 0
+        while retries < max_retries:
+            try:
+                status, data, response_headers = await self._request(url, headers)
+                body = _cached_body(
+                    self.cache, url, cached, status, data, response_headers
+                )
+                if body is not None:
+                    return body
+                elif status == 429:  # 요청 제한에 걸린 경우
+                    retries += 1
+                    logger.warning(
+                        f"API 요청 제한 발생. {retries}/{max_retries} 재시도 중..."
+                    )
+                    if self.rate_limiter is None:
+                        await asyncio.sleep(2**retries)  # 지수 백오프 적용
+                    continue
+                else:
+                    logger.error(
+                        f"Error fetching page {params.get('page', 'unknown')}: Status code {status}"
+                    )
+                    return None
+            except Exception as e:
+                logger.error(f"Exception occurred: {e}")
+                return None
+
+        logger.error(f"최대 재시도 횟수 초과: {params.get('page', 'unknown')}")
+        return None
+
+    async def _request(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes, Mapping[str, str]]:
+        """GET 요청을 보내고 (상태 코드, 본문, 응답 헤더)를 반환한다."""
+        session = self._get_session()
+        if self.rate_limiter is None:
+            async with session.get(url, headers=headers) as response:
+                return response.status, await response.read(), response.headers
+
+        async with self.rate_limiter.slot_async() as slot:
+            async with session.get(url, headers=headers) as response:
+                slot.status = response.status
+                slot.retry_after = parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                return response.status, await response.read(), response.headers
+
+    async def close(self) -> None:
+        """세션과 연결을 닫는다."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+def _cached_body(
+    cache: Optional[PageCache],
+    url: str,
+    cached: Optional[CachedPage],
+    status: int,
+    body: bytes,
+    headers: Mapping[str, str],
+) -> Optional[bytes]:
+    """성공 응답이면 캐시를 갱신하고 사용할 본문을 반환한다.
+
+    200이면 새 본문과 검증자를 캐시에 저장하고, 304면 캐시된 본문을 반환한다.
+    그 외 상태 코드는 None
+    """
+    if status == 304 and cached is not None:
+        cache.record(hit=True)
+        return cached.body
+    if status == 200:
+        if cache is not None:
+            cache.store(url, body, headers.get("ETag"), headers.get("Last-Modified"))
+            cache.record(hit=False)
+        return body
+    return None
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HttpClient:
+    """프로세스에서 공유하는 기본 HttpClient를 반환한다."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
+
 
 # 동시에 여러 요청을 처리하므로 딜레이를 더 짧게 설정
 # 또는 429 (Too Many Requests) 오류가 발생할 때만 지연을 두는 방식 적용
 def fetch_page(
-    base_url: str, params: Dict[str, Any], max_retries: int = 3
+    base_url: str,
+    params: Dict[str, Any],
+    max_retries: int = 3,
+    client: Optional[HttpClient] = None,
 ) -> Optional[Dict[str, Any]]:
     """특정 페이지 데이터를 가져온다.
 
@@ -19,35 +400,11 @@ def fetch_page(
         base_url (str): API endpoint
         params (Dict[str, Any]): URL 쿼리 파라미터
         max_retries (int, optional): 최대 시도 횟수. Defaults to 3.
+        client (Optional[HttpClient], optional): 사용할 클라이언트.
+            Defaults to None (공유 기본 클라이언트).
 
     Returns:
         Optional[Dict[str, Any]]: 응답 데이터 딕션너리 || 오류 시 None
     """
-    http = urllib3.PoolManager(cert_reqs="CERT_REQUIRED", ca_certs=certifi.where())
-    query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-    url = f"{base_url}?{query_string}"
-
-    retries = 0
-    while retries < max_retries:
-        try:
-            response = http.request("GET", url)
-            if response.status == 200:
-                return json.loads(response.data.decode("utf-8"))
-            elif response.status == 429:  # 요청 제한에 걸린 경우
-                retries += 1
-                logger.warning(
-                    f"API 요청 제한 발생. {retries}/{max_retries} 재시도 중..."
-                )
-                time.sleep(2**retries)  # 지수 백오프 적용
-                continue
-            else:
-                logger.error(
-                    f"Error fetching page {params.get('page', 'unknown')}: Status code {response.status}"
-                )
-                return None
-        except Exception as e:
-            logger.error(f"Exception occurred: {e}")
-            return None
-
-    logger.error(f"최대 재시도 횟수 초과: {params.get('page', 'unknown')}")
-    return None
+    client = client or get_default_client()
+    return client.fetch_page(base_url, params, max_retries=max_retries)
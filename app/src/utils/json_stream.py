@@ -0,0 +1,178 @@
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# 응답 본문을 나눠 읽는 기본 크기
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+# 값이 아직 다 도착하지 않았음을 나타내는 표식
+_INCOMPLETE = object()
+
+
+def iter_chunks(data: bytes, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """bytes를 복사하지 않고 chunk_size 단위로 나눈다."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+class JsonArrayStream:
+    """최상위 JSON 객체 안의 배열 하나를 요소 단위로 읽는 증분 파서
+
+    ``{"issues": [...], "metadata": {...}}`` 같은 응답을 바이트 조각으로 받으면서
+    ``key`` 배열의 요소가 완성될 때마다 돌려준다. 문자열로 디코딩된 본문 전체나
+    전체 파싱 트리를 만들지 않고, 버퍼에는 아직 완성되지 않은 요소만 남긴다.
+    배열 외의 최상위 멤버(``metadata`` 등)는 ``fields``에 모은다.
+
+    Example:
+        >>> parser = JsonArrayStream("issues")
+        >>> for issue in parser.iter_items(iter_chunks(body)):
+        ...     handle(issue)
+        >>> parser.fields["metadata"]
+    """
+
+    def __init__(self, key: str):
+        """초기화
+
+        Args:
+            key (str): 요소 단위로 읽을 최상위 배열의 키
+        """
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self.found = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._member: Optional[str] = None
+
+    def iter_items(self, chunks: Iterable[bytes]) -> Iterator[Any]:
+        """바이트 조각을 차례로 넣으며 배열 요소를 하나씩 반환하고, 끝나면 close한다.
+
+        Raises:
+            ValueError: JSON 형식이 잘못되었거나 본문이 중간에 끊긴 경우
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """바이트 조각을 넣고 새로 완성된 배열 요소를 반환한다.
+
+        Raises:
+            ValueError: JSON 형식이 잘못된 경우
+        """
+        return self._feed(self._decoder.decode(chunk), final=False)
+
+    def close(self) -> List[Any]:
+        """입력이 끝났음을 알리고 남은 요소를 반환한다.
+
+        Raises:
+            ValueError: JSON 형식이 잘못되었거나 본문이 중간에 끊긴 경우
+        """
+        items = self._feed(self._decoder.decode(b"", final=True), final=True)
+        if self._state != "end":
+            raise ValueError("JSON 본문이 중간에 끊겼습니다.")
+        return items
+
+    def _feed(self, text: str, final: bool) -> List[Any]:
+        # 이미 처리한 앞부분을 버려 버퍼에는 미완성 부분만 남긴다
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        items = []
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer):
+                return items
+            char = self._buffer[self._pos]
+            state = self._state
+
+            if state == "start":
+                self._expect(char, "{")
+                self._state = "first_member"
+            elif state in ("first_member", "next_member") and char == "}":
+                self._pos += 1
+                self._state = "end"
+            elif state == "next_member":
+                # 멤버 사이에는 쉼표가 정확히 하나 있어야 한다
+                self._expect(char, ",")
+                self._state = "member"
+            elif state in ("first_member", "member"):
+                # 키 자리에 쉼표나 } 가 오면 빈 멤버나 끝의 쉼표
+                if char != '"':
+                    raise ValueError(f"객체 키 위치에 {char!r}가 있습니다.")
+                member = self._decode(final)
+                if member is _INCOMPLETE:
+                    return items
+                self._member = member
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(char, ":")
+                self._state = "value"
+            elif state == "value":
+                if self._member == self.key:
+                    self._expect(char, "[")
+                    self.found = True
+                    self._state = "first_item"
+                else:
+                    value = self._decode(final)
+                    if value is _INCOMPLETE:
+                        return items
+                    self.fields[self._member] = value
+                    self._state = "next_member"
+            elif state == "first_item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next_member"
+                else:
+                    self._state = "item"
+            elif state == "item":
+                # 요소 자리에 쉼표나 ] 가 오면 빈 요소나 끝의 쉼표
+                if char in ",]":
+                    raise ValueError(f"배열 요소 위치에 {char!r}가 있습니다.")
+                item = self._decode(final)
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self._state = "next_item"
+            elif state == "next_item":
+                if char == ",":
+                    self._pos += 1
+                    self._state = "item"
+                else:
+                    self._expect(char, "]")
+                    self._state = "next_member"
+            else:
+                raise ValueError(f"JSON 객체 뒤에 데이터가 있습니다: {char!r}")
+
+    def _skip_whitespace(self) -> None:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"'{expected}' 위치에 {char!r}가 있습니다.")
+        self._pos += 1
+
+    def _decode(self, final: bool) -> Any:
+        """버퍼의 현재 위치에서 JSON 값 하나를 읽는다. 아직 덜 받았으면 _INCOMPLETE"""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE
+        # 버퍼 끝에서 끝난 숫자는 다음 조각에서 자릿수가 이어질 수 있다
+        if (
+            not final
+            and end == len(self._buffer)
+            and isinstance(value, (int, float))
+            and not isinstance(value, bool)
+        ):
+            return _INCOMPLETE
+        self._pos = end
+        return value
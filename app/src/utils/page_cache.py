@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from src.utils.atomic_file import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """캐시에 저장된 응답"""
+
+    url: str
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def json(self) -> dict:
+        return json.loads(self.body)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """저장된 검증자로 조건부 GET 헤더를 만든다."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """요청 URL을 키로 응답 본문과 검증자(ETag/Last-Modified)를 보관하는 디스크 캐시
+
+    URL의 SHA-256 해시를 파일명으로 써서 ``{key}.body``에 원본 바이트를,
+    ``{key}.meta.json``에 URL, 검증자, 저장 시각을 저장한다. 두 파일 모두 임시
+    파일에 쓴 뒤 교체하므로 여러 작업자가 동시에 써도 깨진 파일이 남지 않는다.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """초기화
+
+        Args:
+            directory (Union[str, Path]): 캐시 디렉토리 (없으면 생성)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, url: str):
+        key = self.key(url)
+        return self.directory / f"{key}.body", self.directory / f"{key}.meta.json"
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """캐시된 응답을 반환한다. 없으면 None"""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        return CachedPage(url, body, meta.get("etag"), meta.get("last_modified"))
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """응답 본문(압축 해제된 원본 바이트)과 검증자를 저장한다."""
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time_ns(),
+        }
+        # 본문을 먼저 교체한다. 그 사이에 중단되면 이전 검증자가 남으므로
+        # 다음 조건부 GET에서 서버가 최신 본문을 다시 보내거나 304로 확인해 준다
+        write_atomic(body_path, body)
+        write_atomic(meta_path, json.dumps(meta))
+
+    def record(self, hit: bool) -> None:
+        """캐시 적중 여부를 통계에 반영한다."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def delete(self, url: str) -> None:
+        """캐시된 응답을 지운다 (없으면 무시)"""
+        body_path, meta_path = self._paths(url)
+        # 메타데이터를 먼저 지워 본문만 남더라도 캐시에서 보이지 않게 한다
+        meta_path.unlink(missing_ok=True)
+        body_path.unlink(missing_ok=True)
+
+    def iter_pages(self) -> Iterator[CachedPage]:
+        """캐시된 모든 응답을 저장한 순서로 반환한다.
+
+        같은 이슈가 여러 응답에 있으면 나중에 저장한 응답이 최신이므로, 이 순서로
+        다시 색인하면 최신 내용이 남는다. 저장 시각이 없는 이전 형식의 항목은
+        메타데이터 파일의 수정 시각을 쓴다.
+        """
+        entries = []
+        for meta_path in self.directory.glob("*.meta.json"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                url = meta["url"]
+                stored_at = meta.get("stored_at") or meta_path.stat().st_mtime_ns
+            except (ValueError, KeyError, FileNotFoundError):
+                logger.warning(f"손상된 캐시 메타데이터 무시: {meta_path}")
+                continue
+            entries.append((stored_at, url))
+        for _, url in sorted(entries):
+            page = self.get(url)
+            if page is not None:
+                yield page
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.meta.json"))
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.utils.atomic_file import write_atomic
+
+logger = logging.getLogger(__name__)
+
+DONE = "done"
+FAILED = "failed"
+
+
+def page_checksum(body: bytes) -> str:
+    """페이지 응답 본문(디스크에 저장한 원본 바이트)의 SHA-256 체크섬"""
+    return hashlib.sha256(body).hexdigest()
+
+
+class PageManifest:
+    """전체 수집의 페이지별 상태(done/failed), 이슈 수, 체크섬을 기록하는 매니페스트
+
+    JSON Lines 파일로, 첫 줄에 수집 파라미터를 쓰고 이후 페이지 결과가 나올 때마다
+    한 줄씩 덧붙인다. 같은 페이지의 기록은 마지막 줄이 이긴다. 페이지마다 파일
+    전체를 다시 쓰지 않으므로 수천 페이지를 수집해도 기록 비용이 일정하고,
+    기록 도중 중단되어 잘린 마지막 줄은 읽을 때 무시한다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """초기화
+
+        Args:
+            path (Union[str, Path]): 매니페스트 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._params: Optional[Dict[str, Any]] = None
+        self._pages: Dict[int, Dict[str, Any]] = {}
+
+    def start(self, params: Dict[str, Any], resume: bool = False) -> int:
+        """수집을 시작한다.
+
+        ``resume``이고 기존 매니페스트의 파라미터가 같으면 기록을 이어 쓰고,
+        아니면 새 매니페스트를 만든다.
+
+        Args:
+            params (Dict[str, Any]): 수집 파라미터 (page 제외)
+            resume (bool, optional): 기존 기록을 이어 쓸지 여부. Defaults to False.
+
+        Returns:
+            int: 이미 완료된 페이지 수
+        """
+        params = {k: v for k, v in params.items() if k != "page"}
+        with self._lock:
+            self._params = params
+            self._pages = {}
+            if resume:
+                stored_params, pages = self._load()
+                if stored_params == params:
+                    self._pages = pages
+                elif stored_params is not None:
+                    logger.warning(
+                        "수집 파라미터가 달라 기존 매니페스트를 버립니다: "
+                        f"{stored_params} -> {params}"
+                    )
+            # 이어 쓰는 경우에도 페이지당 한 줄로 압축해 다시 쓴다
+            lines = [json.dumps({"params": params}, sort_keys=True)]
+            lines.extend(
+                json.dumps(record, sort_keys=True)
+                for _, record in sorted(self._pages.items())
+            )
+            write_atomic(self.path, "\n".join(lines) + "\n")
+            return len(self.pages(DONE))
+
+    def _load(self):
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None, {}
+        params, pages = None, {}
+        for line_num, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"매니페스트 {self.path}의 {line_num + 1}번째 줄 무시")
+                continue
+            if line_num == 0:
+                params = record.get("params")
+            elif "page" in record:
+                pages[int(record["page"])] = record
+        return params, pages
+
+    def _append(self, page_num: int, **fields: Any) -> None:
+        if self._params is None:
+            raise ValueError("start()를 먼저 호출해야 합니다.")
+        with self._lock:
+            previous = self._pages.get(page_num, {})
+            record = {
+                "page": page_num,
+                "attempts": previous.get("attempts", 0) + 1,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+                **fields,
+            }
+            self._pages[page_num] = record
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, sort_keys=True) + "\n")
+
+    def mark_done(self, page_num: int, items: int, checksum: str) -> None:
+        """페이지 수집과 저장이 끝났음을 기록한다."""
+        self._append(page_num, status=DONE, items=items, checksum=checksum, error=None)
+
+    def mark_failed(self, page_num: int, error: str) -> None:
+        """페이지 수집 또는 저장 실패를 기록한다."""
+        self._append(page_num, status=FAILED, error=error)
+
+    def get(self, page_num: int) -> Optional[Dict[str, Any]]:
+        """페이지의 마지막 기록. 없으면 None"""
+        return self._pages.get(page_num)
+
+    def is_done(self, page_num: int) -> bool:
+        record = self._pages.get(page_num)
+        return record is not None and record["status"] == DONE
+
+    def pages(self, status: Optional[str] = None) -> List[int]:
+        """기록된 페이지 번호 (status를 주면 해당 상태만)"""
+        return sorted(
+            page_num
+            for page_num, record in self._pages.items()
+            if status is None or record["status"] == status
+        )
+
+    def summary(self) -> Dict[str, int]:
+        """상태별 페이지 수와 완료된 이슈 수"""
+        done = [self._pages[p] for p in self.pages(DONE)]
+        return {
+            DONE: len(done),
+            FAILED: len(self.pages(FAILED)),
+            "items": sum(record["items"] for record in done),
+        }
@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 같은 혼잡 신호로 동시 요청 수를 연달아 줄이지 않는 최소 간격 (초)
+MIN_DECREASE_INTERVAL = 0.05
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[datetime] = None
+) -> Optional[float]:
+    """Retry-After 헤더 값을 대기 시간(초)으로 변환한다.
+
+    Args:
+        value (Optional[str]): 초 단위 숫자 또는 HTTP-date
+        now (Optional[datetime], optional): HTTP-date 계산 기준 시각. Defaults to 현재 시각.
+
+    Returns:
+        Optional[float]: 대기 시간(초). 값이 없거나 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RateLimiter:
+    """모든 수집 작업자가 공유하는 적응형 요청 제어기
+
+    세 가지 규칙을 함께 적용한다.
+
+    - 토큰 버킷: 초당 ``rate``개, 최대 ``burst``개까지 요청을 허용한다.
+    - Retry-After: 429 응답을 받으면 모든 작업자가 서버가 요청한 시간
+      (헤더가 없으면 연속 429 횟수에 따른 지수 백오프)만큼 함께 쉰다.
+    - AIMD: 동시에 진행할 수 있는 요청 수를 성공할 때마다 조금씩 늘리고,
+      429나 ``latency_threshold``를 넘는 응답이면 ``decrease_factor``배로 줄인다.
+
+    대기 시간 계산은 잠금 안에서 한 번에 처리하므로 스레드(``slot``)와
+    asyncio(``slot_async``) 작업자가 같은 인스턴스를 공유할 수 있다. 동시 요청
+    수가 가득 찬 작업자는 시간을 정해 다시 확인하지 않고, 슬롯이 반납될 때
+    깨어난다 (스레드는 Condition, asyncio는 이벤트 루프별 Future). 정해진 시간만큼
+    기다리는 것은 토큰 버킷과 Retry-After뿐이다.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        initial_concurrency: int = 5,
+        min_concurrency: int = 1,
+        max_concurrency: int = 50,
+        decrease_factor: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """초기화
+
+        Args:
+            rate (Optional[float], optional): 초당 허용 요청 수. Defaults to None (제한 없음).
+            burst (Optional[int], optional): 버킷 크기. Defaults to None (rate를 올림한 값).
+            initial_concurrency (int, optional): 시작 동시 요청 수. Defaults to 5.
+            min_concurrency (int, optional): 동시 요청 수 하한. Defaults to 1.
+            max_concurrency (int, optional): 동시 요청 수 상한. Defaults to 50.
+            decrease_factor (float, optional): 감소 시 곱하는 비율. Defaults to 0.5.
+            latency_threshold (Optional[float], optional): 이보다 느린 응답을 혼잡 신호로 본다(초).
+                Defaults to None (지연 시간은 보지 않음).
+            base_backoff (float, optional): Retry-After가 없을 때 첫 대기 시간(초). Defaults to 1.0.
+            max_backoff (float, optional): 최대 대기 시간(초). Defaults to 60.0.
+            clock (Callable[[], float], optional): 단조 시계. Defaults to time.monotonic.
+        """
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("1 <= min_concurrency <= max_concurrency 여야 합니다.")
+
+        self.rate = rate
+        self.burst = burst or (math.ceil(rate) if rate else 1)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+        # 슬롯이 반납되면 기다리는 스레드와 코루틴을 깨운다
+        self._released = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self._tokens = float(self.burst)
+        self._refilled_at = clock()
+        self._concurrency = float(
+            min(max(initial_concurrency, min_concurrency), max_concurrency)
+        )
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = -math.inf
+        self._avg_latency = 0.0
+        self._consecutive_429 = 0
+
+        # 통계
+        self.requests = 0
+        self.throttled = 0
+
+    @property
+    def concurrency(self) -> int:
+        """현재 허용된 동시 요청 수"""
+        return int(self._concurrency)
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 요청 수"""
+        return self._in_flight
+
+    def _try_acquire(self) -> Optional[float]:
+        """요청 슬롯을 얻으면 0, 아니면 다시 시도하기까지 기다릴 시간(초)을 반환한다.
+
+        동시 요청 수가 가득 차 슬롯이 반납될 때까지 기다려야 하면 None.
+        """
+        with self._lock:
+            return self._try_acquire_locked()
+
+    def _try_acquire_locked(self) -> Optional[float]:
+        now = self._clock()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        if self._in_flight >= self.concurrency:
+            return None
+
+        if self.rate:
+            elapsed = now - self._refilled_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._refilled_at = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+
+        self._in_flight += 1
+        self.requests += 1
+        return 0.0
+
+    def acquire(self) -> None:
+        """요청 슬롯을 얻을 때까지 현재 스레드를 대기시킨다."""
+        with self._released:
+            while True:
+                wait = self._try_acquire_locked()
+                if wait == 0:
+                    return
+                # 기다리는 동안 잠금을 놓고, 반납되거나 wait초가 지나면 다시 확인한다
+                self._released.wait(wait)
+
+    async def acquire_async(self) -> None:
+        """요청 슬롯을 얻을 때까지 이벤트 루프를 막지 않고 대기한다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                wait = self._try_acquire_locked()
+                if wait == 0:
+                    return
+                if wait is None:
+                    # 확인과 등록을 같은 잠금 안에서 해야 반납 알림을 놓치지 않는다
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+            if wait is not None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter[1]
+            finally:
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def _notify_released(self) -> None:
+        """슬롯이 비었으면 기다리는 스레드와 코루틴을 모두 깨운다 (잠금 안에서 호출)."""
+        if self._in_flight >= self.concurrency:
+            return
+        self._released.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+    def release(
+        self,
+        status: Optional[int] = None,
+        latency: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """요청 결과를 반영하고 슬롯을 반납한다.
+
+        Args:
+            status (Optional[int], optional): HTTP 상태 코드. None이면 연결 오류로 본다.
+            latency (Optional[float], optional): 응답 시간(초)
+            retry_after (Optional[float], optional): Retry-After로 받은 대기 시간(초)
+        """
+        with self._lock:
+            try:
+                self._record(status, latency, retry_after)
+            finally:
+                self._notify_released()
+
+    def _record(
+        self,
+        status: Optional[int],
+        latency: Optional[float],
+        retry_after: Optional[float],
+    ) -> None:
+        """요청 결과를 반영한다 (잠금 안에서 호출)."""
+        self._in_flight = max(0, self._in_flight - 1)
+        now = self._clock()
+
+        if status == 429:
+            self.throttled += 1
+            self._consecutive_429 += 1
+            if retry_after is None:
+                retry_after = min(
+                    self.max_backoff,
+                    self.base_backoff * 2 ** (self._consecutive_429 - 1),
+                )
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            self._decrease(now)
+            logger.warning(
+                f"API 요청 제한 발생. {retry_after:.1f}초 대기, "
+                f"동시 요청 수 {self.concurrency}"
+            )
+            return
+
+        if status is None or status >= 500:
+            return
+
+        self._consecutive_429 = 0
+        if latency is not None:
+            self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+        if (
+            self.latency_threshold is not None
+            and latency is not None
+            and latency > self.latency_threshold
+        ):
+            self._decrease(now)
+        else:
+            # 요청 하나가 성공할 때마다 1/concurrency씩 늘려 한 윈도우에 1 증가
+            self._concurrency = min(
+                self.max_concurrency, self._concurrency + 1 / self._concurrency
+            )
+
+    def _decrease(self, now: float) -> None:
+        """동시 요청 수를 줄인다.
+
+        같은 혼잡 신호를 받은 동시 요청들 때문에 연달아 줄지 않도록, 한 번 줄인 뒤에는
+        평균 응답 시간만큼 다시 줄이지 않는다.
+        """
+        if now - self._last_decrease < max(self._avg_latency, MIN_DECREASE_INTERVAL):
+            return
+        self._last_decrease = now
+        self._concurrency = max(
+            self.min_concurrency, self._concurrency * self.decrease_factor
+        )
+
+    @contextmanager
+    def slot(self) -> Iterator["_SlotResult"]:
+        """슬롯을 얻고, 블록이 끝나면 기록된 결과로 반납하는 컨텍스트 매니저
+
+        Yields:
+            _SlotResult: ``status``/``retry_after``를 기록할 객체
+        """
+        self.acquire()
+        result = _SlotResult(self._clock())
+        try:
+            yield result
+        finally:
+            self.release(
+                result.status, self._clock() - result.started_at, result.retry_after
+            )
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator["_SlotResult"]:
+        """``slot``의 asyncio 버전"""
+        await self.acquire_async()
+        result = _SlotResult(self._clock())
+        try:
+            yield result
+        finally:
+            self.release(
+                result.status, self._clock() - result.started_at, result.retry_after
+            )
+
+
+def _wake(future: asyncio.Future) -> None:
+    """기다리는 코루틴을 깨운다 (취소된 경우는 무시)."""
+    if not future.done():
+        future.set_result(None)
+
+
+class _SlotResult:
+    """slot 안에서 받은 응답 정보"""
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
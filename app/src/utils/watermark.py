@@ -0,0 +1,133 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from src.utils.atomic_file import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """API의 ISO 8601 시각 문자열을 datetime으로 바꾼다. 해석할 수 없으면 None"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _is_later(value: str, than: Optional[str]) -> bool:
+    if than is None:
+        return True
+    new, old = _parse_timestamp(value), _parse_timestamp(than)
+    if new is None:
+        return False
+    if old is None:
+        return True
+    try:
+        return new > old
+    except TypeError:
+        # 시간대가 있는 값과 없는 값은 문자열로 비교
+        return value > than
+
+
+def rewind_timestamp(value: str, seconds: float) -> str:
+    """시각 문자열을 seconds초 앞당긴 ISO 8601 문자열. 해석할 수 없으면 그대로 돌려준다."""
+    parsed = _parse_timestamp(value)
+    if parsed is None:
+        return value
+    return (parsed - timedelta(seconds=seconds)).isoformat()
+
+
+def issue_timestamp(issue: Dict[str, Any]) -> Optional[str]:
+    """이슈의 변경 시각 (updated_at, 없으면 created_at)"""
+    return issue.get("updated_at") or issue.get("created_at")
+
+
+def latest_timestamp(values: Iterable[Optional[str]]) -> Optional[str]:
+    """시각 문자열 중 가장 늦은 값. 해석할 수 없는 값은 무시한다."""
+    latest = None
+    for value in values:
+        if value and _parse_timestamp(value) and _is_later(value, latest):
+            latest = value
+    return latest
+
+
+class WatermarkTracker:
+    """수집 중에 본 이슈들의 최신 변경 시각(updated_at, 없으면 created_at)을 추적한다.
+
+    여러 작업자 스레드가 동시에 ``observe``를 호출할 수 있다. 성공한 페이지 수를 함께
+    세어 모든 페이지를 받았을 때만 워터마크를 올릴 수 있게 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latest: Optional[str] = None
+        self.pages = 0
+
+    def observe(self, issues: Iterable[Dict[str, Any]]) -> None:
+        """한 페이지의 이슈들을 반영한다."""
+        self.record(latest_timestamp(issue_timestamp(issue) for issue in issues))
+
+    def record(self, latest: Optional[str]) -> None:
+        """한 페이지의 최신 변경 시각(``latest_timestamp``로 구한 값)을 반영한다."""
+        with self._lock:
+            self.pages += 1
+            if latest is not None and _is_later(latest, self.latest):
+                self.latest = latest
+
+
+class WatermarkStore:
+    """``place_url``/``status``별 워터마크(마지막으로 수집한 변경 시각)를 저장하는 JSON 파일
+
+    파일은 ``{"bernalillo-county:Archived": "2024-05-01T10:00:00-06:00"}`` 형식이며
+    임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 이전 값이 남는다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """초기화
+
+        Args:
+            path (Union[str, Path]): 워터마크 파일 경로 (없으면 첫 저장 때 생성)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(place_url: str, status: str) -> str:
+        return f"{place_url}:{status}"
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"손상된 워터마크 파일 무시: {self.path}")
+            return {}
+
+    def get(self, place_url: str, status: str) -> Optional[str]:
+        """저장된 워터마크를 반환한다. 없으면 None (전체 수집)"""
+        return self._load().get(self.key(place_url, status))
+
+    def advance(self, place_url: str, status: str, value: Optional[str]) -> bool:
+        """워터마크를 value로 올린다. 기존 값보다 늦은 시각일 때만 저장한다.
+
+        Returns:
+            bool: 저장했는지 여부
+        """
+        if value is None:
+            return False
+        with self._lock:
+            watermarks = self._load()
+            key = self.key(place_url, status)
+            if not _is_later(value, watermarks.get(key)):
+                return False
+            watermarks[key] = value
+            write_atomic(self.path, json.dumps(watermarks, indent=2, sort_keys=True))
+        logger.info(f"워터마크 갱신: {key} -> {value}")
+        return True
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.atomic_file import write_atomic
+
+
+class TestWriteAtomic:
+    """write_atomic 테스트"""
+
+    def test_write_text_and_bytes(self, tmp_path):
+        """문자열과 바이트를 기록하고 상위 디렉토리를 만드는지 테스트"""
+        path = tmp_path / "nested" / "state.json"
+
+        write_atomic(path, "한글")
+        assert path.read_text(encoding="utf-8") == "한글"
+
+        write_atomic(path, b"\x00\x01")
+        assert path.read_bytes() == b"\x00\x01"
+
+    def test_failed_replace_keeps_old_content(self, tmp_path):
+        """교체에 실패하면 이전 내용이 남고 임시 파일이 지워지는지 테스트"""
+        path = tmp_path / "state.json"
+        write_atomic(path, "old")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_atomic(path, "new")
+
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
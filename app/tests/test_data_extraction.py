@@ -0,0 +1,686 @@
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import math
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.services import data_extraction
+from src.services.data_extraction import (
+    PageShard,
+    collect_all_issues,
+    collect_all_issues_async,
+    collect_shard,
+    collect_sharded,
+    replay_cached_pages,
+)
+from src.utils.page_cache import PageCache
+from src.utils.page_manifest import PageManifest
+from src.utils.watermark import WatermarkStore
+
+ISSUES_PER_PAGE = 3
+
+
+class _IssuesHandler(BaseHTTPRequestHandler):
+    """page 파라미터마다 고정된 이슈를 돌려주는 SeeClickFix API 대역
+
+    pagination에는 ``server.total_pages``를 알려 주고, ``server.fail_pages``의
+    페이지는 항상, ``server.fail_once``의 페이지는 처음 한 번만 500으로 응답한다.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        page = int(parse_qs(urlparse(self.path).query)["page"][0])
+        self.server.pages.append(page)
+        if page in self.server.fail_pages or page in self.server.fail_once:
+            self.server.fail_once.discard(page)
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = f'"page-{page}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        issues = [
+            {"id": page * 100 + i, "lat": 35.0, "lng": -106.0, "created_at": ""}
+            for i in range(ISSUES_PER_PAGE)
+        ]
+        body = json.dumps(
+            {
+                "issues": issues,
+                "metadata": {"pagination": {"pages": self.server.total_pages}},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ChangesHandler(BaseHTTPRequestHandler):
+    """updated_at_after/sort/per_page를 지원하는 SeeClickFix API 대역
+
+    ``server.issues``는 id → updated_at 매핑이고, ``server.fail_pages``에 든
+    페이지와 ``server.fail_after``번째 이후의 요청은 500으로 응답한다.
+    ``server.after_response``를 정하면 응답을 보낸 뒤 한 번 호출한다 (수집 중에
+    이슈가 바뀌는 상황을 흉내 낸다).
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.server.queries.append(query)
+        page, per_page = int(query["page"]), int(query["per_page"])
+        failing = (
+            self.server.fail_after is not None
+            and len(self.server.queries) > self.server.fail_after
+        )
+        if page in self.server.fail_pages or failing:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        issues = sorted(self.server.issues.items(), key=lambda item: (item[1], item[0]))
+        if "updated_at_after" in query:
+            since = datetime.fromisoformat(query["updated_at_after"])
+            issues = [i for i in issues if datetime.fromisoformat(i[1]) > since]
+        selected = issues[(page - 1) * per_page : page * per_page]
+        body = json.dumps(
+            {
+                "issues": [
+                    {
+                        "id": issue_id,
+                        "created_at": "2020-01-01T00:00:00-07:00",
+                        "updated_at": updated_at,
+                    }
+                    for issue_id, updated_at in selected
+                ],
+                "metadata": {
+                    "pagination": {"pages": math.ceil(len(issues) / per_page)}
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        hook, self.server.after_response = self.server.after_response, None
+        if hook is not None:
+            hook()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def changes_server(tmp_path):
+    """증분 수집용 로컬 API 서버 (이슈 25개, 페이지당 10개)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChangesHandler)
+    server.issues = {
+        issue_id: f"2024-01-01T00:{issue_id:02d}:00-07:00" for issue_id in range(25)
+    }
+    server.fail_pages = set()
+    server.fail_after = None
+    server.after_response = None
+    server.queries = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/issues"
+    with patch.object(data_extraction, "BASE_URL", url), patch.object(
+        data_extraction, "DATA_DIR", tmp_path
+    ), patch.object(data_extraction, "PER_PAGE", 10), patch.object(
+        data_extraction, "REQUEST_RATE", 0
+    ):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api_server(tmp_path):
+    """로컬 API 서버를 띄우고 BASE_URL/DATA_DIR을 바꿔치기한다."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _IssuesHandler)
+    server.total_pages = 50
+    server.not_modified = 0
+    server.pages = []
+    server.fail_pages = set()
+    server.fail_once = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/issues"
+    # 로컬 서버에는 초당 요청 제한을 두지 않는다
+    with patch.object(data_extraction, "BASE_URL", url), patch.object(
+        data_extraction, "DATA_DIR", tmp_path
+    ), patch.object(data_extraction, "REQUEST_RATE", 0):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def repository():
+    """저장 요청 수만큼 성공했다고 응답하는 모의 저장소"""
+    repo = MagicMock()
+    repo.index = "scf"
+    repo.check_connection.return_value = True
+    repo.setup_index_mapping.return_value = True
+    repo.bulk_save_issues.side_effect = lambda issues: len(issues)
+    repo.async_bulk_save_issues = AsyncMock(
+        side_effect=lambda client, issues: len(issues)
+    )
+    es_client = MagicMock()
+    es_client.indices.refresh = AsyncMock()
+    es_client.close = AsyncMock()
+    repo.connector.create_async_client.return_value = es_client
+    return repo
+
+
+class TestCollectAllIssues:
+    """스레드/asyncio 수집 경로 테스트"""
+
+    def test_threaded_and_async_counts_match(self, api_server, repository, tmp_path):
+        """asyncio 경로가 스레드 경로와 같은 페이지/이슈 수를 처리하는지 테스트"""
+        threaded = collect_all_issues(repository)
+        async_count = asyncio.run(collect_all_issues_async(repository, concurrency=8))
+
+        assert threaded == async_count == 50 * ISSUES_PER_PAGE
+        assert repository.async_bulk_save_issues.await_count == 50
+        assert len(list(tmp_path.glob("seeclickfix_page_*.json"))) == 50
+
+        es_client = repository.connector.create_async_client.return_value
+        es_client.indices.refresh.assert_awaited_once_with(index="scf")
+        es_client.close.assert_awaited_once()
+
+    def test_follows_pagination(self, api_server, repository):
+        """pagination의 페이지 수만큼 받고 max_pages로만 제한되는지 테스트"""
+        api_server.total_pages = 60
+
+        assert collect_all_issues(repository) == 60 * ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == list(range(1, 61))
+
+        api_server.pages.clear()
+        limited = asyncio.run(collect_all_issues_async(repository, max_pages=10))
+
+        assert limited == 10 * ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == list(range(1, 11))
+
+    def test_raw_body_saved_unmodified(self, api_server, repository, tmp_path):
+        """응답 본문을 다시 직렬화하지 않고 받은 바이트 그대로 저장하는지 테스트"""
+        collect_all_issues(repository)
+
+        body = (tmp_path / "seeclickfix_page_1.json").read_bytes()
+        manifest = PageManifest(tmp_path / "manifest.jsonl")
+        manifest.start(
+            {"place_url": "bernalillo-county", "per_page": 100, "status": "Archived"},
+            resume=True,
+        )
+        assert hashlib.sha256(body).hexdigest() == manifest.get(1)["checksum"]
+        assert json.loads(body)["issues"][0]["id"] == 100
+
+    def test_second_run_uses_conditional_get(self, api_server, repository):
+        """두 번째 실행은 304 응답과 캐시된 본문으로 같은 결과를 내는지 테스트"""
+        first = collect_all_issues(repository)
+        second = collect_all_issues(repository)
+
+        assert first == second == 50 * ISSUES_PER_PAGE
+        assert api_server.not_modified == 50
+
+    def test_replay_cached_pages(self, api_server, repository):
+        """API 호출 없이 캐시된 페이지로 다시 색인하는지 테스트"""
+        collect_all_issues(repository)
+        repository.bulk_save_issues.reset_mock()
+        api_server.shutdown()
+
+        replayed = replay_cached_pages(repository, recreate_index=True, batch_size=40)
+
+        assert replayed == 50 * ISSUES_PER_PAGE
+        repository.delete_index.assert_called_once()
+        saved_ids = [
+            int(issue["id"])
+            for call in repository.bulk_save_issues.call_args_list
+            for issue in call.args[0]
+        ]
+        assert sorted(saved_ids) == sorted(
+            page * 100 + i for page in range(1, 51) for i in range(ISSUES_PER_PAGE)
+        )
+
+    def test_default_rate_limiter(self, repository, tmp_path):
+        """기본 RateLimiter가 초당 요청 수를 제한하고 동시 요청 수 상한에 여유를 두는지 테스트"""
+        original = data_extraction.collect_all_issues
+        with patch.object(data_extraction, "DATA_DIR", tmp_path), patch.object(
+            data_extraction, "collect_all_issues", return_value=0
+        ) as inner:
+            original(repository, max_workers=3)
+
+        client = inner.call_args.args[1]
+        limiter = client.rate_limiter
+        assert limiter.rate == data_extraction.REQUEST_RATE
+        assert limiter.concurrency == 3
+        assert limiter.max_concurrency == 3 * data_extraction.CONCURRENCY_HEADROOM
+        assert client.max_connections == limiter.max_concurrency
+
+    def test_async_stops_without_connection(self, api_server, repository):
+        """Elasticsearch 연결에 실패하면 수집하지 않는지 테스트"""
+        repository.check_connection.return_value = False
+
+        assert asyncio.run(collect_all_issues_async(repository)) == 0
+        repository.connector.create_async_client.assert_not_called()
+
+    def test_async_retries_and_resumes(self, api_server, repository, tmp_path):
+        """asyncio 경로도 매니페스트로 실패한 페이지를 재시도하고 이어받는지 테스트"""
+        api_server.fail_once = {7}
+
+        assert asyncio.run(collect_all_issues_async(repository)) == 50 * ISSUES_PER_PAGE
+
+        api_server.fail_pages = {5, 6}
+        first = asyncio.run(collect_all_issues_async(repository, retry_passes=0))
+        assert first == 48 * ISSUES_PER_PAGE
+
+        # 스레드 경로가 asyncio 경로의 매니페스트를 이어받는다
+        api_server.fail_pages = set()
+        api_server.pages.clear()
+        assert collect_all_issues(repository, resume=True) == 2 * ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == [1, 5, 6]
+
+    def test_async_shard(self, api_server, repository, tmp_path):
+        """asyncio 경로도 샤드 범위만 수집하고, 실패가 남으면 예외를 발생시키는지 테스트"""
+        saved = asyncio.run(collect_all_issues_async(repository, shard=(1, 4)))
+
+        assert saved == 13 * ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == [1] + list(range(14, 27))
+        assert (tmp_path / "manifest-14-26.jsonl").exists()
+
+        api_server.fail_pages = {30}
+        with pytest.raises(RuntimeError):
+            asyncio.run(
+                collect_all_issues_async(
+                    repository, pages=PageShard(27, 39), retry_passes=0
+                )
+            )
+
+    def test_async_blocking_calls_off_event_loop(self, api_server, repository):
+        """asyncio 경로가 동기 Elasticsearch 호출을 이벤트 루프 밖에서 하는지 테스트"""
+        loop_thread = threading.get_ident()
+        threads = []
+        repository.check_connection.side_effect = lambda: not threads.append(
+            threading.get_ident()
+        )
+        repository.count_issues.side_effect = lambda: threads.append(
+            threading.get_ident()
+        )
+
+        asyncio.run(collect_all_issues_async(repository, max_pages=2))
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+
+class TestIncrementalCollection:
+    """워터마크 기반 증분 수집 테스트"""
+
+    def saved_ids(self, repository):
+        return sorted(
+            int(issue["id"])
+            for call in repository.bulk_save_issues.call_args_list
+            for issue in call.args[0]
+        )
+
+    def test_only_changed_issues_after_watermark(self, changes_server, repository):
+        """워터마크 이후 바뀐 이슈만 받고 워터마크를 올리는지 테스트"""
+        store = WatermarkStore(data_extraction.DATA_DIR / "watermarks.json")
+
+        first = collect_all_issues(repository, incremental=True)
+
+        assert first == 25
+        assert store.get("bernalillo-county", "Archived") == "2024-01-01T00:24:00-07:00"
+        assert changes_server.queries[0]["sort"] == "updated_at"
+        assert changes_server.queries[0]["sort_direction"] == "ASC"
+        assert "updated_at_after" not in changes_server.queries[0]
+
+        repository.bulk_save_issues.reset_mock()
+        changes_server.queries.clear()
+        changes_server.issues[3] = "2024-02-01T00:00:00-07:00"
+        changes_server.issues[30] = "2024-02-01T00:01:00-07:00"
+
+        second = collect_all_issues(repository, incremental=True)
+
+        assert second == 2
+        assert self.saved_ids(repository) == [3, 30]
+        assert (
+            changes_server.queries[0]["updated_at_after"] == "2024-01-01T00:24:00-07:00"
+        )
+        assert store.get("bernalillo-county", "Archived") == "2024-02-01T00:01:00-07:00"
+
+    def test_nothing_changed(self, changes_server, repository):
+        """바뀐 이슈가 없으면 첫 페이지만 요청하고 워터마크를 유지하는지 테스트"""
+        collect_all_issues(repository, incremental=True)
+        changes_server.queries.clear()
+
+        assert collect_all_issues(repository, incremental=True) == 0
+        assert len(changes_server.queries) == 1
+
+    def test_superseded_incremental_pages_compacted(self, changes_server, repository):
+        """이슈가 모두 더 새로운 응답에 있는 증분 응답은 캐시에서 지우는지 테스트"""
+        cache = PageCache(data_extraction.DATA_DIR / data_extraction.CACHE_DIRNAME)
+        collect_all_issues(repository, incremental=True)
+        assert len(cache) == 3
+
+        # 첫 실행의 첫 페이지(이슈 0~9)가 모두 바뀐다
+        for issue_id in range(10):
+            changes_server.issues[issue_id] = f"2024-02-01T00:{issue_id:02d}:00-07:00"
+        collect_all_issues(repository, incremental=True)
+        # 바뀐 것이 없는 실행의 빈 응답도 남기지 않는다
+        collect_all_issues(repository, incremental=True)
+
+        pages = list(cache.iter_pages())
+        assert len(pages) == 3
+        replayed = [
+            sorted(issue["id"] for issue in page.json()["issues"]) for page in pages
+        ]
+        # 키셋 커서를 KEYSET_OVERLAP만큼 앞당기므로 첫 실행의 나머지 두 페이지는
+        # 앞 페이지의 마지막 이슈부터 시작하고, 그 뒤에 최신 응답이 온다
+        assert replayed == [list(range(9, 19)), list(range(18, 25)), list(range(10))]
+
+    def test_failed_page_keeps_watermark(self, changes_server, repository):
+        """페이지 수집에 실패하면 워터마크를 올리지 않는지 테스트"""
+        store = WatermarkStore(data_extraction.DATA_DIR / "watermarks.json")
+        changes_server.fail_after = 1
+
+        assert collect_all_issues(repository, incremental=True, retry_passes=1) == 10
+        assert store.get("bernalillo-county", "Archived") is None
+        # 두 번째 페이지를 한 번 재시도하고 멈춘다
+        assert len(changes_server.queries) == 3
+
+        changes_server.fail_after = None
+        assert collect_all_issues(repository, incremental=True) == 25
+        assert store.get("bernalillo-county", "Archived") == "2024-01-01T00:24:00-07:00"
+
+    def test_issue_updated_mid_crawl_not_missed(self, changes_server, repository):
+        """수집 중에 바뀌어 결과의 끝으로 옮겨 간 이슈 때문에 다른 이슈를 놓치지 않는지 테스트"""
+        store = WatermarkStore(data_extraction.DATA_DIR / "watermarks.json")
+
+        def move_issue():
+            # 첫 페이지를 받은 직후 이슈 2가 바뀐다. 페이지 번호로 받았다면 뒤의
+            # 이슈가 한 칸씩 당겨져 이슈 10이 두 번째 페이지에서 빠진다
+            changes_server.issues[2] = "2024-02-01T00:00:00-07:00"
+
+        changes_server.after_response = move_issue
+
+        collect_all_issues(repository, incremental=True)
+
+        assert sorted(set(self.saved_ids(repository))) == list(range(25))
+        assert self.saved_ids(repository).count(2) == 2
+        assert store.get("bernalillo-county", "Archived") == "2024-02-01T00:00:00-07:00"
+        for query in changes_server.queries[1:]:
+            assert query["page"] == "1"
+            assert "updated_at_after" in query
+
+
+class TestPageManifest:
+    """페이지 매니페스트 기반 재시도/이어받기 테스트"""
+
+    def manifest(self):
+        """마지막 실행의 매니페스트를 읽는다."""
+        manifest = PageManifest(data_extraction.DATA_DIR / "manifest.jsonl")
+        params = {
+            "place_url": data_extraction.PLACE_URL,
+            "per_page": data_extraction.PER_PAGE,
+            "status": data_extraction.STATUS,
+        }
+        manifest.start(params, resume=True)
+        return manifest
+
+    def test_failed_page_retried_in_later_pass(self, api_server, repository):
+        """첫 패스에서 실패한 페이지를 다음 패스에서 다시 받는지 테스트"""
+        api_server.fail_once = {7}
+
+        assert collect_all_issues(repository) == 50 * ISSUES_PER_PAGE
+
+        manifest = self.manifest()
+        assert manifest.summary() == {"done": 50, "failed": 0, "items": 150}
+        assert manifest.get(7)["attempts"] == 2
+        assert manifest.get(8)["attempts"] == 1
+        assert len(manifest.get(8)["checksum"]) == 64
+
+    def test_resume_skips_completed_pages(self, api_server, repository):
+        """이어받기 실행이 완료된 페이지를 건너뛰고 실패한 페이지만 받는지 테스트"""
+        api_server.fail_pages = {5, 6}
+
+        first = collect_all_issues(repository, retry_passes=1)
+
+        assert first == 48 * ISSUES_PER_PAGE
+        assert self.manifest().pages("failed") == [5, 6]
+        assert api_server.pages.count(5) == 2
+
+        api_server.fail_pages = set()
+        api_server.pages.clear()
+        resumed = collect_all_issues(repository, resume=True)
+
+        assert resumed == 2 * ISSUES_PER_PAGE
+        # 첫 페이지는 총 페이지 수를 확인하려고 다시 요청한다
+        assert sorted(api_server.pages) == [1, 5, 6]
+        assert self.manifest().summary() == {"done": 50, "failed": 0, "items": 150}
+
+    def test_incremental_run_keeps_full_crawl_resume(self, api_server, repository):
+        """중단된 전체 수집 뒤에 증분 수집을 해도 전체 수집을 이어받는지 테스트"""
+        api_server.fail_pages = {5, 6}
+        collect_all_issues(repository, retry_passes=0)
+        api_server.fail_pages = set()
+
+        collect_all_issues(repository, incremental=True)
+        assert (data_extraction.DATA_DIR / "manifest-incremental.jsonl").exists()
+
+        api_server.pages.clear()
+        resumed = collect_all_issues(repository, resume=True)
+
+        assert resumed == 2 * ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == [1, 5, 6]
+        assert self.manifest().summary() == {"done": 50, "failed": 0, "items": 150}
+
+    def test_without_resume_starts_over(self, api_server, repository):
+        """resume 없이 실행하면 모든 페이지를 다시 받는지 테스트"""
+        collect_all_issues(repository)
+        api_server.pages.clear()
+
+        assert collect_all_issues(repository) == 50 * ISSUES_PER_PAGE
+        assert len(api_server.pages) == 50
+
+
+class TestIndexingStage:
+    """fetch/색인 단계 분리 테스트"""
+
+    def test_bulk_batches_span_pages(self, api_server, repository):
+        """여러 페이지의 이슈를 bulk_size 단위로 모아 저장하는지 테스트"""
+        saved = collect_all_issues(repository, bulk_size=40)
+
+        sizes = [
+            len(call.args[0]) for call in repository.bulk_save_issues.call_args_list
+        ]
+        assert saved == sum(sizes) == 50 * ISSUES_PER_PAGE
+        assert len(sizes) == 4
+        assert all(size >= 40 for size in sizes[:-1])
+
+    def test_failed_bulk_retries_its_pages(self, api_server, repository):
+        """bulk 요청이 실패하면 담긴 페이지를 다시 받아 저장하는지 테스트"""
+        results = iter([0])
+        repository.bulk_save_issues.side_effect = lambda issues: next(
+            results, len(issues)
+        )
+
+        assert collect_all_issues(repository, bulk_size=30) == 50 * ISSUES_PER_PAGE
+        # 실패한 bulk 요청에 담긴 10개 페이지만 다시 요청한다
+        assert len(api_server.pages) == 50 + 10
+
+    def test_backpressure(self, api_server, repository):
+        """색인이 멈추면 큐가 차서 fetch 작업자도 멈추는지 테스트"""
+        release = threading.Event()
+
+        def slow_save(issues):
+            release.wait()
+            return len(issues)
+
+        repository.bulk_save_issues.side_effect = slow_save
+        worker = threading.Thread(
+            target=collect_all_issues,
+            args=(repository,),
+            kwargs={
+                "max_workers": 2,
+                "max_concurrency": 2,
+                "bulk_size": 1,
+                "queue_size": 2,
+            },
+        )
+        worker.start()
+        try:
+            time.sleep(0.5)
+            # 첫 페이지 + 저장 중인 페이지 1 + 큐 2 + 작업자마다 넣으려고 기다리는 페이지
+            assert len(api_server.pages) <= 1 + 1 + 2 + 2
+        finally:
+            release.set()
+            worker.join()
+        assert len(api_server.pages) == 50
+
+
+class TestShardedCrawl:
+    """페이지 범위 샤드 수집 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def archive(self, api_server):
+        """전체 아카이브를 80페이지로 알린다."""
+        api_server.total_pages = 80
+
+    def test_split(self):
+        """전체 페이지를 빈틈없이 거의 같은 크기로 나누는지 테스트"""
+        shards = PageShard.split(80, 3)
+
+        assert shards == [PageShard(1, 27), PageShard(28, 54), PageShard(55, 80)]
+        assert PageShard.split(2, 5) == [PageShard(1, 1), PageShard(2, 2)]
+        with pytest.raises(ValueError):
+            PageShard(5, 4)
+
+    def test_single_shard(self, api_server, repository, tmp_path):
+        """shard=(번호, 수)로 전체 페이지 중 해당 범위만 수집하는지 테스트"""
+        saved = collect_all_issues(repository, shard=(1, 4))
+
+        assert saved == 20 * ISSUES_PER_PAGE
+        # 첫 페이지는 전체 페이지 수를 확인하려고 요청한다
+        assert sorted(api_server.pages) == [1] + list(range(21, 41))
+        assert sorted(
+            int(path.stem.rsplit("_", 1)[1])
+            for path in tmp_path.glob("seeclickfix_page_*.json")
+        ) == list(range(21, 41))
+        assert (tmp_path / "manifest-21-40.jsonl").exists()
+
+    def test_collect_sharded_merges_counts(self, api_server, repository):
+        """샤드별 결과를 합쳐 전체 아카이브를 한 번씩 수집하는지 테스트"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            saved = collect_sharded(4, repository=repository, executor=executor)
+
+        assert saved == 80 * ISSUES_PER_PAGE
+        saved_ids = [
+            int(issue["id"])
+            for call in repository.bulk_save_issues.call_args_list
+            for issue in call.args[0]
+        ]
+        assert sorted(saved_ids) == sorted(
+            page * 100 + i for page in range(1, 81) for i in range(ISSUES_PER_PAGE)
+        )
+
+    def test_failed_shard_raises(self, api_server, repository):
+        """재시도 뒤에도 실패한 페이지가 남으면 샤드가 예외를 발생시키는지 테스트"""
+        api_server.fail_pages = {25}
+
+        with pytest.raises(RuntimeError):
+            collect_all_issues(repository, shard=(1, 4), retry_passes=1)
+
+        api_server.fail_pages = set()
+        api_server.pages.clear()
+        saved = collect_all_issues(repository, shard=(1, 4), resume=True)
+
+        assert saved == ISSUES_PER_PAGE
+        assert sorted(api_server.pages) == [1, 25]
+
+    def test_collect_sharded_raises_on_failed_shard(self, api_server, repository):
+        """인덱스를 먼저 한 번 만들고, 실패한 샤드가 있으면 끝난 뒤 예외를 발생시키는지 테스트"""
+        api_server.fail_pages = {75}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        submit = executor.submit
+        executor.submit = MagicMock(
+            side_effect=lambda *args, **kwargs: (
+                repository.setup_index_mapping.assert_called(),
+                submit(*args, **kwargs),
+            )[1]
+        )
+
+        with executor, pytest.raises(RuntimeError, match="61-80"):
+            collect_sharded(4, repository=repository, executor=executor)
+
+        assert 75 not in {
+            int(issue["id"]) // 100
+            for call in repository.bulk_save_issues.call_args_list
+            for issue in call.args[0]
+        }
+
+    def test_shard_task_resumes_only_within_run(self, api_server, repository, tmp_path):
+        """샤드 태스크가 같은 실행의 재시도에서만 이어받고, 다음 실행은 다시 수집하는지 테스트"""
+        shard = PageShard(21, 40)
+        api_server.fail_pages = {25}
+
+        with pytest.raises(RuntimeError):
+            collect_shard(
+                shard, "manual__2025-03-01T00:00:00+00:00", 1, repository=repository
+            )
+        assert list(tmp_path.glob("manifest-21-40-*.jsonl"))
+
+        api_server.fail_pages = set()
+        api_server.pages.clear()
+        retried = collect_shard(
+            shard, "manual__2025-03-01T00:00:00+00:00", 2, repository=repository
+        )
+
+        assert retried == ISSUES_PER_PAGE
+        # pages를 주면 범위의 첫 페이지로 전체 페이지 수를 확인한다
+        assert sorted(api_server.pages) == [21, 25]
+        assert not list(tmp_path.glob("manifest-21-40-*.jsonl"))
+
+        # 같은 샤드를 연달아 실행하면 두 번 모두 전체 범위를 수집한다
+        for run_id in ["scheduled__2025-03-02", "scheduled__2025-03-02"]:
+            api_server.pages.clear()
+            assert collect_shard(shard, run_id, repository=repository) == (
+                20 * ISSUES_PER_PAGE
+            )
+            assert sorted(api_server.pages) == list(range(21, 41))
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"pages": PageShard(1, 10), "shard": (0, 2)},
+            {"shard": (0, 2), "incremental": True},
+            {"shard": (2, 2)},
+        ],
+    )
+    def test_invalid_options(self, options):
+        """샤드 인자가 잘못되면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            collect_all_issues(MagicMock(), client=MagicMock(), **options)
@@ -1,11 +1,14 @@
 import pytest
 import csv
 import os
+from dataclasses import replace
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from src.services.data_generation import DatasetConfig, DataGenerator
+from src.models.dataset_schema import ColumnSpec
+from src.services.data_generation import DatasetConfig, DataGenerator, read_checkpoint
+from src.utils.dataset_io import read_dataset
 
 
 class TestDatasetConfig:
@@ -203,6 +206,296 @@ class TestDataGenerator:
         assert len(paths) == len(small_config.output_dirs)
         assert count == small_config.record_count
 
+    def test_generate_batch(self):
+        """배치 단위 레코드가 헤더 순서와 값 범위를 지키는지 테스트."""
+        generator = DataGenerator(DatasetConfig(seed=7, vocabulary_size=50))
+        batch = generator._generate_batch(1_000)
+
+        assert list(batch.columns) == generator.config.header
+        assert len(batch) == 1_000
+        assert batch["age"].between(18, 80).all()
+        assert batch["lng"].between(-180, 180).all()
+        assert batch["lat"].between(-90, 90).all()
+        assert batch["zip"].str.len().eq(5).all()
+
+    def test_generate_batch_is_reproducible_with_seed(self):
+        """같은 seed로 생성한 배치가 동일한지 테스트."""
+        first = DataGenerator(DatasetConfig(seed=42))._generate_batch(100)
+        second = DataGenerator(DatasetConfig(seed=42))._generate_batch(100)
+
+        assert first.equals(second)
+
+    def test_generate_batch_unknown_column(self):
+        """지원하지 않는 컬럼이 헤더에 있으면 ValueError가 발생하는지 테스트."""
+        generator = DataGenerator(DatasetConfig(header=["id", "name"]))
+
+        with pytest.raises(ValueError):
+            generator._generate_batch(10)
+
+    def test_iter_batches_covers_record_count(self):
+        """iter_batches가 record_count만큼의 레코드를 batch_size 단위로 만드는지 테스트."""
+        config = DatasetConfig(record_count=25, batch_size=10, vocabulary_size=10)
+        sizes = [len(batch) for batch in DataGenerator(config).iter_batches()]
+
+        assert sizes == [10, 10, 5]
+
+    @patch("time.sleep")
+    def test_write_records_throttled(self, mock_sleep, temp_dir):
+        """throttle 설정 시 레코드마다 지연이 적용되는지 테스트."""
+        config = DatasetConfig(
+            filename="throttled.csv",
+            record_count=3,
+            output_dirs=[temp_dir],
+            throttle=0.1,
+        )
+        generator = DataGenerator(config)
+        output_path = Path(temp_dir) / config.filename
+
+        with patch("src.modules.progress_bar.print_progress_bar"):
+            generator._write_records(output_path)
+
+        assert mock_sleep.call_count == 3
+        mock_sleep.assert_called_with(0.1)
+
+    @patch("time.sleep")
+    def test_write_records_throttled_schema(self, mock_sleep, temp_dir):
+        """throttle 설정 시에도 schema의 컬럼으로 레코드를 쓰는지 테스트."""
+        config = DatasetConfig(
+            filename="throttled.csv",
+            record_count=3,
+            output_dirs=[temp_dir],
+            throttle=0.1,
+            schema=[
+                ColumnSpec("user_id", type="int", low=1, high=9),
+                ColumnSpec("plan", distribution="categorical", values=["a", "b"]),
+            ],
+        )
+        generator = DataGenerator(config)
+        output_path = Path(temp_dir) / config.filename
+
+        with patch("src.modules.progress_bar.print_progress_bar"):
+            generator._write_records(output_path)
+
+        df = read_dataset(output_path, dtypes=generator.dataset_dtypes())
+        assert list(df.columns) == ["user_id", "plan"]
+        assert len(df) == 3
+        assert set(df["plan"]) <= {"a", "b"}
+        assert mock_sleep.call_count == 3
+
+    def test_shard_sizes(self):
+        """record_count가 shard 수에 맞게 고르게 나뉘는지 테스트."""
+        config = DatasetConfig(record_count=10, shards=3)
+
+        assert DataGenerator(config).shard_sizes() == [4, 3, 3]
+
+    def test_sharded_dataset_is_deterministic(self, temp_dir):
+        """같은 seed와 shard 수면 worker 수와 무관하게 동일한 파일이 생성되는지 테스트."""
+        contents = []
+        for workers in (1, 2):
+            output_dir = os.path.join(temp_dir, f"workers-{workers}")
+            config = DatasetConfig(
+                record_count=50,
+                output_dirs=[output_dir],
+                seed=11,
+                shards=3,
+                workers=workers,
+                vocabulary_size=20,
+            )
+            paths, count = DataGenerator(config).create_sample_dataset()
+
+            assert count == 50
+            contents.append(paths[0].read_bytes())
+
+        assert contents[0] == contents[1]
+        rows = contents[0].decode().splitlines()
+        assert rows[0] == ",".join(DatasetConfig().header)
+        assert len(rows) == 51
+        assert not any(name.endswith(".parts") for name in os.listdir(output_dir))
+
+    def test_sharded_throttled_shards_differ(self, temp_dir):
+        """throttle 설정 시에도 shard마다 다른 레코드를 쓰는지 테스트."""
+        config = DatasetConfig(
+            record_count=6,
+            output_dirs=[temp_dir],
+            seed=3,
+            shards=2,
+            workers=1,
+            merge_shards=False,
+            throttle=0.0001,
+        )
+        paths, count = DataGenerator(config).create_sample_dataset()
+
+        parts = [read_dataset(part) for part in sorted(paths[0].iterdir())]
+        assert count == 6
+        assert parts[0]["name"].tolist() != parts[1]["name"].tolist()
+
+    def test_sharded_dataset_partitioned_directory(self, temp_dir):
+        """merge_shards=False면 filename 디렉토리에 part 파일이 남는지 테스트."""
+        config = DatasetConfig(
+            record_count=20,
+            output_dirs=[temp_dir],
+            seed=5,
+            shards=2,
+            workers=1,
+            merge_shards=False,
+            vocabulary_size=20,
+        )
+        paths, count = DataGenerator(config).create_sample_dataset()
+
+        assert paths[0].is_dir()
+        parts = sorted(paths[0].iterdir())
+        assert [part.name for part in parts] == ["part-00000.csv", "part-00001.csv"]
+        for part in parts:
+            with open(part, newline="") as part_file:
+                assert next(csv.reader(part_file)) == config.header
+
+    def test_parquet_output(self, temp_dir):
+        """Parquet 포맷을 지정하면 파일명이 유도되고 타입이 유지되는지 테스트."""
+        config = DatasetConfig(
+            record_count=30,
+            output_dirs=[temp_dir],
+            output_format="parquet",
+            compression="snappy",
+            batch_size=8,
+            row_group_size=10,
+            vocabulary_size=20,
+        )
+        paths, count = DataGenerator(config).create_sample_dataset()
+
+        assert config.filename == "test_data.parquet"
+        df = read_dataset(paths[0])
+        assert len(df) == count == 30
+        assert list(df.columns) == config.header
+        assert str(df["age"].dtype) == "int16"
+
+
+class TestResumableGeneration:
+    """체크포인트 기반 이어쓰기/확장 테스트."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """테스트에 사용할 임시 디렉토리 생성."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            yield tmpdirname
+
+    def make_config(self, temp_dir, **kwargs) -> DatasetConfig:
+        options = dict(
+            record_count=50,
+            output_dirs=[temp_dir],
+            batch_size=10,
+            vocabulary_size=20,
+            seed=3,
+        )
+        options.update(kwargs)
+        return DatasetConfig(**options)
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_resume_after_crash(self, temp_dir, compression):
+        """중단된 생성을 이어서 완료하면 한 번에 생성한 파일과 같은지 테스트."""
+        expected_config = self.make_config(
+            os.path.join(temp_dir, "expected"), compression=compression
+        )
+        expected_paths, _ = DataGenerator(expected_config).create_sample_dataset()
+
+        config = self.make_config(temp_dir, compression=compression)
+        output_path = Path(temp_dir) / config.filename
+        generator = DataGenerator(config)
+        batches = generator.iter_batches
+
+        def crash_after_three_batches(record_count=None):
+            for index, batch in enumerate(batches(record_count)):
+                if index == 3:
+                    # 기록 도중 중단된 것처럼 불완전한 바이트를 남긴다
+                    with open(output_path, "ab") as output_file:
+                        output_file.write(b"partial")
+                    raise RuntimeError("crash")
+                yield batch
+
+        with patch.object(generator, "iter_batches", crash_after_three_batches):
+            with pytest.raises(RuntimeError):
+                generator.create_sample_dataset()
+
+        checkpoint = read_checkpoint(output_path)
+        assert checkpoint["rows_written"] == 30
+        assert not checkpoint["complete"]
+
+        resumed = replace(config, seed=None, resume=True)
+        paths, count = DataGenerator(resumed).create_sample_dataset()
+
+        assert count == 50
+        assert paths[0].read_bytes() == expected_paths[0].read_bytes()
+        assert read_checkpoint(output_path)["complete"]
+
+    def test_extend_dataset(self, temp_dir):
+        """완료된 데이터셋을 늘리면 기존 행은 그대로 두고 뒤에 추가되는지 테스트."""
+        config = self.make_config(temp_dir)
+        paths, _ = DataGenerator(config).create_sample_dataset()
+        original = paths[0].read_bytes()
+
+        extended = replace(config, record_count=75, resume=True)
+        paths, count = DataGenerator(extended).create_sample_dataset()
+
+        assert count == 75
+        assert paths[0].read_bytes().startswith(original)
+        df = read_dataset(paths[0])
+        assert len(df) == 75
+        assert read_checkpoint(paths[0])["rows_written"] == 75
+
+    def test_resume_rejects_mismatched_config(self, temp_dir):
+        """체크포인트와 다른 설정으로 이어쓰면 ValueError가 발생하는지 테스트."""
+        config = self.make_config(temp_dir)
+        DataGenerator(config).create_sample_dataset()
+
+        with pytest.raises(ValueError):
+            DataGenerator(replace(config, seed=4, resume=True)).create_sample_dataset()
+        with pytest.raises(ValueError):
+            DataGenerator(
+                replace(config, record_count=10, resume=True)
+            ).create_sample_dataset()
+
+    def test_resume_rejects_changed_schema_or_batch_size(self, temp_dir):
+        """schema나 batch_size가 바뀌면 이어쓰지 않는지 테스트."""
+        schema = [ColumnSpec("plan", distribution="categorical", values=["a", "b"])]
+        config = self.make_config(temp_dir, schema=schema)
+        DataGenerator(config).create_sample_dataset()
+
+        changed = [ColumnSpec("plan", distribution="categorical", values=["x", "y"])]
+        with pytest.raises(ValueError, match="schema"):
+            DataGenerator(
+                replace(config, schema=changed, record_count=60, resume=True)
+            ).create_sample_dataset()
+        with pytest.raises(ValueError, match="batch_size"):
+            DataGenerator(
+                replace(config, batch_size=20, record_count=60, resume=True)
+            ).create_sample_dataset()
+
+        paths, count = DataGenerator(
+            replace(config, record_count=60, resume=True)
+        ).create_sample_dataset()
+        assert count == 60
+
+    def test_resume_requires_csv(self):
+        """Parquet 출력에 resume을 지정하면 ValueError가 발생하는지 테스트."""
+        with pytest.raises(ValueError):
+            DatasetConfig(output_format="parquet", resume=True)
+
+    def test_resume_sharded(self, temp_dir):
+        """seed 없이 중단된 sharded 생성을 이어도 체크포인트의 seed로 같은 결과가 나오는지 테스트."""
+        config = self.make_config(temp_dir, shards=2, workers=1, seed=None)
+        paths, _ = DataGenerator(config).create_sample_dataset()
+        expected = paths[0].read_bytes()
+
+        # 생성 도중 중단된 상태를 만든다: 출력 파일을 지우고 완료 표시를 되돌린다
+        generator = DataGenerator(replace(config, resume=True))
+        generator._use_seed(read_checkpoint(paths[0])["seed"])
+        generator._save_checkpoint(paths[0], rows_written=0, complete=False)
+        paths[0].unlink()
+
+        paths, count = generator.create_sample_dataset()
+
+        assert count == 50
+        assert paths[0].read_bytes() == expected
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,102 @@
+import pytest
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from src.services.data_generation import DatasetConfig, DataGenerator
+from src.services.data_sinks import FileSink, KafkaSink, RepositorySink
+from src.services.data_streaming import KafkaProducer
+from src.utils.dataset_io import read_dataset
+
+
+@pytest.fixture
+def small_generator():
+    """작은 배치로 레코드를 만드는 DataGenerator."""
+    config = DatasetConfig(record_count=25, batch_size=10, vocabulary_size=20, seed=1)
+    return DataGenerator(config)
+
+
+class TestDataSinks:
+    """Sink 구현체에 대한 테스트"""
+
+    def test_repository_sink(self):
+        """RepositorySink가 배치를 딕셔너리 목록으로 bulk_save에 넘기는지 테스트"""
+        repository = MagicMock()
+        repository.bulk_save.side_effect = lambda records: len(records)
+        batch = pd.DataFrame({"name": ["Kim", "Lee"], "age": [20, 30]})
+
+        saved = RepositorySink(repository).write_batch(batch)
+
+        assert saved == 2
+        repository.bulk_save.assert_called_once_with(
+            [{"name": "Kim", "age": 20}, {"name": "Lee", "age": 30}]
+        )
+
+    def test_kafka_sink(self):
+        """KafkaSink가 레코드마다 메시지를 만들고 종료 시 flush하는지 테스트"""
+        with patch("src.services.data_streaming.Producer") as mock_producer_cls:
+            mock_producer = mock_producer_cls.return_value
+            mock_producer.flush.return_value = 0
+            producer = KafkaProducer()
+            batch = pd.DataFrame({"id": [1, 2], "name": ["Kim", "Lee"]})
+
+            with KafkaSink(producer, "users", key_field="id") as sink:
+                sent = sink.write_batch(batch)
+
+        assert sent == 2
+        assert mock_producer.produce.call_count == 2
+        assert mock_producer.produce.call_args.kwargs["key"] == b"2"
+        mock_producer.flush.assert_called_once()
+
+    def test_kafka_sink_retries_when_queue_full(self):
+        """Producer 큐가 가득 차면 poll 후 다시 전송하는지 테스트"""
+        with patch("src.services.data_streaming.Producer") as mock_producer_cls:
+            mock_producer = mock_producer_cls.return_value
+            mock_producer.produce.side_effect = [BufferError(), None]
+            producer = KafkaProducer()
+
+            sent = producer.produce_records([{"id": 1}], "users")
+
+        assert sent == 1
+        assert mock_producer.produce.call_count == 2
+        mock_producer.poll.assert_any_call(0.5)
+
+
+class TestStreamToSinks:
+    """DataGenerator.stream_to_sinks에 대한 테스트"""
+
+    def test_stream_to_sinks(self, small_generator):
+        """모든 Sink가 모든 배치를 받고 마지막에 닫히는지 테스트"""
+        first, second = MagicMock(), MagicMock()
+
+        generated = small_generator.stream_to_sinks([first, second])
+
+        assert generated == 25
+        for sink in (first, second):
+            sizes = [len(call.args[0]) for call in sink.write_batch.call_args_list]
+            assert sizes == [10, 10, 5]
+            sink.close.assert_called_once()
+
+    def test_stream_to_file_sink(self, small_generator):
+        """FileSink로 스트리밍한 결과를 다시 읽을 수 있는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = Path(tmpdirname) / "stream.parquet"
+            sink = FileSink(path, small_generator.config.header)
+
+            small_generator.stream_to_sinks([sink])
+
+            df = read_dataset(path)
+            assert len(df) == 25
+            assert list(df.columns) == small_generator.config.header
+
+    def test_stream_closes_sinks_on_error(self, small_generator):
+        """Sink 기록 중 오류가 나도 Sink가 닫히는지 테스트"""
+        sink = MagicMock()
+        sink.write_batch.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            small_generator.stream_to_sinks([sink])
+
+        sink.close.assert_called_once()
@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.models.issue_schema import ISSUE_FIELDS
+from src.utils import data_transform
+from src.utils.data_transform import transform_issue, transform_issues
+
+
+@pytest.fixture
+def issues():
+    """API 응답 형식의 이슈 목록"""
+    return [
+        {
+            "id": 1,
+            "summary": "Pothole",
+            "description": "Large pothole",
+            "status": "Open",
+            "lat": 35.084,
+            "lng": -106.651,
+            "address": "Central Ave",
+            "rating": 3,
+            "comment_count": 2,
+            "view_count": 40,
+            "created_at": "2024-05-01T10:00:00-06:00",
+            "reporter": {"name": "ignored"},
+        },
+        {
+            "id": 2,
+            "summary": "Graffiti",
+            "description": None,
+            "status": "Closed",
+            "lat": None,
+            "lng": None,
+            "address": None,
+            "rating": None,
+            "comment_count": None,
+            "view_count": None,
+            "created_at": "",
+        },
+    ]
+
+
+class TestTransformIssues:
+    """열 단위 일괄 변환 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def columnar(self):
+        """이슈가 적어도 열 단위로 변환한다."""
+        with patch.object(data_transform, "COLUMNAR_MIN_ISSUES", 0):
+            yield
+
+    def test_records_match_transform_issue(self, issues):
+        """transform_issue와 같은 결과인지 테스트"""
+        records = transform_issues(issues)
+
+        assert records == [transform_issue(issue) for issue in issues]
+        assert list(records[0]) == [field.name for field in ISSUE_FIELDS]
+        assert "reporter" not in records[0]
+
+    def test_missing_values(self, issues):
+        """count 필드는 0, 좌표와 날짜는 null이 되는지 테스트"""
+        record = transform_issues(issues)[1]
+
+        assert record["rating"] == 0
+        assert record["comment_count"] == 0
+        assert record["view_count"] == 0
+        assert record["lat"] is None
+        assert record["coords"] is None
+        assert record["opendate"] is None
+
+    def test_arrow_output(self, issues):
+        """Arrow 테이블의 열 타입 테스트"""
+        table = transform_issues(issues, output="arrow")
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 2
+        assert table.schema.field("lat").type == pa.float64()
+        assert table.schema.field("view_count").type == pa.int64()
+        assert table["opendate"].to_pylist() == ["2024-05-01", None]
+
+    def test_pandas_output(self, issues):
+        """DataFrame 출력 테스트"""
+        frame = transform_issues(issues, output="pandas")
+
+        assert isinstance(frame, pd.DataFrame)
+        assert frame.loc[0, "coords"] == {"lat": 35.084, "lon": -106.651}
+        assert frame["coords"].isna().tolist() == [False, True]
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [("rating", "3"), ("id", "abc"), ("created_at", "2024-05-01T10:00:00")],
+    )
+    def test_fallback_to_transform_issue(self, issues, field, value):
+        """열 단위로 처리할 수 없는 값이 있으면 이슈별 변환으로 대체하는지 테스트"""
+        issues[0][field] = value
+
+        records = transform_issues(issues)
+
+        assert records == [transform_issue(issue) for issue in issues]
+
+    def test_fingerprint_matches_repr(self, issues, caplog):
+        """repr 표기가 Arrow 문자열 변환과 다른 값도 지문이 transform_issue와 같은지 테스트"""
+        values = [
+            ("summary", "it's"),
+            ("summary", 'say "hi"'),
+            ("summary", "back\\slash"),
+            ("summary", "tab\tnewline\n"),
+            ("summary", "né 😀"),
+            ("summary", ""),
+            ("lat", 3.0),
+            ("lat", -0.0),
+            ("lat", 1.5e-05),
+            ("lng", 123456789012.5),
+            ("lng", 1e16),
+        ]
+        batch = [dict(issues[0], **{field: value}) for field, value in values]
+
+        records = transform_issues(batch + issues)
+
+        assert "열 단위 변환 실패" not in caplog.text
+        assert [r["fingerprint"] for r in records] == [
+            transform_issue(issue)["fingerprint"] for issue in batch + issues
+        ]
+
+    def test_small_batch_per_issue(self, issues):
+        """COLUMNAR_MIN_ISSUES보다 적은 레코드 변환은 이슈별로 하는지 테스트"""
+        with patch.object(data_transform, "COLUMNAR_MIN_ISSUES", 3), patch.object(
+            data_transform, "_transform_table"
+        ) as transform_table:
+            records = transform_issues(issues)
+
+        transform_table.assert_not_called()
+        assert records == [transform_issue(issue) for issue in issues]
+
+    def test_invalid_output(self, issues):
+        """지원하지 않는 출력 형식 테스트"""
+        with pytest.raises(ValueError):
+            transform_issues(issues, output="csv")
@@ -125,6 +125,23 @@ class TestPostgresConnectorPytest:
         mock_cur.close.assert_called_once()
         mock_conn.close.assert_called_once()
 
+    def test_nested_connections_independent(self, mock_postgres_config):
+        """열려 있는 연결 안에서 다시 connect()해도 각자 자기 연결을 닫는지 테스트"""
+        outer_conn, inner_conn = MagicMock(), MagicMock()
+        with patch("psycopg2.connect", side_effect=[outer_conn, inner_conn]):
+            connector = PostgresConnector(mock_postgres_config)
+
+            with connector.connect() as outer:
+                with connector.connect() as inner:
+                    assert inner is inner_conn.cursor.return_value
+                inner_conn.close.assert_called_once()
+                outer_conn.close.assert_not_called()
+                assert outer is outer_conn.cursor.return_value
+
+        outer_conn.commit.assert_called_once()
+        outer_conn.close.assert_called_once()
+        assert connector._conn is None
+
     def test_check_connection_success(
         self, mock_postgres_config, mock_psycopg2_connect
     ):
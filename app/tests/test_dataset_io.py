@@ -0,0 +1,112 @@
+import pytest
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.utils.dataset_io import (
+    dataset_suffix,
+    detect_format,
+    iter_dataset,
+    open_dataset_writer,
+    read_dataset,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """테스트에 사용할 임시 디렉토리 생성."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        yield Path(tmpdirname)
+
+
+@pytest.fixture
+def sample_frame():
+    """고정 타입 컬럼을 가진 샘플 DataFrame."""
+    return pd.DataFrame(
+        {
+            "name": ["Kim", "Lee", "Park"],
+            "age": pd.Series([20, 30, 40], dtype="int16"),
+            "zip": ["00501", "12345", "99950"],
+            "lng": [1.5, -2.25, 3.125],
+        }
+    )
+
+
+class TestDatasetFormat:
+    """포맷/확장자 처리 테스트"""
+
+    def test_dataset_suffix(self):
+        """포맷과 압축 방식에 맞는 확장자가 반환되는지 테스트"""
+        assert dataset_suffix("csv") == ".csv"
+        assert dataset_suffix("csv", "gzip") == ".csv.gz"
+        assert dataset_suffix("csv", "zstd") == ".csv.zst"
+        assert dataset_suffix("parquet", "snappy") == ".parquet"
+
+    def test_invalid_compression(self):
+        """포맷에서 지원하지 않는 압축 방식이면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            dataset_suffix("csv", "snappy")
+
+    def test_detect_format(self):
+        """확장자로 포맷이 추정되는지 테스트"""
+        assert detect_format("a/test_data.csv") == ("csv", None)
+        assert detect_format("a/test_data.csv.gz") == ("csv", "gzip")
+        assert detect_format("a/test_data.csv.zst") == ("csv", "zstd")
+        assert detect_format("a/test_data.parquet") == ("parquet", None)
+
+
+class TestDatasetRoundTrip:
+    """기록한 데이터셋을 타입 그대로 다시 읽는지 테스트"""
+
+    @pytest.mark.parametrize(
+        "filename, output_format, compression",
+        [
+            ("data.csv", "csv", None),
+            ("data.csv.gz", "csv", "gzip"),
+            ("data.csv.zst", "csv", "zstd"),
+            ("data.parquet", "parquet", "snappy"),
+        ],
+    )
+    def test_round_trip(
+        self, temp_dir, sample_frame, filename, output_format, compression
+    ):
+        path = temp_dir / filename
+        with open_dataset_writer(
+            path, list(sample_frame.columns), output_format, compression
+        ) as writer:
+            writer.write(sample_frame.iloc[:2])
+            writer.write(sample_frame.iloc[2:])
+
+        df = read_dataset(path)
+
+        assert len(df) == 3
+        assert df["zip"].tolist() == ["00501", "12345", "99950"]
+        assert str(df["age"].dtype) == "int16"
+        assert df["lng"].tolist() == [1.5, -2.25, 3.125]
+
+    def test_parquet_row_group_size(self, temp_dir, sample_frame):
+        """배치 크기와 무관하게 row_group_size 단위로 row group이 만들어지는지 테스트"""
+        path = temp_dir / "data.parquet"
+        with open_dataset_writer(
+            path, list(sample_frame.columns), "parquet", row_group_size=2
+        ) as writer:
+            for _ in range(3):
+                writer.write(sample_frame)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_rows == 9
+        assert [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ] == [2, 2, 2, 2, 1]
+
+    def test_iter_dataset(self, temp_dir, sample_frame):
+        """iter_dataset이 batch_size 단위로 나눠 읽는지 테스트"""
+        path = temp_dir / "data.parquet"
+        with open_dataset_writer(path, list(sample_frame.columns), "parquet") as writer:
+            writer.write(sample_frame)
+
+        sizes = [len(batch) for batch in iter_dataset(path, batch_size=2)]
+
+        assert sizes == [2, 1]
@@ -0,0 +1,177 @@
+from dataclasses import replace
+
+import pytest
+
+import numpy as np
+
+from src.models.dataset_schema import (
+    ColumnSpec,
+    compile_column,
+    compile_schema,
+    schema_dtypes,
+    skewed_user_schema,
+    user_schema,
+    zipf_cdf,
+)
+from src.services.data_generation import DatasetConfig, DataGenerator
+from src.utils.dataset_io import read_dataset
+
+
+def draw(spec: ColumnSpec, size: int = 100_000, seed: int = 0):
+    """spec을 컴파일해 size개의 값을 생성한다."""
+    column = compile_column(spec)
+    uniforms = np.random.default_rng(seed).random((column.draws, size))
+    return column.sample(uniforms)
+
+
+class TestColumnSpec:
+    """ColumnSpec 검증 테스트"""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"type": "date"},
+            {"distribution": "pareto"},
+            {"null_rate": 1.5},
+            {"cardinality": 0},
+            {"distribution": "normal"},
+            {"distribution": "categorical"},
+            {"distribution": "categorical", "values": ["a", "b"], "weights": [1]},
+            {"type": "int", "cardinality": 10, "low": 0, "high": 1000},
+            {"type": "float", "distribution": "normal", "cardinality": 5},
+            {"type": "int", "values": [1, 2, 3]},
+        ],
+    )
+    def test_invalid_spec(self, options):
+        """잘못된 컬럼 정의면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            ColumnSpec("column", **options)
+
+    def test_duplicate_columns(self):
+        """스키마에 같은 컬럼명이 있으면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            compile_schema([ColumnSpec("a"), ColumnSpec("a")])
+
+
+class TestDistributions:
+    """분포별 샘플러 테스트"""
+
+    def test_zipf_is_skewed(self):
+        """Zipf 분포에서 앞 순위 값이 지수에 맞게 더 자주 나오는지 테스트"""
+        values = draw(
+            ColumnSpec("city", distribution="zipf", cardinality=100, zipf_exponent=1.0)
+        )
+        counts = values.value_counts()
+
+        assert counts.index[0] == "city_0"
+        assert counts["city_0"] / counts["city_1"] == pytest.approx(2.0, rel=0.1)
+        assert values.nunique() <= 100
+
+    def test_zipf_cdf(self):
+        """Zipf 누적 확률이 1로 끝나는지 테스트"""
+        cdf = zipf_cdf(10, 1.2)
+
+        assert cdf[-1] == pytest.approx(1.0)
+        assert np.all(np.diff(cdf) > 0)
+
+    def test_categorical_weights(self):
+        """categorical 분포가 가중치 비율을 따르는지 테스트"""
+        values = draw(
+            ColumnSpec(
+                "status",
+                distribution="categorical",
+                values=["open", "closed"],
+                weights=[3, 1],
+            )
+        )
+
+        assert (values == "open").mean() == pytest.approx(0.75, abs=0.01)
+
+    def test_uniform_int_range(self):
+        """정수 uniform 분포가 [low, high] 범위를 모두 채우는지 테스트"""
+        values = draw(ColumnSpec("age", type="int", low=18, high=80))
+
+        assert values.min() == 18
+        assert values.max() == 80
+
+    def test_normal(self):
+        """normal 분포의 평균과 표준편차 테스트"""
+        values = draw(
+            ColumnSpec("score", type="float", distribution="normal", mean=5, std=2)
+        )
+
+        assert values.mean() == pytest.approx(5, abs=0.05)
+        assert values.std() == pytest.approx(2, abs=0.05)
+
+    @pytest.mark.parametrize("column_type", ["string", "int", "float"])
+    def test_null_rate(self, column_type):
+        """null_rate 비율만큼 결측값이 생성되는지 테스트"""
+        values = draw(ColumnSpec("value", type=column_type, null_rate=0.2))
+
+        assert values.isna().mean() == pytest.approx(0.2, abs=0.01)
+
+
+class TestSchemaGeneration:
+    """DataGenerator와 스키마 연동 테스트"""
+
+    def test_header_from_schema(self):
+        """스키마를 지정하면 header가 컬럼명으로 정해지는지 테스트"""
+        config = DatasetConfig(schema=[ColumnSpec("a"), ColumnSpec("b", type="int")])
+
+        assert config.header == ["a", "b"]
+        with pytest.raises(ValueError):
+            DatasetConfig(schema=[ColumnSpec("a")], header=["b"])
+
+    def test_schema_batch_is_reproducible(self):
+        """같은 seed로 스키마 배치를 만들면 동일한지 테스트"""
+        config = DatasetConfig(schema=skewed_user_schema(), seed=9)
+
+        first = DataGenerator(config)._generate_batch(500)
+        second = DataGenerator(config)._generate_batch(500)
+
+        assert list(first.columns) == config.header
+        assert first.equals(second)
+        assert first["city"].value_counts().iloc[0] > 500 / 10
+
+    def test_schema_dtypes(self):
+        """컬럼 타입과 null_rate에 맞는 읽기 타입을 반환하는지 테스트"""
+        dtypes = schema_dtypes(
+            [
+                ColumnSpec("code", type="int"),
+                ColumnSpec("score", type="int", null_rate=0.1),
+                ColumnSpec("zip", type="string"),
+                ColumnSpec("ratio", type="float", null_rate=0.1),
+            ]
+        )
+
+        assert dtypes == {
+            "code": "int64",
+            "score": "Int64",
+            "zip": "string",
+            "ratio": "float64",
+        }
+
+    def test_schema_dataset_round_trip_with_nulls(self, tmp_path):
+        """결측값이 있는 스키마 데이터셋을 기록한 뒤 그대로 읽는지 테스트"""
+        schema = [
+            replace(column, null_rate=0.3) if column.name == "age" else column
+            for column in user_schema()
+        ] + [ColumnSpec("code", type="int", low=0, high=99)]
+        config = DatasetConfig(
+            record_count=200,
+            output_dirs=[str(tmp_path)],
+            schema=schema,
+            seed=4,
+            vocabulary_size=20,
+        )
+        generator = DataGenerator(config)
+        paths, _ = generator.create_sample_dataset()
+
+        df = read_dataset(paths[0], dtypes=generator.dataset_dtypes())
+
+        assert len(df) == 200
+        assert str(df["age"].dtype) == "Int64"
+        assert 0 < df["age"].isna().sum() < 200
+        assert df["age"].dropna().between(18, 80).all()
+        assert str(df["code"].dtype) == "int64"
+        assert str(df["zip"].dtype) == "string"
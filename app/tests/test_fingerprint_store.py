@@ -0,0 +1,69 @@
+import pytest
+
+from src.utils.fingerprint_store import FingerprintStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FingerprintStore(tmp_path / "fingerprints.tsv")
+
+
+def issue(issue_id, fingerprint):
+    return {"id": str(issue_id), "fingerprint": fingerprint}
+
+
+class TestFingerprintStore:
+    """이슈 지문 저장소 테스트"""
+
+    def test_changed(self, store):
+        """새 이슈와 지문이 바뀐 이슈만 고르는지 테스트"""
+        store.record([issue(1, "aa"), issue(2, "bb")])
+
+        changed = store.changed(
+            [issue(1, "aa"), issue(2, "cc"), issue(3, "dd"), {"id": "4"}]
+        )
+
+        assert [i["id"] for i in changed] == ["2", "3", "4"]
+
+    def test_reload(self, store):
+        """다시 열어도 마지막 지문이 남는지 테스트"""
+        store.record([issue(1, "aa")])
+        store.record([issue(1, "bb"), issue(2, "cc")])
+
+        reopened = FingerprintStore(store.path)
+
+        assert len(reopened) == 2
+        assert reopened.get(1) == "bb"
+
+    def test_record_only_changes(self, store):
+        """같은 지문은 다시 기록하지 않는지 테스트"""
+        assert store.record([issue(1, "aa"), issue(2, "bb")]) == 2
+        assert store.record([issue(1, "aa"), issue(2, "cc")]) == 1
+        assert len(store.path.read_text().splitlines()) == 3
+
+    def test_compact_on_load(self, store):
+        """덧붙인 줄이 쌓이면 읽을 때 id당 한 줄로 줄이는지 테스트"""
+        for n in range(5):
+            store.record([issue(1, f"v{n}")])
+
+        reopened = FingerprintStore(store.path)
+
+        assert reopened.get(1) == "v4"
+        assert store.path.read_text() == "1\tv4\n"
+
+    def test_truncated_last_line(self, store):
+        """기록 중 잘린 마지막 줄은 무시하는지 테스트"""
+        store.path.write_text("1\taa\n2\tb")
+
+        reopened = FingerprintStore(store.path)
+
+        assert reopened.get(1) == "aa"
+        assert reopened.get(2) is None
+
+    def test_clear(self, store):
+        store.record([issue(1, "aa")])
+
+        store.clear()
+
+        assert len(store) == 0
+        assert not store.path.exists()
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from src.utils.geohash import encode, encode_array
+
+
+class TestGeohash:
+    """geohash 인코딩 테스트"""
+
+    def test_known_value(self):
+        """알려진 좌표의 geohash와 같은지 테스트"""
+        assert encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_prefix(self):
+        """낮은 precision이 높은 precision의 접두사인지 테스트"""
+        full = encode(35.084, -106.651, 7)
+        assert [encode(35.084, -106.651, p) for p in range(1, 7)] == [
+            full[:p] for p in range(1, 7)
+        ]
+
+    def test_out_of_range(self):
+        """범위를 벗어난 좌표는 None"""
+        assert encode(91.0, 0.0, 5) is None
+        assert encode(0.0, -181.0, 5) is None
+
+    @pytest.mark.parametrize("precision", [1, 4, 7, 12])
+    def test_array_matches_scalar(self, precision):
+        """배열 인코딩이 하나씩 인코딩한 결과와 같은지 테스트"""
+        rng = np.random.default_rng(0)
+        lat = rng.uniform(-90, 90, 1_000)
+        lon = rng.uniform(-180, 180, 1_000)
+        lat[:3], lon[:3] = [90.0, -90.0, 0.0], [180.0, -180.0, 0.0]
+
+        hashes = encode_array(lat, lon, precision)
+
+        assert list(hashes) == [encode(a, b, precision) for a, b in zip(lat, lon)]
+
+    def test_array_invalid_coordinates(self):
+        """NaN이나 범위를 벗어난 좌표는 None"""
+        hashes = encode_array([np.nan, 95.0, 35.084], [0.0, 0.0, -106.651], 5)
+
+        assert list(hashes) == [None, None, encode(35.084, -106.651, 5)]
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            encode(0.0, 0.0, 13)
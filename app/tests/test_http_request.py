@@ -1,5 +1,12 @@
+import gzip
+import json
+import threading
 import unittest
-from src.utils.http_client import fetch_page
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from src.utils.http_client import HttpClient, fetch_page
+from src.utils.rate_limiter import RateLimiter
 
 
 class TestHttpRequest(unittest.TestCase):
@@ -18,5 +25,113 @@ class TestHttpRequest(unittest.TestCase):
         )
 
 
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """요청 경로/헤더/연결 포트를 기록하고 gzip JSON으로 응답하는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(
+            (self.path, dict(self.headers), self.client_address[1])
+        )
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = gzip.compress(json.dumps({"path": self.path}).encode())
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+        self.server.requests = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/issues"
+        self.client = HttpClient(max_connections=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_gzip_and_urlencoded_params(self):
+        """쿼리 파라미터를 인코딩하고 gzip 응답을 풀어서 반환하는지 테스트"""
+        data = self.client.fetch_page(
+            self.base_url, {"place_url": "bernalillo county", "status": "a&b"}
+        )
+
+        self.assertEqual(
+            data["path"], "/issues?place_url=bernalillo+county&status=a%26b"
+        )
+        headers = self.server.requests[0][1]
+        self.assertEqual(headers["Accept-Encoding"], "gzip")
+
+    def test_connection_is_reused(self):
+        """여러 요청이 같은 keep-alive 연결을 재사용하는지 테스트"""
+        for page in range(1, 4):
+            self.assertIsNotNone(self.client.fetch_page(self.base_url, {"page": page}))
+
+        ports = {port for _, _, port in self.server.requests}
+        self.assertEqual(len(ports), 1)
+
+    @patch("src.utils.http_client.CHUNK_SIZE", 8)
+    def test_streamed_body_releases_connection(self):
+        """본문을 조각으로 읽어 gzip을 풀고, 상태 코드와 관계없이 연결을 풀에 돌려주는지 테스트"""
+        client = HttpClient(max_connections=1)
+        self.server.statuses = [500, 404, 200]
+        pool = client._pool.connection_from_url(self.base_url)
+
+        results = [client.fetch_raw(self.base_url, {"page": page}) for page in range(3)]
+        body = client.fetch_raw(self.base_url, {"page": 3})
+
+        self.assertEqual(results[:2], [None, None])
+        self.assertEqual(json.loads(body), {"path": "/issues?page=3"})
+        self.assertEqual(pool.num_connections, 1)
+        self.assertEqual(pool.pool.qsize(), 1)
+        client.close()
+
+    @patch("src.utils.http_client.time.sleep")
+    def test_retry_on_rate_limit(self, mock_sleep):
+        """429 응답이면 백오프 후 다시 요청하는지 테스트"""
+        self.server.statuses = [429, 200]
+
+        data = self.client.fetch_page(self.base_url, {"page": 1})
+
+        self.assertIsNotNone(data)
+        self.assertEqual(len(self.server.requests), 2)
+        mock_sleep.assert_called_once_with(2)
+
+    @patch("src.utils.http_client.time.sleep")
+    def test_rate_limiter_handles_retry_after(self, mock_sleep):
+        """RateLimiter가 있으면 작업자가 직접 쉬지 않고 Retry-After를 공유하는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=4)
+        client = HttpClient(max_connections=2, rate_limiter=limiter)
+        self.server.statuses = [429, 200]
+
+        data = client.fetch_page(self.base_url, {"page": 1})
+        client.close()
+
+        self.assertIsNotNone(data)
+        mock_sleep.assert_not_called()
+        self.assertEqual(limiter.throttled, 1)
+        self.assertEqual(limiter.requests, 2)
+        self.assertEqual(limiter.concurrency, 2)
+
+    def test_error_status(self):
+        """오류 응답이면 None을 반환하는지 테스트"""
+        self.server.statuses = [500]
+
+        self.assertIsNone(self.client.fetch_page(self.base_url, {"page": 1}))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+import math
+
+import pytest
+
+from src.models.issue_schema import (
+    GEOHASH_PRECISIONS,
+    ISSUE_FIELDS,
+    IssueField,
+    coerce_date,
+    coerce_float,
+    coerce_integer,
+    compile_transform,
+    es_mapping,
+    grid_field,
+)
+from src.utils.geohash import encode
+
+
+class TestIssueField:
+    """IssueField 검증 테스트"""
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"type": "long"},
+            {"type": "geo_point"},
+            {"type": "keyword", "source_type": "object"},
+            {"type": "date", "derive": "week", "inputs": ("created_at",)},
+            {"type": "keyword", "derive": "day", "inputs": ("created_at",)},
+            {"type": "geo_point", "derive": "point", "inputs": ("lat",)},
+            {"type": "keyword", "derive": "geohash", "inputs": ("lat", "lng")},
+            {"type": "keyword", "derive": "prefix", "inputs": ("g",), "precision": 0},
+        ],
+    )
+    def test_invalid_field(self, options):
+        """잘못된 필드 정의면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            IssueField("field", **options)
+
+    def test_derived_field_needs_earlier_inputs(self):
+        """파생 필드가 앞에 정의되지 않은 필드를 쓰면 ValueError"""
+        fields = [
+            IssueField("opendate", "date", derive="day", inputs=("created_at",)),
+            IssueField("created_at", "date"),
+        ]
+        with pytest.raises(ValueError):
+            compile_transform(fields)
+
+
+class TestCoercion:
+    """매핑 타입별 값 변환 테스트"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (3, 3),
+            ("4", 4),
+            (2.9, 2),
+            ("2.5", 2),
+            (None, None),
+            ("", None),
+            (True, None),
+        ],
+    )
+    def test_integer(self, value, expected):
+        assert coerce_integer(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(35.1, 35.1), ("-106.5", -106.5), (3, 3.0), ("x", None), (math.nan, None)],
+    )
+    def test_float(self, value, expected):
+        assert coerce_float(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2024-05-01T10:00:00-06:00", "2024-05-01T10:00:00-06:00"),
+            ("2024-05-01T16:00:00Z", "2024-05-01T16:00:00Z"),
+            ("", None),
+            ("yesterday", None),
+            (1714579200, None),
+        ],
+    )
+    def test_date(self, value, expected):
+        assert coerce_date(value) == expected
+
+
+class TestCompileTransform:
+    """스키마로 생성한 변환 함수 테스트"""
+
+    def test_typed_document(self):
+        """매핑 타입에 맞는 값과 고정된 키 순서로 변환하는지 테스트"""
+        transform = compile_transform()
+
+        document = transform(
+            {
+                "id": 7,
+                "lat": "35.08",
+                "lng": -106.65,
+                "rating": None,
+                "view_count": "12",
+                "created_at": "2024-05-01T10:00:00-06:00",
+                "html_url": "ignored",
+            }
+        )
+
+        assert list(document) == [field.name for field in ISSUE_FIELDS]
+        assert document["id"] == "7"
+        assert document["coords"] == {"lat": 35.08, "lon": -106.65}
+        assert document["rating"] == 0
+        assert document["view_count"] == 12
+        assert document["summary"] is None
+        assert document["opendate"] == "2024-05-01"
+
+    def test_missing_coordinates(self):
+        """좌표가 하나라도 없으면 coords와 격자 키가 None인지 테스트"""
+        document = compile_transform()({"id": 1, "lat": 35.08})
+
+        assert document["lng"] is None
+        assert document["coords"] is None
+        assert all(document[grid_field(p)] is None for p in GEOHASH_PRECISIONS)
+
+    def test_grid_keys(self):
+        """precision별 geohash 격자 키가 같은 격자의 접두사인지 테스트"""
+        document = compile_transform()({"id": 1, "lat": 35.084, "lng": -106.651})
+
+        finest = encode(35.084, -106.651, max(GEOHASH_PRECISIONS))
+        for precision in GEOHASH_PRECISIONS:
+            assert document[grid_field(precision)] == finest[:precision]
+
+    def test_fingerprint(self):
+        """같은 내용이면 같은 지문, 내용이 바뀌면 다른 지문인지 테스트"""
+        transform = compile_transform()
+        issue = {"id": 7, "summary": "Pothole", "lat": 35.08, "lng": -106.65}
+
+        fingerprint = transform(issue)["fingerprint"]
+
+        assert transform(dict(issue, html_url="ignored"))["fingerprint"] == fingerprint
+        assert transform(dict(issue, id="7"))["fingerprint"] == fingerprint
+        assert transform(dict(issue, summary="Fixed"))["fingerprint"] != fingerprint
+        assert len(fingerprint) == 16
+
+    def test_mapping_matches_fields(self):
+        """매핑이 변환 결과와 같은 필드와 타입을 쓰는지 테스트"""
+        properties = es_mapping()["mappings"]["properties"]
+
+        assert list(properties) == [field.name for field in ISSUE_FIELDS]
+        assert properties["coords"] == {"type": "geo_point"}
+        assert properties["view_count"] == {"type": "integer"}
+        assert properties["fingerprint"]["index"] is False
+        assert properties["geohash_5"] == {
+            "type": "keyword",
+            "eager_global_ordinals": True,
+        }
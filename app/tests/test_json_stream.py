@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from src.utils.json_stream import JsonArrayStream, iter_chunks
+
+PAGE = {
+    "issues": [
+        {"id": i, "summary": "포트홀 " * i, "rating": 12345, "lat": 35.1}
+        for i in range(20)
+    ],
+    "metadata": {"pagination": {"pages": 3273, "next_page": None}},
+    "total": 98765,
+}
+
+
+class TestJsonArrayStream:
+    """JsonArrayStream 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 1 << 20])
+    def test_chunk_boundaries(self, chunk_size):
+        """멀티바이트 문자나 숫자가 조각 경계에서 나뉘어도 같은 결과인지 테스트"""
+        body = json.dumps(PAGE, ensure_ascii=False, indent=2).encode("utf-8")
+        parser = JsonArrayStream("issues")
+
+        items = list(parser.iter_items(iter_chunks(body, chunk_size)))
+
+        assert items == PAGE["issues"]
+        assert parser.found
+        assert parser.fields == {"metadata": PAGE["metadata"], "total": 98765}
+
+    def test_items_arrive_before_end(self):
+        """배열 요소가 본문 끝을 받기 전에 완성되는 대로 나오는지 테스트"""
+        parser = JsonArrayStream("issues")
+
+        assert parser.feed(b'{"issues": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b": 2}]") == [{"id": 2}]
+        assert parser.feed(b', "metadata": {}}') == []
+        assert parser.close() == []
+
+    def test_missing_array(self):
+        """배열 키가 없으면 found가 False인지 테스트"""
+        parser = JsonArrayStream("issues")
+
+        assert list(parser.iter_items([b'{"errors": ["not found"]}'])) == []
+        assert not parser.found
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"issues": [{"id": 1}',
+            b'["issues"]',
+            b'{"issues": [1}}',
+            b"{} x",
+            # 쉼표가 빠지거나 남는 경우
+            b'{,,"issues": []}',
+            b'{"total": 1,, "issues": []}',
+            b'{"issues": [],}',
+            b'{"total": 1 "issues": []}',
+            b'{"issues": [1,, 2]}',
+            b'{"issues": [1,]}',
+            b'{"issues": [, 1]}',
+        ],
+    )
+    def test_invalid_body(self, body):
+        """끊기거나 잘못된 본문이면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            list(JsonArrayStream("issues").iter_items([body]))
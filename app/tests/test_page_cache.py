@@ -0,0 +1,73 @@
+import pytest
+
+from src.utils.page_cache import PageCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(tmp_path / "cache")
+
+
+class TestPageCache:
+    """PageCache 테스트"""
+
+    def test_store_and_get(self, cache):
+        """저장한 본문과 검증자를 URL로 다시 읽는지 테스트"""
+        cache.store(
+            "http://api/issues?page=1",
+            b'{"issues": []}',
+            '"v1"',
+            "Sat, 01 Mar 2025 00:00:00 GMT",
+        )
+
+        page = cache.get("http://api/issues?page=1")
+
+        assert page.body == b'{"issues": []}'
+        assert page.json() == {"issues": []}
+        assert page.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Sat, 01 Mar 2025 00:00:00 GMT",
+        }
+        assert cache.get("http://api/issues?page=2") is None
+
+    def test_overwrite(self, cache):
+        """같은 URL을 다시 저장하면 새 본문으로 바뀌는지 테스트"""
+        cache.store("http://api/a", b"1", '"v1"')
+        cache.store("http://api/a", b"2")
+
+        page = cache.get("http://api/a")
+
+        assert page.body == b"2"
+        assert page.conditional_headers() == {}
+        assert len(cache) == 1
+
+    def test_iter_pages_skips_corrupted(self, cache):
+        """손상된 메타데이터는 건너뛰고 나머지 페이지를 돌려주는지 테스트"""
+        cache.store("http://api/b", b"b")
+        cache.store("http://api/a", b"a")
+        (cache.directory / "broken.meta.json").write_text("{")
+
+        pages = list(cache.iter_pages())
+
+        assert [page.url for page in pages] == ["http://api/b", "http://api/a"]
+        assert not list(cache.directory.glob("*.tmp"))
+
+    def test_iter_pages_in_write_order(self, cache):
+        """다시 저장한 응답은 나중에 저장한 것으로 보고 뒤에 돌려주는지 테스트"""
+        cache.store("http://api/a", b"a1")
+        cache.store("http://api/b", b"b")
+        cache.store("http://api/a", b"a2")
+
+        pages = list(cache.iter_pages())
+
+        assert [page.body for page in pages] == [b"b", b"a2"]
+
+    def test_delete(self, cache):
+        cache.store("http://api/a", b"a")
+
+        cache.delete("http://api/a")
+        cache.delete("http://api/missing")
+
+        assert cache.get("http://api/a") is None
+        assert len(cache) == 0
+        assert not list(cache.directory.iterdir())
@@ -0,0 +1,52 @@
+from src.utils.page_manifest import PageManifest, page_checksum
+
+PARAMS = {"place_url": "place", "per_page": 100, "status": "Archived"}
+
+
+class TestPageManifest:
+    """PageManifest 테스트"""
+
+    def test_resume_keeps_latest_record(self, tmp_path):
+        """이어 쓰면 페이지별 마지막 기록을 유지하는지 테스트"""
+        path = tmp_path / "manifest.jsonl"
+        manifest = PageManifest(path)
+        manifest.start(dict(PARAMS, page=1))
+        manifest.mark_failed(1, "timeout")
+        manifest.mark_done(1, 100, "abc")
+        manifest.mark_failed(2, "timeout")
+
+        resumed = PageManifest(path)
+        assert resumed.start(PARAMS, resume=True) == 1
+        assert resumed.get(1)["attempts"] == 2
+        assert resumed.pages("failed") == [2]
+        # 압축되어 파라미터 한 줄과 페이지당 한 줄만 남는다
+        assert len(path.read_text().splitlines()) == 3
+
+    def test_params_mismatch_starts_over(self, tmp_path):
+        """수집 파라미터가 다르면 기존 기록을 버리는지 테스트"""
+        path = tmp_path / "manifest.jsonl"
+        manifest = PageManifest(path)
+        manifest.start(PARAMS)
+        manifest.mark_done(1, 100, "abc")
+
+        assert PageManifest(path).start(dict(PARAMS, status="Open"), resume=True) == 0
+
+    def test_truncated_line_ignored(self, tmp_path):
+        """중단되어 잘린 마지막 줄을 무시하는지 테스트"""
+        path = tmp_path / "manifest.jsonl"
+        manifest = PageManifest(path)
+        manifest.start(PARAMS)
+        manifest.mark_done(1, 100, "abc")
+        with open(path, "a") as f:
+            f.write('{"page": 2, "stat')
+
+        resumed = PageManifest(path)
+        assert resumed.start(PARAMS, resume=True) == 1
+        assert resumed.get(2) is None
+
+    def test_checksum(self):
+        """체크섬이 본문 바이트의 SHA-256인지 테스트"""
+        assert page_checksum(b"{}") == (
+            "44136fa355b3678a1146ad16f7e8649e94fb4fc21fe77e8310c060f61caaff8a"
+        )
+        assert page_checksum(b'{"id": 1}') != page_checksum(b'{"id": 2}')
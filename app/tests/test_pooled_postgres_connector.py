@@ -0,0 +1,170 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from src.utils.connection import PooledPostgresConnector
+
+
+def new_connection(*args, **kwargs):
+    conn = MagicMock()
+    conn.closed = 0
+    return conn
+
+
+@pytest.fixture
+def mock_connect():
+    with patch("psycopg2.connect", side_effect=new_connection) as mock_connect:
+        yield mock_connect
+
+
+@pytest.fixture
+def pool(mock_postgres_config, mock_connect):
+    pool = PooledPostgresConnector(mock_postgres_config, min_size=1, max_size=2)
+    yield pool
+    pool.close()
+
+
+class TestPooledPostgresConnector:
+    """PooledPostgresConnector 클래스에 대한 테스트"""
+
+    def test_init_does_not_connect(self, mock_postgres_config, mock_connect):
+        """생성할 때는 연결하지 않는지 확인"""
+        PooledPostgresConnector(mock_postgres_config)
+
+        mock_connect.assert_not_called()
+
+    def test_invalid_size(self, mock_postgres_config):
+        with pytest.raises(ValueError):
+            PooledPostgresConnector(mock_postgres_config, min_size=3, max_size=2)
+        with pytest.raises(ValueError):
+            PooledPostgresConnector(mock_postgres_config, max_size=0)
+
+    def test_reuses_connection(self, pool, mock_connect):
+        """블록이 끝나면 연결을 닫지 않고 다시 빌려주는지 확인"""
+        with pool.connect() as cur:
+            cur.execute("SELECT 1")
+        with pool.connect():
+            pass
+
+        mock_connect.assert_called_once()
+        conn = pool._idle[0][0]
+        assert conn.commit.call_count == 2
+        conn.close.assert_not_called()
+        assert pool.size == 1 and pool.idle == 1
+
+    def test_query_exception_rolls_back(self, mock_postgres_config, mock_connect):
+        """쿼리 예외 시 rollback 후 연결을 풀에 돌려주는지 확인"""
+        pool = PooledPostgresConnector(mock_postgres_config, health_check=False)
+        with pytest.raises(psycopg2.Error):
+            with pool.connect() as cur:
+                cur.execute.side_effect = psycopg2.Error("Query error")
+                cur.execute("SELECT 1")
+
+        conn = pool._idle[0][0]
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        assert pool.idle == 1
+
+    def test_health_check_replaces_broken_connection(self, pool, mock_connect):
+        """빌려줄 때 응답하지 않는 연결은 닫고 새로 여는지 확인"""
+        with pool.connect():
+            pass
+        broken = pool._idle[0][0]
+        broken.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError("server closed the connection")
+        )
+
+        with pool.connect():
+            pass
+
+        broken.close.assert_called_once()
+        assert mock_connect.call_count == 2
+        assert pool.size == 1
+
+    def test_max_lifetime(self, mock_postgres_config, mock_connect):
+        """수명이 지난 연결은 다시 쓰지 않는지 확인"""
+        pool = PooledPostgresConnector(
+            mock_postgres_config, max_lifetime=60.0, health_check=False
+        )
+        with patch("src.utils.connection.time.monotonic", return_value=1000.0):
+            with pool.connect():
+                pass
+        old = pool._idle[0][0]
+
+        with patch("src.utils.connection.time.monotonic", return_value=1061.0):
+            with pool.connect():
+                pass
+
+        old.close.assert_called_once()
+        assert mock_connect.call_count == 2
+
+    def test_threads_get_separate_connections(self, pool, mock_connect):
+        """동시에 빌린 스레드는 서로 다른 연결을 쓰는지 확인"""
+        barrier = threading.Barrier(2)
+        cursors = []
+
+        def work():
+            with pool.connect() as cur:
+                cursors.append(cur)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cursors) == 2 and cursors[0] is not cursors[1]
+        assert mock_connect.call_count == 2
+        assert pool.idle == 2
+
+    def test_timeout_when_exhausted(self, mock_postgres_config, mock_connect):
+        """모든 연결이 사용 중이면 timeout 후 PoolError를 내는지 확인"""
+        pool = PooledPostgresConnector(mock_postgres_config, max_size=1, timeout=0.05)
+
+        with pool.connect():
+            with pytest.raises(PoolError):
+                with pool.connect():
+                    pass
+
+    def test_waiter_gets_returned_connection(self, mock_postgres_config, mock_connect):
+        """기다리던 스레드가 돌려받은 연결을 받는지 확인"""
+        pool = PooledPostgresConnector(mock_postgres_config, max_size=1, timeout=5)
+        held = threading.Event()
+        results = []
+
+        def waiter():
+            held.wait(timeout=5)
+            with pool.connect():
+                results.append(True)
+
+        thread = threading.Thread(target=waiter)
+        with pool.connect():
+            thread.start()
+            held.set()
+        thread.join(timeout=5)
+
+        assert results == [True]
+        mock_connect.assert_called_once()
+
+    def test_close(self, pool):
+        """close 후에는 연결을 빌려주지 않는지 확인"""
+        with pool.connect():
+            pass
+        conn = pool._idle[0][0]
+
+        pool.close()
+
+        conn.close.assert_called_once()
+        assert pool.size == 0
+        with pytest.raises(PoolError):
+            with pool.connect():
+                pass
+
+    def test_check_connection(self, pool, mock_connect):
+        assert pool.check_connection() is True
+        assert pool.check_connection() is True
+        mock_connect.assert_called_once()
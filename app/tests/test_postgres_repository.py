@@ -0,0 +1,187 @@
+import csv
+import io
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from src.database.repository import (
+    USER_COLUMNS,
+    PostgreSQLRepository,
+    RepositoryFactory,
+)
+from src.utils.connection import PooledPostgresConnector
+from src.utils.dataset_io import open_dataset_writer
+
+
+class FakeConnector:
+    """connect()로 COPY 내용을 기록하는 모의 커서를 돌려주는 연결 관리자"""
+
+    def __init__(self, first_id: int = 1):
+        self.cur = MagicMock()
+        self.copied = []  # COPY 한 번마다 받은 행 목록
+        self.next_id = first_id
+
+        def copy_expert(sql, buffer):
+            rows = list(csv.reader(io.StringIO(buffer.read())))
+            self.copied.append(rows)
+            self.next_id += len(rows)
+
+        self.cur.copy_expert.side_effect = copy_expert
+        self.cur.fetchone.side_effect = lambda: [self.next_id - 1]
+
+    @contextmanager
+    def connect(self):
+        yield self.cur
+
+
+def users(count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": [f"user{i}" for i in range(count)],
+            "age": range(count),
+            "street": [f"{i} Main St" for i in range(count)],
+            "city": ["Seoul, KR"] * count,
+            "zip": ["01234"] * count,
+            "lng": [126.9] * count,
+            "lat": [None if i == 0 else 37.5 for i in range(count)],
+        }
+    )
+
+
+@pytest.fixture
+def connector():
+    return FakeConnector(first_id=101)
+
+
+@pytest.fixture
+def repository(connector):
+    return PostgreSQLRepository(connector)
+
+
+def test_default_connector_is_pooled():
+    """연결 객체를 주지 않으면 연결 풀을 쓰는지 테스트"""
+    repository = RepositoryFactory.create("postgresql")
+
+    assert isinstance(repository.connector, PooledPostgresConnector)
+    assert repository.connector.size == 0  # 처음 쓸 때 연다
+
+
+class TestCopySave:
+    """COPY FROM STDIN 대량 저장 테스트"""
+
+    def test_dataframe_chunks(self, repository, connector):
+        """DataFrame을 청크 단위 CSV로 보내는지 테스트"""
+        result = repository.copy_save(users(5), chunk_size=2)
+
+        assert result.rows == 5
+        assert [len(rows) for rows in connector.copied] == [2, 2, 1]
+        sql = connector.cur.copy_expert.call_args.args[0]
+        assert sql.startswith(f"COPY users ({', '.join(USER_COLUMNS)}) FROM STDIN")
+        first = connector.copied[0][0]
+        assert first == ["user0", "0 Main St", "Seoul, KR", "01234", "126.9", ""]
+        assert result.id_ranges == []
+
+    def test_records(self, repository, connector):
+        """딕셔너리 이터레이터를 저장하는지 테스트"""
+        records = (row for row in users(3).to_dict(orient="records"))
+
+        result = repository.copy_save(records, chunk_size=2)
+
+        assert result.rows == 3
+        assert connector.copied[1] == [
+            ["user2", "2 Main St", "Seoul, KR", "01234", "126.9", "37.5"]
+        ]
+
+    def test_dataset_file(self, repository, connector, tmp_path):
+        """데이터셋 파일을 청크로 읽어 저장하는지 테스트"""
+        path = tmp_path / "users.csv.gz"
+        frame = users(7)
+        with open_dataset_writer(path, list(frame.columns), "csv", "gzip") as writer:
+            writer.write(frame)
+
+        result = repository.copy_save(path, chunk_size=3)
+
+        assert result.rows == 7
+        assert [len(rows) for rows in connector.copied] == [3, 3, 1]
+        assert connector.copied[0][0][3] == "01234"
+
+    def test_return_ids(self, repository, connector):
+        """청크별 id 구간을 이어 붙여 반환하는지 테스트"""
+        result = repository.copy_save(users(5), chunk_size=2, return_ids=True)
+
+        assert result.id_ranges == [(101, 105)]
+        connector.cur.execute.assert_any_call(
+            "LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE"
+        )
+
+    def test_bulk_save_uses_copy(self, repository, connector):
+        """bulk_save가 COPY로 저장하는지 테스트"""
+        saved = repository.bulk_save(users(3).to_dict(orient="records"))
+
+        assert saved == 3
+        connector.cur.copy_expert.assert_called_once()
+
+    def test_missing_column(self, repository):
+        with pytest.raises(ValueError):
+            repository.copy_save(users(3).drop(columns=["zip"]))
+
+    def test_invalid_chunk_size(self, repository):
+        with pytest.raises(ValueError):
+            repository.copy_save(users(3), chunk_size=0)
+
+
+class TestIterAll:
+    """서버 측 커서로 나눠 읽기 테스트"""
+
+    @pytest.fixture
+    def named(self, connector):
+        named = MagicMock()
+        rows = [(i, f"user{i}", "st", "city", "01234", 126.9, 37.5) for i in (3, 4, 7)]
+        named.fetchmany.side_effect = [rows[:2], rows[2:], []]
+        connector.cur.connection.cursor.return_value = named
+        return named
+
+    def test_batches(self, repository, connector, named):
+        """fetchmany 배치를 id 순서로 돌려주는지 테스트"""
+        batches = list(repository.iter_all(batch_size=2))
+
+        assert [[row[0] for row in batch] for batch in batches] == [[3, 4], [7]]
+        assert connector.cur.connection.cursor.call_args.kwargs["name"]
+        query, params = named.execute.call_args.args
+        assert query.endswith("FROM users ORDER BY id")
+        assert params == ()
+        named.fetchmany.assert_called_with(2)
+        named.close.assert_called_once()
+
+    def test_after_id(self, repository, named):
+        """after_id 다음부터 읽는지 테스트 (keyset)"""
+        list(repository.iter_all(batch_size=2, after_id=2))
+
+        query, params = named.execute.call_args.args
+        assert "WHERE id > %s ORDER BY id" in query
+        assert params == (2,)
+
+    def test_pandas(self, repository, named):
+        """DataFrame 배치로 돌려주는지 테스트"""
+        frames = list(repository.iter_all(batch_size=2, output="pandas"))
+
+        assert list(frames[0].columns) == ["id", *USER_COLUMNS]
+        assert frames[0]["id"].tolist() == [3, 4]
+        assert len(frames[1]) == 1
+
+    def test_stop_early_closes_cursor(self, repository, named):
+        """중간에 멈춰도 커서를 닫는지 테스트"""
+        batches = repository.iter_all(batch_size=2)
+        next(batches)
+        batches.close()
+
+        named.close.assert_called_once()
+        assert named.fetchmany.call_count == 1
+
+    def test_invalid_arguments(self, repository):
+        with pytest.raises(ValueError):
+            next(repository.iter_all(batch_size=0))
+        with pytest.raises(ValueError):
+            next(repository.iter_all(output="dict"))
@@ -2,8 +2,9 @@ import unittest
 from unittest.mock import patch, call
 import io
 import sys
+import threading
 
-from src.modules.progress_bar import print_progress_bar
+from src.modules.progress_bar import ProgressReporter, print_progress_bar
 
 
 class TestProgressBar(unittest.TestCase):
@@ -78,5 +79,132 @@ class TestProgressBar(unittest.TestCase):
             self.assertEqual(mock_stdout.getvalue(), expected_outputs[i])
 
 
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressReporter(unittest.TestCase):
+    """ProgressReporter에 대한 테스트"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_redraws_only_after_interval(self, mock_stdout):
+        """interval이 지나기 전에는 다시 그리지 않는지 테스트"""
+        reporter = ProgressReporter(total=100, interval=1.0, clock=self.clock)
+
+        reporter.update(1)  # 첫 업데이트는 바로 그림
+        for _ in range(10):
+            reporter.update(1)
+        self.assertEqual(mock_stdout.getvalue().count("\r"), 1)
+
+        self.clock.now = 1.0
+        reporter.update(1)
+        self.assertEqual(mock_stdout.getvalue().count("\r"), 2)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_rate_and_eta(self, mock_stdout):
+        """처리량과 ETA가 계산되는지 테스트"""
+        reporter = ProgressReporter(total=100, interval=1.0, clock=self.clock)
+
+        reporter.update(0)
+        self.clock.now = 2.0
+        reporter.update(20, nbytes=2048)
+        stats = reporter.stats()
+
+        self.assertEqual(stats.completed, 20)
+        self.assertEqual(stats.bytes_processed, 2048)
+        self.assertAlmostEqual(stats.rate, 10.0)
+        self.assertAlmostEqual(stats.byte_rate, 1024.0)
+        self.assertAlmostEqual(stats.eta, 8.0)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_moving_average(self, mock_stdout):
+        """처리량이 지수 이동 평균으로 갱신되는지 테스트"""
+        reporter = ProgressReporter(
+            total=1000, interval=1.0, smoothing=0.5, clock=self.clock
+        )
+
+        reporter.update(0)
+        self.clock.now = 1.0
+        reporter.update(10)  # 10/s
+        self.clock.now = 2.0
+        reporter.update(30)  # 30/s
+
+        self.assertAlmostEqual(reporter.stats().rate, 20.0)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_close_finishes_line_once(self, mock_stdout):
+        """완료 후 close를 호출해도 줄바꿈이 한 번만 출력되는지 테스트"""
+        reporter = ProgressReporter(total=5, interval=0.0, clock=self.clock)
+
+        reporter.update(5)
+        stats = reporter.close()
+
+        self.assertEqual(mock_stdout.getvalue().count("\n"), 1)
+        self.assertEqual(stats.completed, 5)
+        self.assertEqual(stats.eta, 0.0)
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_disabled_reporter_still_collects(self, mock_stdout):
+        """enabled=False면 출력 없이 통계와 콜백만 동작하는지 테스트"""
+        reports = []
+        reporter = ProgressReporter(
+            total=10, enabled=False, on_report=reports.append, clock=self.clock
+        )
+
+        reporter.update(3)
+        reporter.close()
+
+        self.assertEqual(mock_stdout.getvalue(), "")
+        self.assertEqual([report.completed for report in reports], [3, 3])
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_callback_can_read_stats(self, mock_stdout):
+        """on_report 콜백 안에서 stats()를 호출해도 멈추지 않는지 테스트"""
+        seen = []
+        reporter = ProgressReporter(
+            total=10,
+            enabled=False,
+            on_report=lambda _: seen.append(reporter.stats().completed),
+            clock=self.clock,
+        )
+
+        worker = threading.Thread(
+            target=lambda: (reporter.update(4), reporter.close()), daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(seen, [4, 4])
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_thread_safe_updates(self, mock_stdout):
+        """여러 스레드에서 동시에 update해도 집계가 정확한지 테스트"""
+        reporter = ProgressReporter(total=8000, interval=0.01)
+
+        def work():
+            for _ in range(1000):
+                reporter.update(1, nbytes=2)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = reporter.close()
+        self.assertEqual(stats.completed, 8000)
+        self.assertEqual(stats.bytes_processed, 16000)
+
+
 if __name__ == "__main__":
     unittest.main()
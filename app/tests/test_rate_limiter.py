@@ -0,0 +1,215 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """테스트에서 직접 움직이는 단조 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestParseRetryAfter:
+    """Retry-After 헤더 해석 테스트"""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_http_date(self):
+        now = datetime(2025, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Sat, 01 Mar 2025 12:00:30 GMT", now=now) == 30.0
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_token_bucket(self, clock):
+        """버킷이 비면 rate에 맞는 대기 시간을 돌려주는지 테스트"""
+        limiter = RateLimiter(rate=2, burst=2, max_concurrency=10, clock=clock)
+
+        assert limiter._try_acquire() == 0
+        assert limiter._try_acquire() == 0
+        assert limiter._try_acquire() == pytest.approx(0.5)
+
+        clock.advance(0.5)
+        assert limiter._try_acquire() == 0
+
+    def test_concurrency_limit(self, clock):
+        """동시 요청 수가 가득 차면 반납될 때까지 기다리는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=2, clock=clock)
+
+        assert limiter._try_acquire() == 0
+        assert limiter._try_acquire() == 0
+        assert limiter._try_acquire() is None
+
+        limiter.release(200, latency=0.1)
+        assert limiter._try_acquire() == 0
+
+    def test_retry_after_blocks_all_workers(self, clock):
+        """429의 Retry-After 동안 모든 작업자가 멈추는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=4, clock=clock)
+        limiter._try_acquire()
+
+        limiter.release(429, latency=0.1, retry_after=5)
+
+        assert limiter._try_acquire() == pytest.approx(5)
+        clock.advance(5)
+        assert limiter._try_acquire() == 0
+        assert limiter.throttled == 1
+
+    def test_backoff_without_retry_after(self, clock):
+        """Retry-After가 없으면 연속 429마다 대기 시간이 두 배가 되는지 테스트"""
+        limiter = RateLimiter(base_backoff=1, clock=clock)
+
+        waits = []
+        for _ in range(3):
+            clock.advance(10)
+            limiter._try_acquire()
+            limiter.release(429)
+            waits.append(limiter._try_acquire())
+
+        assert waits == [pytest.approx(1), pytest.approx(2), pytest.approx(4)]
+
+    def test_aimd(self, clock):
+        """성공하면 조금씩 늘고 429면 절반으로 줄어드는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=4, max_concurrency=8, clock=clock)
+
+        for _ in range(4):
+            limiter.release(200, latency=0.1)
+        assert limiter.concurrency == 4  # 한 윈도우(4번 성공)에 약 1 증가
+        limiter.release(200, latency=0.1)
+        assert limiter.concurrency == 5
+
+        limiter.release(429, latency=0.1)
+        assert limiter.concurrency == 2
+
+    def test_simultaneous_429_decrease_once(self, clock):
+        """같은 시점의 429 여러 개는 한 번만 줄이는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=16, max_concurrency=16, clock=clock)
+
+        for _ in range(4):
+            limiter.release(429, latency=0.1)
+
+        assert limiter.concurrency == 8
+
+    def test_slow_response_decreases(self, clock):
+        """latency_threshold보다 느린 응답이면 줄이는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=8, latency_threshold=1.0, clock=clock)
+
+        limiter.release(200, latency=2.0)
+
+        assert limiter.concurrency == 4
+
+    def test_shared_between_threads_and_asyncio(self):
+        """스레드와 asyncio 작업자가 같은 동시 요청 한도를 지키는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=3, max_concurrency=3)
+        peak = []
+        lock = threading.Lock()
+
+        def record():
+            with lock:
+                peak.append(limiter.in_flight)
+
+        def thread_worker():
+            for _ in range(20):
+                with limiter.slot() as slot:
+                    record()
+                    slot.status = 200
+
+        async def async_workers():
+            async def worker():
+                for _ in range(20):
+                    async with limiter.slot_async() as slot:
+                        record()
+                        await asyncio.sleep(0)
+                        slot.status = 200
+
+            await asyncio.gather(*(worker() for _ in range(3)))
+
+        threads = [threading.Thread(target=thread_worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        asyncio.run(async_workers())
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 3
+        assert limiter.requests == 120
+        assert limiter.in_flight == 0
+
+    def counting(self, limiter):
+        """슬롯 확인 횟수를 세도록 감싼다."""
+        calls = []
+        check = limiter._try_acquire_locked
+
+        def counted():
+            calls.append(1)
+            return check()
+
+        limiter._try_acquire_locked = counted
+        return calls
+
+    def test_thread_waits_for_release_without_polling(self):
+        """동시 요청 수가 가득 찬 스레드는 반복 확인 없이 반납될 때 깨어나는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=1, max_concurrency=1)
+        limiter.acquire()
+        calls = self.counting(limiter)
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        waiter.start()
+
+        assert not acquired.wait(0.3)
+        assert len(calls) == 1
+
+        limiter.release(200, latency=0.1)
+        assert acquired.wait(1)
+        waiter.join()
+        assert len(calls) == 2
+        assert limiter.in_flight == 1
+
+    def test_coroutine_waits_for_release_without_polling(self):
+        """asyncio 작업자도 반복 확인 없이 반납될 때 깨어나는지 테스트"""
+        limiter = RateLimiter(initial_concurrency=1, max_concurrency=1)
+        limiter.acquire()
+        calls = self.counting(limiter)
+
+        async def main():
+            waiter = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.3)
+            assert not waiter.done()
+            assert len(calls) == 1
+
+            # 다른 스레드에서 반납해도 깨어난다
+            threading.Thread(target=limiter.release, args=(200, 0.1)).start()
+            await asyncio.wait_for(waiter, 1)
+
+            # 취소된 대기자는 목록에서 빠진다
+            cancelled = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            assert limiter._async_waiters == []
+
+        asyncio.run(main())
+        assert len(calls) == 3
+        assert limiter.in_flight == 1
@@ -0,0 +1,214 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.database.scf_repository import SeeClickFixRepository
+from src.models.issue_schema import ISSUE_FIELDS, es_mapping
+from src.utils.fingerprint_store import FingerprintStore
+
+
+@pytest.fixture
+def issues():
+    """저장할 이슈 목록 (id 없는 이슈 포함)"""
+    return [{"id": 1}, {"id": 2}, {"id": 3}, {"summary": "id 없음"}]
+
+
+def bulk_response(operations, failed_ids=()):
+    """bulk API 응답 형식을 흉내낸다."""
+    items = [
+        {
+            "index": {
+                "_id": op["index"]["_id"],
+                "error": op["index"]["_id"] in failed_ids,
+            }
+        }
+        for op in operations[::2]
+    ]
+    return {"errors": bool(failed_ids), "items": items}
+
+
+@pytest.fixture
+def repository():
+    connector = MagicMock()
+    return SeeClickFixRepository(connector=connector)
+
+
+class TestBulkSaveIssues:
+    """bulk 저장 결과 집계 테스트"""
+
+    def test_bulk_save_issues(self, repository, issues):
+        """id 없는 이슈를 건너뛰고 실패한 문서를 빼고 세는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.bulk.side_effect = lambda operations, refresh: bulk_response(
+            operations, failed_ids={"2"}
+        )
+
+        saved = repository.bulk_save_issues(issues, chunk_size=2)
+
+        assert saved == 2
+        assert client.bulk.call_count == 2
+        client.indices.refresh.assert_called_once_with(index="scf")
+
+    def test_async_bulk_save_issues(self, repository, issues):
+        """asyncio 저장 결과가 동기 저장과 같은지 테스트"""
+        client = MagicMock()
+        client.bulk = AsyncMock(
+            side_effect=lambda operations, refresh: bulk_response(
+                operations, failed_ids={"2"}
+            )
+        )
+
+        saved = asyncio.run(
+            repository.async_bulk_save_issues(client, issues, chunk_size=2)
+        )
+
+        assert saved == 2
+        assert client.bulk.await_count == 2
+
+
+class TestSetupIndexMapping:
+    """인덱스 생성 테스트"""
+
+    def test_already_created_by_another_shard(self, repository):
+        """다른 프로세스가 먼저 인덱스를 만들어도 성공으로 보는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.indices.exists.return_value = False
+        error = Exception("resource_already_exists_exception")
+        error.error = "resource_already_exists_exception"
+        client.indices.create.side_effect = error
+
+        assert repository.setup_index_mapping() is True
+
+    def test_existing_index_gets_new_fields(self, repository):
+        """이미 있는 인덱스에는 ISSUE_FIELDS 매핑을 put_mapping으로 더하는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.indices.exists.return_value = True
+
+        assert repository.setup_index_mapping() is True
+
+        client.indices.create.assert_not_called()
+        client.indices.put_mapping.assert_called_once_with(
+            index="scf", properties=es_mapping(ISSUE_FIELDS)["mappings"]["properties"]
+        )
+
+    def test_put_mapping_conflict(self, repository):
+        """기존 필드와 매핑이 충돌하면 실패하는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.indices.exists.return_value = True
+        client.indices.put_mapping.side_effect = Exception("illegal_argument_exception")
+
+        assert repository.setup_index_mapping() is False
+
+    def test_create_failed(self, repository):
+        """다른 이유로 인덱스를 만들지 못하면 실패하는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.indices.exists.return_value = False
+        client.indices.create.side_effect = Exception("연결 끊김")
+
+        assert repository.setup_index_mapping() is False
+
+
+class TestFingerprints:
+    """내용 지문으로 변경 없는 이슈를 건너뛰는지 테스트"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        store = FingerprintStore(tmp_path / "fingerprints.tsv")
+        return SeeClickFixRepository(connector=MagicMock(), fingerprints=store)
+
+    def docs(self, *fingerprints):
+        return [
+            {"id": str(n), "fingerprint": fingerprint}
+            for n, fingerprint in enumerate(fingerprints, start=1)
+        ]
+
+    def test_skip_unchanged(self, repository):
+        """두 번째 저장에서는 바뀐 이슈만 보내는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.bulk.side_effect = lambda operations, refresh: bulk_response(operations)
+
+        assert repository.bulk_save_issues(self.docs("a", "b", "c")) == 3
+        saved = repository.bulk_save_issues(self.docs("a", "x", "c"))
+
+        assert saved == 3
+        assert repository.skipped == 2
+        sent = client.bulk.call_args.kwargs["operations"]
+        assert [op["index"]["_id"] for op in sent[::2]] == ["2"]
+
+    def test_failed_issue_not_recorded(self, repository):
+        """저장에 실패한 이슈는 지문을 기록하지 않아 다음에 다시 보내는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.bulk.side_effect = lambda operations, refresh: bulk_response(
+            operations, failed_ids={"2"}
+        )
+
+        assert repository.bulk_save_issues(self.docs("a", "b")) == 1
+
+        assert repository.fingerprints.get("1") == "a"
+        assert repository.fingerprints.get("2") is None
+
+    def test_all_unchanged(self, repository):
+        """모두 변경이 없으면 bulk 요청 없이 건너뛴 수를 반환하는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.bulk.side_effect = lambda operations, refresh: bulk_response(operations)
+        repository.bulk_save_issues(self.docs("a", "b"))
+        client.bulk.reset_mock()
+
+        assert repository.bulk_save_issues(self.docs("a", "b")) == 2
+        client.bulk.assert_not_called()
+
+    def test_delete_index_clears_fingerprints(self, repository):
+        """인덱스를 지우면 지문도 지워 다시 색인할 수 있는지 테스트"""
+        repository.fingerprints.record(self.docs("a"))
+
+        assert repository.delete_index()
+
+        assert len(repository.fingerprints) == 0
+
+    def test_new_index_clears_fingerprints(self, repository):
+        """인덱스가 없어 새로 만들면 지문을 지우는지 테스트"""
+        client = repository.connector.get_client.return_value
+        repository.fingerprints.record(self.docs("a"))
+        client.indices.exists.return_value = True
+
+        assert repository.setup_index_mapping()
+        assert len(repository.fingerprints) == 1
+
+        client.indices.exists.return_value = False
+
+        assert repository.setup_index_mapping()
+        client.indices.create.assert_called_once()
+        assert len(repository.fingerprints) == 0
+
+
+class TestCountByGrid:
+    """격자별 집계 테스트"""
+
+    def test_count_by_grid(self, repository):
+        """geohash 키 필드에 terms 집계를 하고 결과를 격자별로 돌려주는지 테스트"""
+        client = repository.connector.get_client.return_value
+        client.search.return_value = {
+            "aggregations": {
+                "grid": {
+                    "buckets": [
+                        {"key": "9whp", "doc_count": 12},
+                        {"key": "9whn", "doc_count": 3},
+                    ]
+                }
+            }
+        }
+
+        counts = repository.count_by_grid(4, bounds=(35.2, -106.8, 34.9, -106.4))
+
+        assert counts == {"9whp": 12, "9whn": 3}
+        body = client.search.call_args.kwargs["body"]
+        assert body["size"] == 0
+        assert body["aggs"]["grid"]["terms"]["field"] == "geohash_4"
+        box = body["query"]["bool"]["filter"][0]["geo_bounding_box"]["coords"]
+        assert box["top_left"] == {"lat": 35.2, "lon": -106.8}
+
+    def test_unsupported_precision(self, repository):
+        """미리 계산하지 않은 precision이면 ValueError"""
+        with pytest.raises(ValueError):
+            repository.count_by_grid(9)
@@ -0,0 +1,108 @@
+import json
+import urllib.error
+import urllib.request
+from datetime import datetime
+from urllib.parse import urlencode
+
+import pytest
+
+from src.modules.scf_stub_server import StubSeeClickFixServer, StubServerConfig
+from src.services.extraction_benchmark import run_benchmark
+
+
+def get(server, headers=None, **params):
+    """대역 서버에 GET 요청을 보내고 (상태 코드, 헤더, 본문)을 반환한다."""
+    request = urllib.request.Request(
+        f"{server.url}?{urlencode(params)}", headers=headers or {}
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+class TestStubServer:
+    """로컬 SeeClickFix API 대역 서버 테스트"""
+
+    def test_pagination_shape(self):
+        """issues와 metadata.pagination을 페이지 단위로 돌려주는지 테스트"""
+        with StubSeeClickFixServer(StubServerConfig(total_issues=250)) as server:
+            status, _, body = get(server, page=3, per_page=100, status="Archived")
+            data = json.loads(body)
+
+        assert status == 200
+        assert [issue["id"] for issue in data["issues"]] == list(range(201, 251))
+        pagination = data["metadata"]["pagination"]
+        assert pagination["pages"] == 3
+        assert pagination["entries"] == 250
+        assert pagination["next_page"] is None
+
+    def test_filters_and_sort(self):
+        """status, updated_at_after, sort 파라미터를 적용하는지 테스트"""
+        with StubSeeClickFixServer(StubServerConfig(total_issues=200)) as server:
+            since = sorted(i["updated_at"] for i in server.issues)[149]
+            _, _, body = get(
+                server,
+                page=1,
+                per_page=100,
+                updated_at_after=since,
+                sort="updated_at",
+                sort_direction="ASC",
+            )
+            _, _, other = get(server, page=1, per_page=100, status="Open")
+
+        updated = [issue["updated_at"] for issue in json.loads(body)["issues"]]
+        assert len(updated) == 50
+        assert updated == sorted(updated, key=datetime.fromisoformat)
+        assert json.loads(other)["issues"] == []
+
+    def test_conditional_get(self):
+        """같은 ETag로 다시 요청하면 304를 돌려주는지 테스트"""
+        with StubSeeClickFixServer(StubServerConfig(total_issues=10)) as server:
+            _, headers, _ = get(server, page=1)
+            status, _, body = get(
+                server, headers={"If-None-Match": headers["ETag"]}, page=1
+            )
+
+        assert status == 304
+        assert body == b""
+        assert server.stats == {200: 1, 304: 1}
+
+    def test_rate_limit_and_errors(self):
+        """요청 제한을 넘으면 429와 Retry-After를, error_rate만큼 500을 돌려주는지 테스트"""
+        config = StubServerConfig(total_issues=10, rate_limit=1, burst=2, retry_after=3)
+        with StubSeeClickFixServer(config) as server:
+            statuses = [get(server, page=1) for _ in range(3)]
+        assert [s for s, _, _ in statuses] == [200, 200, 429]
+        assert statuses[2][1]["Retry-After"] == "3"
+
+        with StubSeeClickFixServer(StubServerConfig(error_rate=1.0)) as server:
+            assert get(server, page=1)[0] == 500
+
+    def test_invalid_config(self):
+        """잘못된 설정이면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            StubServerConfig(error_rate=1.5)
+
+
+class TestExtractionBenchmark:
+    """수집 벤치마크 하네스 테스트"""
+
+    def test_run_benchmark(self):
+        """작업자 수별로 페이지/이슈 처리량과 재시도 수를 측정하는지 테스트"""
+        results = run_benchmark([1, 4], StubServerConfig(total_issues=300))
+
+        assert [r.workers for r in results] == [1, 4]
+        for result in results:
+            assert result.pages == 3  # 이슈 300개, 페이지당 100개
+            assert result.issues == 300
+            assert result.retries == 0
+            assert result.pages_per_second > 0
+
+    def test_benchmark_crawls_whole_archive(self):
+        """50페이지가 넘는 아카이브도 잘리지 않고 모든 이슈를 수집하는지 테스트"""
+        results = run_benchmark([8], StubServerConfig(total_issues=6_000))
+
+        assert results[0].pages == 60
+        assert results[0].issues == 6_000
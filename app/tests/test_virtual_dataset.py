@@ -0,0 +1,94 @@
+import pytest
+
+import pandas as pd
+
+from src.models.dataset_schema import ColumnSpec, skewed_user_schema
+from src.services.data_generation import DatasetConfig
+from src.services.virtual_dataset import VirtualDataset
+
+
+@pytest.fixture
+def dataset():
+    """seed가 고정된 1,000건짜리 VirtualDataset."""
+    return VirtualDataset(
+        DatasetConfig(record_count=1_000, seed=21, batch_size=300, vocabulary_size=50)
+    )
+
+
+class TestVirtualDataset:
+    """VirtualDataset 테스트"""
+
+    def test_default_schema(self, dataset):
+        """스키마가 없으면 기본 사용자 컬럼으로 생성하는지 테스트"""
+        batch = dataset.range(0, 10)
+
+        assert list(batch.columns) == DatasetConfig().header
+        assert batch["age"].between(18, 80).all()
+
+    def test_range_is_random_access(self, dataset):
+        """구간을 나눠 계산해도 전체 구간과 같은 레코드가 나오는지 테스트"""
+        whole = dataset.range(100, 400)
+        pieces = pd.concat([dataset.range(100, 250), dataset.range(250, 400)])
+
+        assert whole.equals(pieces)
+        assert list(whole.index) == list(range(100, 400))
+
+    def test_record(self, dataset):
+        """단일 레코드가 구간 결과의 같은 행과 일치하는지 테스트"""
+        assert dataset.record(777) == dataset.range(770, 780).loc[777].to_dict()
+        assert dataset[-1] == dataset.record(999)
+        assert dataset[5:8].equals(dataset.range(5, 8))
+
+    def test_same_seed_in_another_worker(self, dataset):
+        """같은 설정으로 만든 다른 인스턴스가 같은 레코드를 계산하는지 테스트"""
+        other = VirtualDataset(dataset.config)
+
+        assert other.range(500, 520).equals(dataset.range(500, 520))
+
+    def test_different_seed(self, dataset):
+        """seed가 다르면 다른 레코드가 나오는지 테스트"""
+        config = DatasetConfig(record_count=1_000, seed=22, vocabulary_size=50)
+
+        assert not VirtualDataset(config).range(0, 20).equals(dataset.range(0, 20))
+
+    def test_out_of_range(self, dataset):
+        """데이터셋 범위를 벗어나면 IndexError가 발생하는지 테스트"""
+        with pytest.raises(IndexError):
+            dataset.range(990, 1_001)
+        with pytest.raises(IndexError):
+            dataset.record(1_000)
+
+    def test_iter_batches(self, dataset):
+        """iter_batches가 batch_size 단위로 구간을 나누는지 테스트"""
+        sizes = [len(batch) for batch in dataset.iter_batches()]
+        tail = list(dataset.iter_batches(start=950, batch_size=20))
+
+        assert sizes == [300, 300, 300, 100]
+        assert [batch.index[0] for batch in tail] == [950, 970, 990]
+
+    def test_shards_cover_dataset(self, dataset):
+        """shard 구간을 모으면 전체 데이터셋과 같은지 테스트"""
+        ranges = [dataset.shard_range(i, 3) for i in range(3)]
+        shards = pd.concat([dataset.range(start, stop) for start, stop in ranges])
+
+        assert ranges == [(0, 334), (334, 667), (667, 1_000)]
+        assert shards.equals(dataset.range(0, 1_000))
+
+    def test_uniforms(self, dataset):
+        """카운터 기반 난수가 [0, 1) 범위에 고르게 분포하는지 테스트"""
+        uniforms = dataset.uniforms(0, 1_000)
+
+        assert uniforms.shape == (dataset.schema.draws, 1_000)
+        assert ((uniforms >= 0) & (uniforms < 1)).all()
+        assert uniforms.mean() == pytest.approx(0.5, abs=0.01)
+
+    def test_custom_schema(self):
+        """사용자 스키마(Zipf, 결측값)로 계산하는지 테스트"""
+        schema = skewed_user_schema() + [ColumnSpec("tag", null_rate=0.5)]
+        dataset = VirtualDataset(
+            DatasetConfig(record_count=2_000, seed=3, schema=schema)
+        )
+        batch = dataset.range(0, 2_000)
+
+        assert batch["city"].value_counts().iloc[0] > 2_000 / 10
+        assert batch["tag"].isna().mean() == pytest.approx(0.5, abs=0.05)
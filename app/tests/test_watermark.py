@@ -0,0 +1,55 @@
+from src.utils.watermark import WatermarkStore, WatermarkTracker, rewind_timestamp
+
+
+class TestWatermarkTracker:
+    """WatermarkTracker 테스트"""
+
+    def test_latest_timestamp(self):
+        """updated_at(없으면 created_at) 중 가장 늦은 시각을 고르는지 테스트"""
+        tracker = WatermarkTracker()
+        tracker.observe(
+            [
+                {"updated_at": "2024-01-01T10:00:00-07:00"},
+                {"created_at": "2024-01-01T18:30:00+00:00"},
+                {"updated_at": "", "created_at": ""},
+            ]
+        )
+        tracker.observe([])
+
+        # 18:30Z는 11:30-07:00보다 늦다
+        assert tracker.latest == "2024-01-01T18:30:00+00:00"
+        assert tracker.pages == 2
+
+
+def test_rewind_timestamp():
+    """시간대를 유지한 채 시각을 앞당기고, 해석할 수 없는 값은 그대로 두는지 테스트"""
+    assert (
+        rewind_timestamp("2024-01-01T00:09:00-07:00", 1) == "2024-01-01T00:08:59-07:00"
+    )
+    assert rewind_timestamp("2024-01-01T00:00:00Z", 1) == "2023-12-31T23:59:59+00:00"
+    assert rewind_timestamp("not a time", 1) == "not a time"
+
+
+class TestWatermarkStore:
+    """WatermarkStore 테스트"""
+
+    def test_advance_only_forward(self, tmp_path):
+        """더 늦은 시각일 때만 워터마크를 저장하는지 테스트"""
+        store = WatermarkStore(tmp_path / "watermarks.json")
+
+        assert store.get("place", "open") is None
+        assert store.advance("place", "open", "2024-01-02T00:00:00Z")
+        assert not store.advance("place", "open", "2024-01-01T00:00:00Z")
+        assert not store.advance("place", "open", None)
+        assert store.advance("place", "closed", "2023-01-01T00:00:00Z")
+
+        reloaded = WatermarkStore(tmp_path / "watermarks.json")
+        assert reloaded.get("place", "open") == "2024-01-02T00:00:00Z"
+        assert reloaded.get("place", "closed") == "2023-01-01T00:00:00Z"
+
+    def test_corrupted_file(self, tmp_path):
+        """손상된 파일은 워터마크가 없는 것으로 보는지 테스트"""
+        path = tmp_path / "watermarks.json"
+        path.write_text("{not json")
+
+        assert WatermarkStore(path).get("place", "open") is None